@@ -1,22 +1,97 @@
 import requests
+import functools
 import logging
+import os
+import socket
+import threading
+import time
 import pytest
+from urllib.parse import urlsplit
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
-from pytest_html import extras
+from request_metrics import TIMED_POOL_CLASSES, RequestMetrics, RunMetrics, begin_request
+from circuit_breaker import CircuitBreaker
+from json_stream import decode, iter_json_array
+from singleflight import SingleFlight
 import responses
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def log_request_response(response):
-    """Logs request and response details."""
+def log_request_response(response, max_body_chars=2000):
+    """Logs request and response details, truncating large bodies and never reading a streamed one."""
     logging.info(f"Request URL: {response.request.url}")
     logging.info(f"Request Method: {response.request.method}")
     logging.info(f"Request Headers: {response.request.headers}")
     logging.info(f"Request Body: {getattr(response.request, 'body', 'No Body')}")
     logging.info(f"Response Status: {response.status_code}")
-    logging.info(f"Response Body: {response.text}")
+    if response.raw is not None and not response._content_consumed:
+        logging.info("Response Body: <streamed, not logged>")
+        return
+    body = response.text
+    if len(body) > max_body_chars:
+        body = f"{body[:max_body_chars]}... [{len(body) - max_body_chars} more characters]"
+    logging.info(f"Response Body: {body}")
+
+# Process-wide sessions keyed by pool settings, so separate clients share warm connections
+_SESSION_REGISTRY = {}
+_SESSION_REGISTRY_LOCK = threading.Lock()
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that enables TCP keep-alive on pooled sockets so idle connections survive between tests,
+    and uses connection classes that report connect/TLS timings to request_metrics.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = TIMED_POOL_CLASSES
+
+
+def build_session(pool_connections=10, pool_maxsize=10, pool_block=False):
+    """
+    Creates a session with the retry strategy and a keep-alive adapter mounted for http:// and https://.
+
+    Args:
+        pool_connections (int): Number of per-host pools to cache.
+        pool_maxsize (int): Maximum connections kept per host pool.
+        pool_block (bool): Block when the pool is exhausted instead of opening throwaway connections.
+
+    Returns:
+        requests.Session: Configured session.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504], respect_retry_after_header=True)
+    adapter = KeepAliveHTTPAdapter(max_retries=retries, pool_connections=pool_connections,
+                                   pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_shared_session(pool_connections=10, pool_maxsize=10, pool_block=False):
+    """Returns the process-wide session for the given pool settings, creating it on first use."""
+    key = (pool_connections, pool_maxsize, pool_block)
+    with _SESSION_REGISTRY_LOCK:
+        session = _SESSION_REGISTRY.get(key)
+        if session is None:
+            session = _SESSION_REGISTRY[key] = build_session(pool_connections, pool_maxsize, pool_block)
+        return session
+
+
+def close_shared_sessions():
+    """Closes and forgets every session in the process-wide registry."""
+    with _SESSION_REGISTRY_LOCK:
+        for session in _SESSION_REGISTRY.values():
+            session.close()
+        _SESSION_REGISTRY.clear()
+
 
 class APIAutomation:
     """
@@ -25,8 +100,16 @@ class APIAutomation:
     implements a retry strategy for robustness, and logs request and response details.
     
     Attributes:
-        BASE_URL (str): Base URL for the API endpoint.
+        BASE_URL (str): Base URL for the API endpoint. Overridden per instance by base_url or API_BASE_URL.
         session (requests.Session): Session object to handle requests with retries.
+        shared (bool): Whether the session comes from the process-wide registry.
+        cache (ResponseCache): Optional cache for GET responses; writes invalidate affected entries.
+        metrics (RunMetrics): Per-endpoint aggregate of RequestMetrics for every request made by this client.
+        hooks (list): Callables invoked as hook(request_metrics, response) after every request.
+        rate_limiter (RateLimiter): Optional per-host/per-endpoint token buckets honoring Retry-After.
+        concurrency (AdaptiveConcurrency): Optional AIMD limit on requests in flight across threads.
+        circuit_breaker (CircuitBreaker): Per-host breaker that fails fast once a host keeps failing.
+        single_flight (SingleFlight): Coalesces concurrent identical GETs into one exchange, or None.
     
     Methods:
         get_posts(post_id): Fetches a specific post by ID.
@@ -35,15 +118,53 @@ class APIAutomation:
         update_post(post_id, title, body, user_id): Updates an existing post.
         patch_post(post_id, title, body, user_id): Partially updates a post.
         delete_post(post_id): Deletes a post by ID.
+        get_posts_many(post_ids, max_workers, ordered): Fetches many posts concurrently.
+        get_comments_many(post_ids, max_workers, ordered): Fetches comments for many posts concurrently.
+        iter_post_comments(post_id, chunk_size): Streams a post's comments one at a time.
+        iter_posts(page_size, prefetch): Iterates over all posts page by page, prefetching ahead.
+        iter_comments(post_ids, prefetch): Iterates over the comments of many posts, prefetching ahead.
+        add_hook(hook): Registers a callable receiving RequestMetrics and the response.
         _make_request(method, url, **kwargs): Handles API requests with retry strategy.
     """
     BASE_URL = "https://jsonplaceholder.typicode.com"
     
-    def __init__(self):
-        """Initializes APIAutomation with retry logic and session handling."""
-        self.session = requests.Session()
-        retries = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, shared=True, cache=None, base_url=None,
+                 metrics=None, rate_limiter=None, concurrency=None, circuit_breaker=None, coalesce_gets=True):
+        """
+        Initializes APIAutomation with retry logic and session handling.
+
+        Args:
+            pool_connections (int): Number of per-host pools to cache.
+            pool_maxsize (int): Maximum connections kept per host pool.
+            pool_block (bool): Block when the pool is exhausted instead of opening throwaway connections.
+            shared (bool): Reuse the process-wide session for these pool settings instead of a private one.
+            cache (ResponseCache, optional): Opt-in cache for GET responses.
+            base_url (str, optional): API root to target. Defaults to the API_BASE_URL environment
+                variable, then to BASE_URL.
+            metrics (RunMetrics, optional): Aggregate to record into, e.g. one shared across clients.
+            rate_limiter (RateLimiter, optional): Client-side rate limit applied before each request.
+            concurrency (AdaptiveConcurrency, optional): Adaptive in-flight limit, useful for bulk runs.
+            circuit_breaker (CircuitBreaker, optional): Breaker to use, e.g. one shared across clients.
+                Defaults to a new CircuitBreaker with default thresholds.
+            coalesce_gets (bool or SingleFlight): Share one in-flight exchange between concurrent identical
+                GETs. Pass a SingleFlight instance to coalesce across clients, or False to disable.
+        """
+        if isinstance(coalesce_gets, SingleFlight):
+            self.single_flight = coalesce_gets
+        else:
+            self.single_flight = SingleFlight() if coalesce_gets else None
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        self.hooks = [self.metrics]
+        self.BASE_URL = (base_url or os.environ.get("API_BASE_URL") or self.BASE_URL).rstrip("/")
+        self.shared = shared
+        self.cache = cache
+        if shared:
+            self.session = get_shared_session(pool_connections, pool_maxsize, pool_block)
+        else:
+            self.session = build_session(pool_connections, pool_maxsize, pool_block)
     
     def get_posts(self, post_id):
         """Fetches a post by ID."""
@@ -55,34 +176,274 @@ class APIAutomation:
         url = f"{self.BASE_URL}/posts/{post_id}/comments"
         return self._make_request("GET", url)
     
-    def create_post(self, title, body, user_id):
-        """Creates a new post."""
+    def iter_post_comments(self, post_id, chunk_size=65536):
+        """Streams a post's comments, decoding them one at a time with bounded memory."""
+        url = f"{self.BASE_URL}/posts/{post_id}/comments"
+        return self._iter_json_array(url, chunk_size)
+
+    def _iter_json_array(self, url, chunk_size=65536):
+        """
+        Streams a JSON array endpoint with `stream=True` and yields its elements as they arrive.
+
+        Yields nothing when the request does not return 200.
+        """
+        response = self._make_request("GET", url, stream=True)
+        try:
+            if response.status_code != 200:
+                logging.error(f"Streaming GET {url} returned {response.status_code}")
+                return
+            yield from iter_json_array(response.iter_content(chunk_size), response.encoding or "utf-8")
+        finally:
+            response.close()
+
+    def iter_posts(self, page_size=20, prefetch=1):
+        """
+        Iterates over every post using `_start`/`_limit` paging.
+
+        Args:
+            page_size (int): Posts requested per page.
+            prefetch (int): Pages fetched in the background ahead of the one being consumed (0 disables).
+
+        Yields:
+            dict: Posts in server order.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        url = f"{self.BASE_URL}/posts"
+        pages = (functools.partial(self._make_request, "GET", f"{url}?_start={start}&_limit={page_size}")
+                 for start in itertools.count(0, page_size))
+        for response in self._prefetched(pages, prefetch):
+            if response.status_code != 200:
+                logging.error(f"Paging {url} stopped with status {response.status_code}")
+                return
+            page = decode(response)
+            yield from page
+            if len(page) < page_size:
+                return
+
+    def iter_comments(self, post_ids, prefetch=1):
+        """
+        Iterates over the comments of many posts, fetching the next posts' comments in the background.
+
+        Args:
+            post_ids: Iterable of post IDs.
+            prefetch (int): Posts fetched ahead of the one being consumed (0 disables).
+
+        Yields:
+            dict: Comments, grouped by post in input order.
+        """
+        calls = (functools.partial(self.get_post_comments, post_id) for post_id in post_ids)
+        for response in self._prefetched(calls, prefetch):
+            if response.status_code == 200:
+                yield from decode(response)
+
+    def _prefetched(self, calls, depth):
+        """Yields the results of zero-argument calls in order, keeping up to depth of them running ahead."""
+        if depth < 1:
+            for call in calls:
+                yield call()
+            return
+        self._ensure_pool_size(depth + 1)
+        with ThreadPoolExecutor(max_workers=depth, thread_name_prefix="api-prefetch") as executor:
+            pending = deque(executor.submit(call) for call in itertools.islice(calls, depth))
+            while pending:
+                future = pending.popleft()
+                next_call = next(calls, None)
+                if next_call is not None:
+                    pending.append(executor.submit(next_call))
+                yield future.result()
+
+    def create_post(self, title, body, user_id, idempotency_key=None):
+        """Creates a new post. An idempotency_key is sent as the Idempotency-Key header so retries are safe."""
         url = f"{self.BASE_URL}/posts"
         payload = {"title": title, "body": body, "userId": user_id}
-        return self._make_request("POST", url, json=payload)
+        return self._make_request("POST", url, json=payload, **self._idempotency(idempotency_key))
     
-    def update_post(self, post_id, title, body, user_id):
+    def update_post(self, post_id, title, body, user_id, idempotency_key=None):
         """Updates existing post."""
         url = f"{self.BASE_URL}/posts/{post_id}"
         payload = {"title": title, "body": body, "userId": user_id}
-        return self._make_request("PUT", url, json=payload)
+        return self._make_request("PUT", url, json=payload, **self._idempotency(idempotency_key))
 
     
-    def patch_post(self, post_id, title=None, body=None, user_id=None):
+    def patch_post(self, post_id, title=None, body=None, user_id=None, idempotency_key=None):
         """Updates existing post."""
         url = f"{self.BASE_URL}/posts/{post_id}"
         payload = {key: value for key, value in {"title": title, "body": body, "userId": user_id}.items() if value is not None}
-        return self._make_request("PATCH", url, json=payload)
+        return self._make_request("PATCH", url, json=payload, **self._idempotency(idempotency_key))
     
     def delete_post(self, post_id):
         """Deletes existing post."""
         url = f"{self.BASE_URL}/posts/{post_id}"
         return self._make_request("DELETE", url)
     
+    def get_posts_many(self, post_ids, max_workers=10, ordered=True):
+        """
+        Fetches many posts over a shared connection pool using a thread pool.
+
+        Args:
+            post_ids: Iterable of post IDs.
+            max_workers (int): Number of concurrent requests.
+            ordered (bool): Yield in input order if True, otherwise in completion order.
+
+        Yields:
+            tuple: (post_id, response) pairs as requests finish.
+        """
+        return self._fetch_many(self.get_posts, post_ids, max_workers, ordered)
+
+    def get_comments_many(self, post_ids, max_workers=10, ordered=True):
+        """Fetches comments for many posts concurrently. See get_posts_many for arguments."""
+        return self._fetch_many(self.get_post_comments, post_ids, max_workers, ordered)
+
+    def _fetch_many(self, func, post_ids, max_workers, ordered):
+        """Runs func over post_ids with at most 2 * max_workers requests queued at any time."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._ensure_pool_size(max_workers)
+        window = max_workers * 2
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api-batch") as executor:
+            if ordered:
+                pending = deque()
+                for post_id in post_ids:
+                    pending.append((post_id, executor.submit(func, post_id)))
+                    if len(pending) >= window:
+                        post_id, future = pending.popleft()
+                        yield post_id, future.result()
+                while pending:
+                    post_id, future = pending.popleft()
+                    yield post_id, future.result()
+            else:
+                pending = {}
+                for post_id in post_ids:
+                    pending[executor.submit(func, post_id)] = post_id
+                    if len(pending) >= window:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield pending.pop(future), future.result()
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+
+    @staticmethod
+    def _idempotency(idempotency_key):
+        """Returns request kwargs carrying the Idempotency-Key header, if a key was given."""
+        return {"headers": {"Idempotency-Key": idempotency_key}} if idempotency_key else {}
+
+    def _ensure_pool_size(self, size):
+        """
+        Makes sure the session's pool holds at least `size` connections so concurrent workers reuse them.
+
+        A shared session is never resized, since other clients use it too: the client switches to the
+        registry session for the larger pool instead. A private session gets a larger adapter mounted,
+        and the adapter it replaces is closed.
+        """
+        adapter = self.session.get_adapter(self.BASE_URL)
+        adapter = getattr(adapter, "adapter", adapter)  # unwrap transport wrappers such as CassetteAdapter
+        if getattr(adapter, "_pool_maxsize", 0) >= size:
+            return
+        if self.shared:
+            self.session = get_shared_session(adapter._pool_connections, size, adapter._pool_block)
+            return
+        resized = KeepAliveHTTPAdapter(max_retries=adapter.max_retries, pool_connections=adapter._pool_connections,
+                                       pool_maxsize=size, pool_block=adapter._pool_block)
+        replaced = set()
+        for prefix in ("http://", "https://"):
+            mounted = self.session.get_adapter(prefix)
+            if hasattr(mounted, "adapter"):
+                replaced.add(mounted.adapter)
+                mounted.adapter = resized
+            else:
+                replaced.add(mounted)
+                self.session.mount(prefix, resized)
+        for old in replaced:
+            old.close()
+
+    def add_hook(self, hook):
+        """
+        Registers a request hook.
+
+        Args:
+            hook: Callable taking (RequestMetrics, requests.Response), called after every request.
+                For example `api.add_hook(lambda metrics, response: log_request_response(response))`.
+        """
+        self.hooks.append(hook)
+
     def _make_request(self, method, url, **kwargs):
-        """Handles HTTP requests with logging and error handling."""
+        """Handles HTTP requests, sharing one exchange between concurrent identical GETs."""
+        key = self._coalesce_key(url, kwargs) if method == "GET" and self.single_flight is not None else None
+        if key is None or kwargs.get("stream"):  # a streamed body can only be read by one caller
+            return self._perform(method, url, **kwargs)
+        start = time.perf_counter()
+        response, leader = self.single_flight.do(key, lambda: self._perform(method, url, **kwargs))
+        if not leader:
+            self._run_hooks(RequestMetrics(method, url, response, time.perf_counter() - start,
+                                           self.circuit_breaker.state(url), coalesced=True), response)
+        return response
+
+    @staticmethod
+    def _coalesce_key(url, kwargs):
+        """
+        Returns a key covering the URL and every request argument (headers, params, timeout, auth, ...),
+        or None when an argument cannot be compared by value, in which case the GET is not coalesced.
+        """
+        def freeze(value):
+            if isinstance(value, dict):
+                return tuple(sorted((str(name), freeze(item)) for name, item in value.items()))
+            if isinstance(value, (list, tuple)):
+                return tuple(freeze(item) for item in value)
+            hash(value)  # raises TypeError for unhashable objects, e.g. auth handlers that define __eq__
+            return value
+
         try:
-            response = self.session.request(method, url, **kwargs)
+            return url, freeze(kwargs)
+        except TypeError:
+            return None
+
+    def _perform(self, method, url, **kwargs):
+        """Serves one request, from the cache or the network, and reports its RequestMetrics."""
+        begin_request()
+        start = time.perf_counter()
+        response = self._dispatch(method, url, **kwargs)
+        elapsed = time.perf_counter() - start
+        self._run_hooks(RequestMetrics(method, url, response, elapsed, self.circuit_breaker.state(url)), response)
+        return response
+
+    def _run_hooks(self, metrics, response):
+        """Passes RequestMetrics to every hook; a failing hook is logged and never breaks the request."""
+        for hook in self.hooks:
+            try:
+                hook(metrics, response)
+            except Exception as hook_err:
+                logging.error(f"Request hook {hook!r} failed: {hook_err}")
+
+    def _dispatch(self, method, url, **kwargs):
+        """Serves GETs through the cache when one is configured and invalidates it on writes."""
+        if self.cache is None or kwargs.get("stream"):
+            return self._send(method, url, **kwargs)
+        if method == "GET":
+            extra_headers = kwargs.pop("headers", None) or {}
+            key = self.cache.cache_key(url, kwargs.get("params"), extra_headers)
+            return self.cache.fetch(self.cache.cache_key(url, kwargs.get("params")),
+                                    lambda headers: self._send(method, url, headers={**extra_headers, **headers}, **kwargs),
+                                    key=key)
+        self.cache.invalidate(url)
+        try:
+            return self._send(method, url, **kwargs)
+        finally:
+            self.cache.invalidate(url)  # drops anything a concurrent GET cached while the write was in flight
+
+    def _send(self, method, url, **kwargs):
+        """Handles HTTP requests with logging, error handling and per-host circuit breaking."""
+        if not self.circuit_breaker.allow(url):
+            logging.error(f"Circuit open for {urlsplit(url).netloc}, failing fast on {method} request")
+            return self._failure_response(short_circuited=True)
+        try:
+            response = self._transmit(method, url, **kwargs)
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure(url)
+            else:
+                self.circuit_breaker.record_success(url)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as http_err:
@@ -90,14 +451,48 @@ class APIAutomation:
             return response  # Return response even on 404 or 500 errors
         except requests.exceptions.RequestException as req_err:
             logging.error(f"Request error during {method} request: {req_err}")
-            mock_response = requests.Response()
-            mock_response.status_code = 500  # Simulate server failure response
-            return mock_response  # Return mock response instead of None
+            self.circuit_breaker.record_failure(url)
+            return self._failure_response()
+        except BaseException:
+            self.circuit_breaker.release(url)  # no outcome to record; free the probe slot if this was one
+            raise
+
+    def _transmit(self, method, url, **kwargs):
+        """
+        Sends one request over the network under the rate limiter and concurrency limit.
+
+        Only real exchanges pass through here: cache hits and calls rejected by the circuit
+        breaker spend no rate-limit token and give AdaptiveConcurrency no latency sample.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        if self.concurrency is None:
+            response = self.session.request(method, url, **kwargs)
+        else:
+            with self.concurrency.slot():
+                start = time.perf_counter()
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except requests.exceptions.RequestException:
+                    self.concurrency.record(time.perf_counter() - start, 500)  # back off on transport errors
+                    raise
+                elapsed = time.perf_counter() - start
+            self.concurrency.record(elapsed, response.status_code)
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(url, response)
+        return response
+
+    @staticmethod
+    def _failure_response(short_circuited=False):
+        """Builds the synthetic 500 response returned when no real response is available."""
+        mock_response = requests.Response()
+        mock_response.status_code = 500  # Simulate server failure response
+        mock_response.short_circuited = short_circuited
+        return mock_response  # Return mock response instead of None
 
 
 @pytest.mark.parametrize("post_id", [1, 2, 3, -1, "abc", 9999])
-def test_get_posts(post_id):
-    api = APIAutomation()
+def test_get_posts(api, post_id):
     response = api.get_posts(post_id)
 
     assert response is not None, f"Expected a response for post_id={post_id}, but got None"
@@ -113,8 +508,7 @@ def test_get_posts(post_id):
 
 
 @pytest.mark.parametrize("post_id", [1, 2, 3, -1, 9999])
-def test_get_post_comments(post_id):
-    api = APIAutomation()
+def test_get_post_comments(api, post_id):
     response = api.get_post_comments(post_id)
     
     assert response is not None, "Response should not be None"  # FIXED: Added None check
@@ -129,8 +523,7 @@ def test_get_post_comments(post_id):
     ("", "No title", 3),
     ("Valid Title", "", 4)
 ])
-def test_create_post(title, body, user_id):
-    api = APIAutomation()
+def test_create_post(api, title, body, user_id):
     response = api.create_post(title, body, user_id)
     
     assert response is not None and response.status_code == 201
@@ -144,8 +537,7 @@ def test_create_post(title, body, user_id):
     (1, "Updated Title", "Updated Body", 1),
     (9999, "Non-existent", "Body", 2)
 ])
-def test_update_post(post_id, title, body, user_id):
-    api = APIAutomation()
+def test_update_post(api, post_id, title, body, user_id):
     response = api.update_post(post_id, title, body, user_id)
 
     assert response is not None, f"Expected a response for post_id={post_id}, but got None"
@@ -162,8 +554,7 @@ def test_update_post(post_id, title, body, user_id):
         logging.warning(f"Received 500 response for post_id={post_id}")
 
 @pytest.mark.parametrize("post_id", [1, 9999])
-def test_delete_post(post_id):
-    api = APIAutomation()
+def test_delete_post(api, post_id):
     response = api.delete_post(post_id)
 
     assert response is not None, "Response should not be None"
@@ -176,16 +567,9 @@ def test_mock_get_posts():
         json={"userId": 1, "id": 1, "title": "Mock Title", "body": "Mock Body"}, 
         status=200
     )
-    api = APIAutomation()
+    api = APIAutomation(shared=False)  # private session: stays mocked even when the fixture replays a cassette
     response = api.get_posts(1)
 
     assert response is not None, "Mocked response should not be None"
     assert response.status_code == 200
     assert response.json()["title"] == "Mock Title"
-
-# Pytest HTML reporting hook
-def pytest_html_report_title(report):
-    report.title = "API Automation Test Report"
-
-def pytest_html_results_summary(prefix):
-    prefix.extend([extras.html("<p>API Automation Report</p>")])
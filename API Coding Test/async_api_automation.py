@@ -0,0 +1,107 @@
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from APIAutomation import APIAutomation
+
+
+class AsyncAPIAutomation:
+    """
+    AsyncAPIAutomation exposes the APIAutomation CRUD surface as coroutines so that
+    large sweeps (e.g. thousands of post IDs) can be fanned out concurrently.
+
+    Requests are executed on a thread pool through the wrapped APIAutomation client,
+    so retries, error handling and response objects are identical to the sync client.
+    A semaphore bounds the number of in-flight requests.
+
+    Attributes:
+        api (APIAutomation): Underlying synchronous client.
+        max_concurrency (int): Maximum number of requests in flight at once.
+
+    Methods:
+        get_posts(post_id): Fetches a specific post by ID.
+        get_post_comments(post_id): Retrieves comments associated with a post.
+        create_post(title, body, user_id): Creates a new post with the given details.
+        update_post(post_id, title, body, user_id): Updates an existing post.
+        patch_post(post_id, title, body, user_id): Partially updates a post.
+        delete_post(post_id): Deletes a post by ID.
+        gather_many(func, items): Runs func over items concurrently, preserving input order.
+    """
+
+    def __init__(self, max_concurrency=20, api=None):
+        """Initializes the async client with a bounded worker pool sized to max_concurrency."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.api = api or APIAutomation()
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="async-api")
+        self._semaphores = weakref.WeakKeyDictionary()
+
+        # Size the connection pool to the concurrency so connections are reused, not discarded
+        self.api._ensure_pool_size(max_concurrency)
+
+    async def get_posts(self, post_id):
+        """Fetches a post by ID."""
+        return await self._make_request(self.api.get_posts, post_id)
+
+    async def get_post_comments(self, post_id):
+        """Fetches a post comments by ID."""
+        return await self._make_request(self.api.get_post_comments, post_id)
+
+    async def create_post(self, title, body, user_id, idempotency_key=None):
+        """Creates a new post."""
+        return await self._make_request(self.api.create_post, title, body, user_id, idempotency_key=idempotency_key)
+
+    async def update_post(self, post_id, title, body, user_id, idempotency_key=None):
+        """Updates existing post."""
+        return await self._make_request(self.api.update_post, post_id, title, body, user_id,
+                                        idempotency_key=idempotency_key)
+
+    async def patch_post(self, post_id, title=None, body=None, user_id=None, idempotency_key=None):
+        """Partially updates existing post."""
+        return await self._make_request(self.api.patch_post, post_id, title=title, body=body, user_id=user_id,
+                                        idempotency_key=idempotency_key)
+
+    async def delete_post(self, post_id):
+        """Deletes existing post."""
+        return await self._make_request(self.api.delete_post, post_id)
+
+    async def gather_many(self, func, items, return_exceptions=False):
+        """
+        Runs a coroutine method over many inputs concurrently.
+
+        Args:
+            func: Coroutine function, e.g. `client.get_posts`.
+            items: Iterable of arguments. Tuples are unpacked as positional arguments.
+            return_exceptions (bool): Passed through to asyncio.gather.
+
+        Returns:
+            list: Results in the same order as items.
+        """
+        calls = [func(*item) if isinstance(item, tuple) else func(item) for item in items]
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    def close(self):
+        """Shuts down the worker pool and closes the underlying session unless it is shared."""
+        self._executor.shutdown(wait=True)
+        if not self.api.shared:
+            self.api.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def _make_request(self, func, *args, **kwargs):
+        """Runs a sync client call on the worker pool, bounded by the concurrency semaphore."""
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _get_semaphore(self, loop):
+        """Returns the semaphore bound to the running loop (Python 3.8 binds semaphores on creation)."""
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
@@ -0,0 +1,259 @@
+import argparse
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from APIAutomation import APIAutomation
+
+_DONE = object()  # end-of-input marker passed through the work queue
+
+
+class InvalidLine:
+    """Stands in for a JSON-lines entry that could not be parsed, so the writer reports it and keeps going."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def iter_jsonl(path):
+    """Lazily yields one payload per non-empty line of a JSON-lines file, or an InvalidLine for a malformed one."""
+    with open(path, "r", encoding="utf-8") as file:
+        for number, line in enumerate(file, 1):
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as error:
+                    yield InvalidLine(f"Invalid JSON on line {number}: {error}")
+
+
+def idempotency_key():
+    """Returns a new key for one item; identical payloads in a stream must not share a key."""
+    return uuid.uuid4().hex
+
+
+class BulkResult:
+    """
+    Outcome of one bulk item.
+
+    Attributes:
+        index (int): Position of the payload in the input stream.
+        payload (dict): The submitted payload.
+        idempotency_key (str): Key sent with every attempt for this item.
+        status_code (int): Final HTTP status, or None if the item never produced a response.
+        data: Decoded response body for successful writes.
+        error (str): Failure description, or None on success.
+        attempts (int): Requests made for this item.
+    """
+
+    def __init__(self, index, payload, idempotency_key):
+        self.index = index
+        self.payload = payload
+        self.idempotency_key = idempotency_key
+        self.status_code = None
+        self.data = None
+        self.error = None
+        self.attempts = 0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f"BulkResult(index={self.index}, status_code={self.status_code}, error={self.error!r})"
+
+
+class BulkWriter:
+    """
+    BulkWriter pushes a stream of payloads through create_post/update_post/patch_post concurrently.
+
+    Payloads are pulled lazily from the input iterable into a bounded queue that feeds
+    `workers` threads, and results flow back through a second bounded queue. When the
+    caller stops consuming results, workers block, the feeder blocks, and no more input
+    is read (backpressure), so arbitrarily large JSONL files are processed in constant memory.
+
+    Each item gets its own idempotency key (taken from an "idempotency_key" field in the payload
+    or generated) that is sent on every attempt, so items that fail with a transport error,
+    429 or 5xx can be retried without creating duplicates. Items are only retried here when the
+    client's transport does not already retry that method, so attempts never multiply.
+
+    Attributes:
+        api (APIAutomation): Client used for the writes.
+        operation (str): "create", "update" or "patch".
+        workers (int): Concurrent writer threads.
+        queue_size (int): Capacity of the input and result queues.
+        max_attempts (int): Attempts per item before it is reported as failed.
+    """
+    # operation -> (client method, HTTP method, payload -> positional arguments)
+    OPERATIONS = {
+        "create": ("create_post", "POST", lambda p: (p["title"], p["body"], p["userId"])),
+        "update": ("update_post", "PUT", lambda p: (p["id"], p["title"], p["body"], p["userId"])),
+        "patch": ("patch_post", "PATCH", lambda p: (p["id"], p.get("title"), p.get("body"), p.get("userId"))),
+    }
+    SUCCESS = {"create": (201,), "update": (200,), "patch": (200,)}
+    RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, api=None, operation="create", workers=None, queue_size=None, max_attempts=3, retry_backoff=0.5):
+        if operation not in self.OPERATIONS:
+            raise ValueError(f"Unknown operation '{operation}', expected one of {sorted(self.OPERATIONS)}")
+        self.api = api or APIAutomation()
+        self.operation = operation
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.queue_size = queue_size or self.workers * 4
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+
+    def write(self, payloads):
+        """
+        Writes every payload and yields a BulkResult per item in completion order.
+
+        If the payload iterable itself raises, the items already read are still written and
+        reported before the error is re-raised.
+
+        Args:
+            payloads: Iterable of payload dicts, e.g. iter_jsonl("seed.jsonl").
+
+        Yields:
+            BulkResult: One per payload.
+        """
+        self.api._ensure_pool_size(self.workers)
+        work = queue.Queue(maxsize=self.queue_size)
+        results = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def feed():
+            try:
+                for index, payload in enumerate(payloads):
+                    if not self._put(work, (index, payload), stop):
+                        return
+            except Exception as error:  # a malformed input stream is reported, not swallowed
+                logging.error(f"Bulk input failed: {error}")
+                self._put(results, error, stop)
+            finally:
+                for _ in range(self.workers):
+                    self._put(work, _DONE, stop)
+
+        def work_loop():
+            try:
+                while not stop.is_set():
+                    try:
+                        item = work.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if item is _DONE:
+                        break
+                    if not self._put(results, self._write_one(*item), stop):
+                        return
+            finally:
+                self._put(results, _DONE, stop)  # write() counts these, so a worker must always post one
+
+        threads = [threading.Thread(target=feed, name="bulk-feed", daemon=True)]
+        threads += [threading.Thread(target=work_loop, name=f"bulk-writer-{n}", daemon=True) for n in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        input_error = None
+        try:
+            while finished < self.workers:
+                result = results.get()
+                if result is _DONE:
+                    finished += 1
+                elif isinstance(result, Exception):
+                    input_error = result  # raised once the items already read have been reported
+                else:
+                    yield result
+            if input_error is not None:
+                raise input_error
+        finally:
+            stop.set()  # unblocks producers if the caller stopped early
+            for thread in threads:
+                thread.join()
+
+    def write_all(self, payloads):
+        """Writes every payload and returns (results sorted by input index, number of failures)."""
+        results = sorted(self.write(payloads), key=lambda result: result.index)
+        return results, sum(not result.ok for result in results)
+
+    def _write_one(self, index, payload):
+        """Writes one payload; any error becomes a failed BulkResult instead of killing the worker."""
+        if isinstance(payload, InvalidLine):
+            result = BulkResult(index, None, None)
+            result.error = payload.error
+            return result
+        if not isinstance(payload, dict):
+            result = BulkResult(index, payload, None)
+            result.error = f"Payload is not a JSON object: {type(payload).__name__}"
+            return result
+        payload = dict(payload)
+        result = BulkResult(index, payload, payload.pop("idempotency_key", None) or idempotency_key())
+        try:
+            self._attempt(result)
+        except Exception as error:
+            result.error = f"{type(error).__name__}: {error}"
+        return result
+
+    def _attempt(self, result):
+        """Sends the item, retrying retryable failures with its idempotency key unless the transport already does."""
+        method_name, http_method, arguments = self.OPERATIONS[self.operation]
+        try:
+            args = arguments(result.payload)
+        except KeyError as missing:
+            result.error = f"Payload missing field {missing}"
+            return
+        send = getattr(self.api, method_name)
+        max_attempts = 1 if self._transport_retries(http_method) else self.max_attempts
+        while result.attempts < max_attempts:
+            result.attempts += 1
+            response = send(*args, idempotency_key=result.idempotency_key)
+            result.status_code = response.status_code
+            if response.status_code in self.SUCCESS[self.operation]:
+                result.data = response.json()
+                result.error = None
+                return
+            result.error = f"HTTP {response.status_code}"
+            if response.status_code not in self.RETRYABLE_STATUSES or getattr(response, "short_circuited", False):
+                return
+            if result.attempts < max_attempts:
+                time.sleep(self.retry_backoff * (2 ** (result.attempts - 1)))
+
+    def _transport_retries(self, http_method):
+        """True if the client's adapter already retries this method on 5xx, so retrying here would stack."""
+        adapter = self.api.session.get_adapter(self.api.BASE_URL)
+        retry = getattr(getattr(adapter, "adapter", adapter), "max_retries", None)  # unwrap CassetteAdapter
+        return bool(retry is not None and retry.total) and retry.is_retry(http_method, 503)
+
+    @staticmethod
+    def _put(target, item, stop):
+        """Puts into a bounded queue, giving up if the run is being stopped. Returns False if stopped."""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write posts in bulk from a JSON-lines file")
+    parser.add_argument("path", help="JSON-lines file with one payload per line")
+    parser.add_argument("--operation", choices=sorted(BulkWriter.OPERATIONS), default="create")
+    parser.add_argument("--base-url", default=None, help="API root (default: API_BASE_URL or jsonplaceholder)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    args = parser.parse_args()
+
+    writer = BulkWriter(APIAutomation(base_url=args.base_url), args.operation, args.workers,
+                        max_attempts=args.max_attempts)
+    start = time.perf_counter()
+    written = failed = 0
+    for outcome in writer.write(iter_jsonl(args.path)):
+        written += 1
+        if not outcome.ok:
+            failed += 1
+            print(f"line {outcome.index + 1}: {outcome.error} after {outcome.attempts} attempt(s)")
+    elapsed = time.perf_counter() - start
+    print(f"{written} items, {failed} failed, {elapsed:.2f}s ({written / elapsed if elapsed else 0:.0f} items/s)")
@@ -0,0 +1,131 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Headers describing the wire encoding; recorded bodies are stored decoded
+_SKIPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection", "set-cookie"}
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request has no recorded interaction."""
+
+
+class Cassette:
+    """
+    Cassette records HTTP exchanges made through APIAutomation and replays them offline.
+
+    Interactions are indexed by (method, url, body hash), so replay is a dictionary lookup.
+    Repeated identical requests are replayed in recorded order; once exhausted, the last
+    recording is served again.
+
+    Attributes:
+        path (str): JSON file the cassette is loaded from and saved to.
+        mode (str): "record" to capture live traffic, "replay" to serve recorded traffic.
+        interactions (dict): Key -> list of recorded responses.
+
+    Methods:
+        install(session): Routes a session's http:// and https:// traffic through the cassette.
+        save(): Writes recorded interactions to disk.
+    """
+    MODES = ("record", "replay")
+
+    def __init__(self, path, mode="replay"):
+        """Loads the cassette file if it exists."""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}', expected one of {self.MODES}")
+        self.path = path
+        self.mode = mode
+        self.interactions = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                self.interactions = json.load(file)["interactions"]
+        elif mode == "replay":
+            raise FileNotFoundError(f"Cassette not found: {path}")
+
+    @staticmethod
+    def key(method, url, body=None):
+        """Builds the lookup key for a request."""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:16] if body else "-"
+        return f"{method.upper()} {url} {digest}"
+
+    def install(self, session):
+        """Mounts a CassetteAdapter over the session's existing http:// and https:// adapters."""
+        for prefix in ("http://", "https://"):
+            session.mount(prefix, CassetteAdapter(self, session.get_adapter(prefix)))
+        return session
+
+    def record(self, request, response):
+        """Stores a live response under the request's key."""
+        content = response.content
+        try:
+            body = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        entry = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _SKIPPED_HEADERS},
+            **body,
+        }
+        with self._lock:
+            self.interactions.setdefault(self.key(request.method, request.url, request.body), []).append(entry)
+
+    def play(self, request):
+        """Returns a response built from the next recording for the request."""
+        key = self.key(request.method, request.url, request.body)
+        with self._lock:
+            recordings = self.interactions.get(key)
+            if not recordings:
+                raise CassetteMissError(f"No recorded interaction for {key} in {self.path}")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            entry = recordings[min(position, len(recordings) - 1)]
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = base64.b64decode(entry["base64"]) if "base64" in entry else entry["text"].encode("utf-8")
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def save(self):
+        """Writes the cassette as compact JSON."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock, open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"version": 1, "interactions": self.interactions}, file, separators=(",", ":"))
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter that records through, or replays instead of, the wrapped adapter."""
+
+    def __init__(self, cassette, adapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+        self.max_retries = adapter.max_retries
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == "replay":
+            response = self.cassette.play(request)
+            response.connection = self
+            return response
+        response = self.adapter.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.adapter.close()
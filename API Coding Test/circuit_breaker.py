@@ -0,0 +1,109 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _HostCircuit:
+    """Breaker state for a single host."""
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.short_circuits = 0
+
+
+class CircuitBreaker:
+    """
+    CircuitBreaker tracks consecutive failures per host and fails fast once a host looks dead.
+
+    - closed: requests flow; `failure_threshold` consecutive failures open the circuit.
+    - open: requests are rejected immediately until `recovery_timeout` seconds have passed.
+    - half_open: up to `half_open_max_calls` probe requests are let through; a success closes
+      the circuit, a failure opens it again.
+
+    A failure is a transport error (connection refused, DNS failure, timeout, exhausted
+    retries) or a 5xx response.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        recovery_timeout (float): Seconds an open circuit waits before probing.
+        half_open_max_calls (int): Probe requests allowed while half open.
+    """
+
+    def __init__(self, failure_threshold=3, recovery_timeout=30, half_open_max_calls=1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def allow(self, url):
+        """Returns True if a request to url's host may be sent now."""
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state == OPEN:
+                if time.monotonic() - circuit.opened_at < self.recovery_timeout:
+                    circuit.short_circuits += 1
+                    return False
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_max_calls:
+                    circuit.short_circuits += 1
+                    return False
+                circuit.probes += 1
+            return True
+
+    def release(self, url):
+        """
+        Gives back a probe slot taken by allow() for a request that ended without an outcome
+        (e.g. an unexpected exception), so a half-open circuit does not stay blocked forever.
+        """
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def record_success(self, url):
+        """Closes the circuit and resets the failure count."""
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit.state = CLOSED
+            circuit.failures = 0
+
+    def record_failure(self, url):
+        """Counts a failure, opening the circuit when the threshold is reached or a probe fails."""
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+
+    def state(self, url):
+        """Returns the current state for url's host, moving an expired open circuit to half open."""
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return circuit.state
+
+    def snapshot(self):
+        """Returns {host: {"state", "failures", "short_circuits"}} for reporting."""
+        with self._lock:
+            return {host: {"state": circuit.state, "failures": circuit.failures,
+                           "short_circuits": circuit.short_circuits}
+                    for host, circuit in self._circuits.items()}
+
+    def _circuit(self, url):
+        host = urlsplit(url).netloc
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = _HostCircuit()
+        return circuit
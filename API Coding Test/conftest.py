@@ -0,0 +1,149 @@
+import os
+import time
+import pytest
+from pytest_html import extras
+from APIAutomation import APIAutomation, close_shared_sessions
+from cassette import Cassette
+from fake_server import FakeJSONPlaceholder
+from load_runner import completed_reports
+
+# Startup timings collected by this process (one entry per worker under xdist)
+_startup_timings = []
+# RunMetrics of the api fixture client, printed in the terminal summary
+_run_metrics = []
+
+
+def _worker_id():
+    """Returns the pytest-xdist worker id, or 'master' when running without xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def _connections_opened(session):
+    """Counts TCP connections opened by all pools of the session's mounted adapters."""
+    total = 0
+    for adapter in set(session.adapters.values()):
+        adapter = getattr(adapter, "adapter", adapter)  # unwrap CassetteAdapter
+        poolmanager = getattr(adapter, "poolmanager", None)
+        if poolmanager is None:
+            continue
+        for key in poolmanager.pools.keys():
+            total += poolmanager.pools[key].num_connections
+    return total
+
+
+def _warm_up(client):
+    """
+    Sends one GET before the tests start and returns its timings.
+
+    This is where the worker pays for DNS, TCP connect and TLS; the request is kept out of the
+    client's metrics so the per-endpoint table only reflects the tests.
+    """
+    observed = []
+    hooks, client.hooks = client.hooks, [lambda metrics, response: observed.append(metrics)]
+    try:
+        client.get_posts(1)
+    finally:
+        client.hooks = hooks
+    metrics = observed[0]
+    return {"warmup_seconds": metrics.total_seconds, "connect_seconds": metrics.connect_seconds,
+            "tls_seconds": metrics.tls_seconds}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api", "API automation")
+    group.addoption("--cassette", default="cassettes/api_cassette.json",
+                    help="Cassette file used by --cassette-mode (default: cassettes/api_cassette.json)")
+    group.addoption("--cassette-mode", choices=["off", "record", "replay"], default="off",
+                    help="Record live API traffic to the cassette, or replay it without network access")
+    group.addoption("--base-url", default=None,
+                    help="API root for the api fixture (default: API_BASE_URL or jsonplaceholder)")
+    group.addoption("--fake-api", action="store_true",
+                    help="Run the api fixture against a local FakeJSONPlaceholder server")
+
+
+@pytest.fixture(scope="session")
+def api(request):
+    """
+    Session-scoped APIAutomation client shared by every test in this process.
+
+    Under pytest-xdist each worker process builds its own client once, so TLS handshakes
+    are paid per worker rather than per parametrized case. The client owns a private
+    session so a cassette installed on it does not affect other clients.
+    """
+    fake = None
+    base_url = request.config.getoption("--base-url")
+    if request.config.getoption("--fake-api"):
+        fake = FakeJSONPlaceholder()
+        base_url = fake.start()
+
+    start = time.perf_counter()
+    client = APIAutomation(shared=False, base_url=base_url)
+    timing = {"worker": _worker_id(), "setup_seconds": time.perf_counter() - start}
+    _startup_timings.append(timing)
+
+    cassette = None
+    mode = request.config.getoption("--cassette-mode")
+    # Warm up only against the local fake or a live API that was asked for explicitly;
+    # replay never opens a connection, and a default run should not hit the public API on its own
+    live_requested = bool(request.config.getoption("--base-url") or os.environ.get("API_BASE_URL")) or mode == "record"
+    if mode != "replay" and (fake is not None or live_requested):
+        timing.update(_warm_up(client))
+    if mode != "off":
+        if mode == "record" and _worker_id() != "master":
+            raise pytest.UsageError("Record cassettes in a single process; xdist workers would overwrite each other")
+        cassette = Cassette(request.config.getoption("--cassette"), mode=mode)
+        cassette.install(client.session)
+
+    yield client
+
+    if cassette is not None and cassette.mode == "record":
+        cassette.save()
+    timing["connections_opened"] = _connections_opened(client.session)
+    _run_metrics.append(client.metrics)
+    client.session.close()
+    close_shared_sessions()
+    if fake is not None:
+        fake.stop()
+
+
+def pytest_sessionfinish(session):
+    """Ships this worker's timings to the xdist controller."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["api_startup_timings"] = list(_startup_timings)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collects timings reported by an xdist worker on the controller."""
+    _startup_timings.extend(getattr(node, "workeroutput", {}).get("api_startup_timings", []))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Prints per-request metrics and the API client startup timing report."""
+    for metrics in _run_metrics:
+        if metrics.requests:
+            terminalreporter.section(f"API request metrics ({_worker_id()})")
+            terminalreporter.write_line(metrics.summary())
+    if not _startup_timings or hasattr(terminalreporter.config, "workerinput"):
+        return
+    terminalreporter.section("API client startup")
+    for timing in sorted(_startup_timings, key=lambda t: t["worker"]):
+        if "warmup_seconds" in timing:
+            warmup = (f"first request {timing['warmup_seconds'] * 1000:.1f} ms "
+                      f"(connect {timing['connect_seconds'] * 1000:.1f} ms, TLS {timing['tls_seconds'] * 1000:.1f} ms)")
+        else:
+            warmup = "first request n/a (no warm-up)"
+        terminalreporter.write_line(
+            f"{timing['worker']}: client setup {timing['setup_seconds'] * 1000:.2f} ms, {warmup}, "
+            f"connections opened {timing.get('connections_opened', 'n/a')}"
+        )
+
+
+# Pytest HTML reporting hook
+def pytest_html_report_title(report):
+    report.title = "API Automation Test Report"
+
+def pytest_html_results_summary(prefix):
+    prefix.extend([extras.html("<p>API Automation Report</p>")])
+    prefix.extend(extras.html(report.to_html()) for report in completed_reports())
@@ -0,0 +1,269 @@
+import argparse
+import asyncio
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+class FakeJSONPlaceholder:
+    """
+    FakeJSONPlaceholder is a local, asyncio-based stand-in for the jsonplaceholder `/posts` API.
+
+    It serves the same resources and status codes the tests assert against (200/201/404, and
+    500 for PUT on a missing post) from in-memory storage indexed by post ID, so functional
+    tests and throughput benchmarks can run without the live service. Like jsonplaceholder,
+    writes are acknowledged but not persisted unless persist_writes is True.
+
+    Attributes:
+        host (str): Interface to bind.
+        port (int): Port to bind; 0 picks a free port.
+        base_url (str): URL of the running server, set by start().
+        posts (dict): Post ID -> post.
+        comments (dict): Post ID -> list of comments.
+
+    Methods:
+        start(): Runs the server on a background thread and returns its base URL.
+        stop(): Stops the server.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, persist_writes=False):
+        """Seeds 100 posts with 5 comments each, matching jsonplaceholder's dataset shape."""
+        self.host = host
+        self.port = port
+        self.persist_writes = persist_writes
+        self.base_url = None
+        self.posts = {}
+        self.comments = {}
+        for post_id in range(1, 101):
+            self.posts[post_id] = {"userId": (post_id - 1) // 10 + 1, "id": post_id,
+                                   "title": f"post title {post_id}", "body": f"post body {post_id}"}
+            self.comments[post_id] = [
+                {"postId": post_id, "id": (post_id - 1) * 5 + n, "name": f"comment {n}",
+                 "email": f"user{n}@example.com", "body": f"comment body {n}"}
+                for n in range(1, 6)
+            ]
+        self._next_id = 101
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._started = threading.Event()
+        self._start_error = None
+
+    def start(self, timeout=10):
+        """
+        Starts the event loop thread and blocks until the server accepts connections.
+
+        Raises:
+            OSError: If the address cannot be bound (e.g. the port is in use).
+            TimeoutError: If the server is not listening within `timeout` seconds.
+        """
+        self._thread = threading.Thread(target=self._run, name="fake-jsonplaceholder", daemon=True)
+        self._thread.start()
+        if not self._started.wait(timeout):
+            raise TimeoutError(f"Fake server did not start within {timeout}s")
+        if self._start_error is not None:
+            self._thread.join()
+            raise self._start_error
+        return self.base_url
+
+    def stop(self):
+        """Closes the server and joins the event loop thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except Exception as error:  # reported by start() instead of leaving it waiting
+            self._start_error = error
+            self._loop.close()
+            self._loop = None
+            self._started.set()
+            return
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{self.host}:{self.port}"
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    async def _handle(self, reader, writer):
+        """Serves HTTP/1.1 requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload, extra_headers = self.route(method, target, body)
+                except Exception:  # answer instead of dropping the connection and leaving the client retrying
+                    status, payload, extra_headers = 500, {}, {}
+                content = json.dumps(payload).encode("utf-8")
+                keep_alive = headers.get("connection", "").lower() != "close"
+                head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                        "Content-Type: application/json; charset=utf-8",
+                        f"Content-Length: {len(content)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head += [f"{name}: {value}" for name, value in extra_headers.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + content)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def route(self, method, target, body=b""):
+        """
+        Resolves a request against the in-memory store.
+
+        Returns:
+            tuple: (status code, JSON-serialisable payload, extra response headers)
+        """
+        parts = urlsplit(target)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {}, {}
+        if method in ("POST", "PUT", "PATCH") and not isinstance(data, dict):
+            return 400, {}, {}
+
+        if segments == ["posts"]:
+            if method == "GET":
+                posts = list(self.posts.values())
+                if "userId" in query:
+                    posts = [post for post in posts if str(post["userId"]) == query["userId"]]
+                return self._paginate(posts, query)
+            if method == "POST":
+                post = {**data, "id": self._next_id}
+                if self.persist_writes:
+                    self.posts[self._next_id] = post
+                    self.comments[self._next_id] = []
+                    self._next_id += 1
+                return 201, post, {}
+            return 404, {}, {}
+
+        if len(segments) in (2, 3) and segments[0] == "posts":
+            post_id = int(segments[1]) if segments[1].isdigit() else None
+            post = self.posts.get(post_id)
+            if len(segments) == 3:
+                if segments[2] == "comments" and method == "GET":
+                    return self._paginate(self.comments.get(post_id, []), query)
+                return 404, {}, {}
+            if method == "GET":
+                return (200, post, {}) if post else (404, {}, {})
+            if method == "PUT":
+                if post is None:
+                    return 500, {}, {}
+                updated = {**data, "id": post_id}
+            elif method == "PATCH":
+                updated = {**(post or {}), **data}
+            elif method == "DELETE":
+                if self.persist_writes and post is not None:
+                    del self.posts[post_id]
+                    del self.comments[post_id]
+                return 200, {}, {}
+            else:
+                return 404, {}, {}
+            if self.persist_writes and post is not None:
+                self.posts[post_id] = updated
+            return 200, updated, {}
+
+        if segments == ["comments"] and method == "GET":
+            if "postId" in query:
+                post_id = int(query["postId"]) if query["postId"].isdigit() else None
+                return self._paginate(self.comments.get(post_id, []), query)
+            return self._paginate([comment for comments in self.comments.values() for comment in comments], query)
+
+        return 404, {}, {}
+
+    @staticmethod
+    def _paginate(items, query):
+        """Applies json-server style _start/_limit paging and reports X-Total-Count when paging."""
+        if "_start" not in query and "_limit" not in query:
+            return 200, items, {}
+        try:
+            start = int(query.get("_start", 0))
+            limit = int(query["_limit"]) if "_limit" in query else len(items)
+        except ValueError:
+            return 400, {}, {}
+        if start < 0 or limit < 0:
+            return 400, {}, {}
+        return 200, items[start:start + limit], {"X-Total-Count": str(len(items))}
+
+
+def benchmark(total_requests=5000, workers=32):
+    """
+    Measures APIAutomation throughput against a local FakeJSONPlaceholder.
+
+    Returns:
+        dict: Request count, elapsed seconds and requests per second.
+    """
+    from APIAutomation import APIAutomation
+
+    with FakeJSONPlaceholder() as server:
+        api = APIAutomation(shared=False, base_url=server.base_url, coalesce_gets=False)  # every request is sent
+        post_ids = [(n % 100) + 1 for n in range(total_requests)]
+        start = time.perf_counter()
+        for _, response in api.get_posts_many(post_ids, max_workers=workers, ordered=False):
+            assert response.status_code == 200
+        elapsed = time.perf_counter() - start
+        api.session.close()
+    return {"requests": total_requests, "seconds": elapsed, "rps": total_requests / elapsed}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local jsonplaceholder stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--persist-writes", action="store_true", help="Store POST/PUT/PATCH/DELETE results")
+    parser.add_argument("--benchmark", action="store_true", help="Run a throughput benchmark and exit")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=32)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.requests, args.workers)
+        print(f"{result['requests']} requests in {result['seconds']:.2f}s -> {result['rps']:.0f} req/s")
+    else:
+        fake = FakeJSONPlaceholder(args.host, args.port, args.persist_writes)
+        print(f"Serving fake jsonplaceholder at {fake.start()} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            fake.stop()
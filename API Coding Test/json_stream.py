@@ -0,0 +1,116 @@
+import codecs
+import importlib
+import json
+import os
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+def _load_backend(name=None):
+    """Returns (name, loads) for the requested backend, or the fastest installed one."""
+    for candidate in [name] if name else ["orjson", "ujson", "json"]:
+        try:
+            module = importlib.import_module(candidate)
+        except ImportError:
+            if name:
+                raise
+            continue
+        return candidate, module.loads
+    raise ImportError("No JSON backend available")
+
+
+# orjson/ujson when installed; force one with the API_JSON_BACKEND environment variable
+JSON_BACKEND, _loads = _load_backend(os.environ.get("API_JSON_BACKEND"))
+
+
+def use_backend(name):
+    """Switches the JSON backend used by loads() ("orjson", "ujson" or "json")."""
+    global JSON_BACKEND, _loads
+    JSON_BACKEND, _loads = _load_backend(name)
+
+
+def loads(data):
+    """Decodes a JSON document (str or bytes) with the active backend."""
+    return _loads(data)
+
+
+def decode(response):
+    """Decodes a response body with the active backend; faster than response.json() for large bodies."""
+    return _loads(response.content)
+
+
+def iter_json_array(chunks, encoding="utf-8"):
+    """
+    Incrementally parses a top-level JSON array, yielding each element as soon as it is complete.
+
+    Only the current, not yet complete element is buffered, so memory stays bounded by the
+    largest element rather than the whole document.
+
+    Args:
+        chunks: Iterable of bytes (or str) pieces of the document, e.g. response.iter_content().
+        encoding (str): Encoding of byte chunks.
+
+    Yields:
+        Decoded array elements.
+
+    Raises:
+        ValueError: If the document is not a JSON array, is truncated, or has a missing or stray comma.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    position = 0
+    started = False
+    finished = False
+    expecting = "first"  # "first" element or "]", a "value" after a comma, or a "separator" after a value
+    chunks = iter(chunks)
+    exhausted = False
+
+    while not finished:
+        # Pull more text whenever the buffer cannot yield a complete element
+        if not exhausted:
+            try:
+                chunk = next(chunks)
+                buffer = buffer[position:] + (decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+                position = 0
+            except StopIteration:
+                buffer = buffer[position:] + decoder.decode(b"", final=True)
+                position = 0
+                exhausted = True
+
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                if expecting == "value":
+                    raise ValueError("Trailing ',' before ']' in JSON array")
+                finished = True
+                break
+            if buffer[position] == ",":
+                if expecting != "separator":
+                    raise ValueError("Unexpected ',' in JSON array")
+                expecting = "value"
+                position += 1
+                continue
+            if expecting == "separator":
+                raise ValueError("Missing ',' between JSON array elements")
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # element not complete yet
+            if end == len(buffer) and not exhausted and not isinstance(item, (dict, list, str)):
+                break  # a number or literal at the end of the buffer may continue in the next chunk
+            position = end
+            expecting = "separator"
+            yield item
+
+        if exhausted and not finished:
+            raise ValueError("Truncated JSON array")
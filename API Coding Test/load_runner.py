@@ -0,0 +1,296 @@
+import argparse
+import html
+import itertools
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from APIAutomation import APIAutomation
+
+# Reports from finished runs, picked up by the pytest-html summary hook in conftest.py
+_completed_reports = []
+
+
+def completed_reports():
+    """Returns the reports of every load run finished in this process."""
+    return list(_completed_reports)
+
+
+class LatencyHistogram:
+    """
+    LatencyHistogram records latencies in HDR-style log-linear buckets.
+
+    Values are stored in microseconds; each power-of-two range is split into
+    2**significant_bits buckets, so percentiles carry a bounded relative error
+    (under 1% with the default 7 bits) while memory stays constant in the sample count.
+
+    Attributes:
+        count (int): Number of recorded values.
+        min_us (int): Smallest recorded value.
+        max_us (int): Largest recorded value.
+    """
+
+    def __init__(self, significant_bits=7):
+        self.significant_bits = significant_bits
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = 0
+        self._buckets = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        """Records one latency given in seconds."""
+        value = max(int(seconds * 1_000_000), 0)
+        with self._lock:
+            self._buckets[self._bucket(value)] += 1
+            self.count += 1
+            self.total_us += value
+            self.min_us = value if self.min_us is None else min(self.min_us, value)
+            self.max_us = max(self.max_us, value)
+
+    def merge(self, other):
+        """Adds the values of another histogram with the same precision."""
+        with self._lock:
+            for bucket, count in other._buckets.items():
+                self._buckets[bucket] += count
+            self.count += other.count
+            self.total_us += other.total_us
+            if other.min_us is not None:
+                self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+            self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percent):
+        """Returns the latency in milliseconds at the given percentile (0-100)."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, int(round(percent / 100 * self.count)))
+            seen = 0
+            for bucket in sorted(self._buckets):
+                seen += self._buckets[bucket]
+                if seen >= rank:
+                    return min(self._upper_bound(bucket), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def mean(self):
+        """Returns the mean latency in milliseconds."""
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    def _bucket(self, value):
+        """Returns the lower bound of the bucket holding value."""
+        shift = value.bit_length() - 1 - self.significant_bits
+        return value if shift <= 0 else (value >> shift) << shift
+
+    def _upper_bound(self, bucket):
+        """Returns the largest value that maps to bucket."""
+        shift = bucket.bit_length() - 1 - self.significant_bits
+        return bucket if shift <= 0 else bucket + (1 << shift) - 1
+
+
+class LoadReport:
+    """
+    Per-endpoint latency histograms, status counts and throughput for one load run.
+
+    Calls the circuit breaker rejected without sending are counted in `rejected` only,
+    so they do not show up as fast requests in the latencies or the request rate.
+    """
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self, mode, target):
+        self.mode = mode
+        self.target = target
+        self.latency = defaultdict(LatencyHistogram)
+        self.service_time = defaultdict(LatencyHistogram)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.errors = defaultdict(int)
+        self.rejected = defaultdict(int)
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, latency, service_time, status):
+        with self._lock:
+            self.latency[endpoint].record(latency)
+            self.service_time[endpoint].record(service_time)
+            self.statuses[endpoint][status] += 1
+            if status >= 400:
+                self.errors[endpoint] += 1
+
+    def record_rejected(self, endpoint):
+        with self._lock:
+            self.rejected[endpoint] += 1
+
+    @property
+    def total_requests(self):
+        return sum(histogram.count for histogram in self.latency.values())
+
+    def rows(self):
+        """Returns one summary dict per endpoint, latencies in milliseconds."""
+        rows = []
+        for endpoint in sorted(set(self.latency) | set(self.rejected)):
+            histogram = self.latency[endpoint]
+            row = {"endpoint": endpoint, "requests": histogram.count, "errors": self.errors[endpoint],
+                   "rejected": self.rejected[endpoint],
+                   "rps": histogram.count / self.elapsed if self.elapsed else 0.0, "mean": histogram.mean()}
+            for percent in self.PERCENTILES:
+                row[f"p{percent:g}"] = histogram.percentile(percent)
+            row["max"] = histogram.max_us / 1000
+            rows.append(row)
+        return rows
+
+    def summary(self):
+        """Returns a plain-text table for the terminal."""
+        header = f"Load run ({self.mode} {self.target}): {self.total_requests} requests in {self.elapsed:.2f}s"
+        if self.rejected:
+            header += f", {sum(self.rejected.values())} rejected by the circuit breaker"
+        columns = (["endpoint", "requests", "errors", "rejected", "rps", "mean"]
+                   + [f"p{p:g}" for p in self.PERCENTILES] + ["max"])
+        lines = [header, " ".join(f"{column:>18}" if i == 0 else f"{column:>9}" for i, column in enumerate(columns))]
+        for row in self.rows():
+            cells = [f"{row['endpoint']:>18}", f"{row['requests']:>9}", f"{row['errors']:>9}",
+                     f"{row['rejected']:>9}", f"{row['rps']:>9.1f}"]
+            cells += [f"{row[column]:>9.2f}" for column in columns[5:]]
+            lines.append(" ".join(cells))
+        return "\n".join(lines)
+
+    def to_html(self):
+        """Returns an HTML table fragment for pytest-html's results summary."""
+        columns = list(self.rows()[0]) if self.rows() else ["endpoint"]
+        head = "".join(f"<th>{html.escape(column)}</th>" for column in columns)
+        body = ""
+        for row in self.rows():
+            cells = "".join(
+                f"<td>{value:.2f}</td>" if isinstance(value, float) else f"<td>{html.escape(str(value))}</td>"
+                for value in row.values()
+            )
+            body += f"<tr>{cells}</tr>"
+        title = html.escape(f"Load run ({self.mode} {self.target}), latencies in ms")
+        return f"<h3>{title}</h3><table><tr>{head}</tr>{body}</table>"
+
+
+class LoadRunner:
+    """
+    LoadRunner drives APIAutomation's CRUD methods at a target request rate or concurrency.
+
+    In rate mode the schedule is open-loop: request i is due at start + i / rps whether or
+    not earlier requests have finished, and latency is measured from that intended start.
+    Queueing delay caused by a slow server is therefore counted instead of silently
+    lowering the offered load (coordinated omission). In concurrency mode a fixed number
+    of workers issue requests back to back.
+
+    The client must not coalesce GETs (build it with coalesce_gets=False): merged GETs would
+    be counted as requests that never reached the server.
+
+    Attributes:
+        api (APIAutomation): Client used to issue requests.
+        endpoints (list): Names of the operations in OPERATIONS to cycle through.
+    """
+    OPERATIONS = {
+        "get_posts": lambda api, n: api.get_posts(n % 100 + 1),
+        "get_post_comments": lambda api, n: api.get_post_comments(n % 100 + 1),
+        "create_post": lambda api, n: api.create_post(f"load title {n}", f"load body {n}", n % 10 + 1),
+        "update_post": lambda api, n: api.update_post(n % 100 + 1, f"load title {n}", f"load body {n}", n % 10 + 1),
+        "patch_post": lambda api, n: api.patch_post(n % 100 + 1, title=f"load title {n}"),
+        "delete_post": lambda api, n: api.delete_post(n % 100 + 1),
+    }
+
+    def __init__(self, api=None, endpoints=("get_posts",)):
+        unknown = set(endpoints) - set(self.OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown endpoints: {sorted(unknown)}")
+        self.api = api or APIAutomation(coalesce_gets=False)
+        if self.api.single_flight is not None:
+            raise ValueError("LoadRunner needs a client built with coalesce_gets=False")
+        self.endpoints = list(endpoints)
+
+    def run(self, duration, rps=None, concurrency=None, max_workers=64):
+        """
+        Applies load for duration seconds.
+
+        Args:
+            duration (float): Length of the run in seconds.
+            rps (float): Target request rate (open-loop). Mutually exclusive with concurrency.
+            concurrency (int): Number of back-to-back workers (closed-loop).
+            max_workers (int): Thread pool size for open-loop runs.
+
+        Returns:
+            LoadReport: Latency histograms and status counts per endpoint.
+        """
+        if (rps is None) == (concurrency is None):
+            raise ValueError("Specify exactly one of rps or concurrency")
+        for name, value in (("duration", duration), ("rps", rps), ("concurrency", concurrency),
+                            ("max_workers", max_workers)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        workers = concurrency or max_workers
+        self.api._ensure_pool_size(workers)
+        report = LoadReport("rps", rps) if rps else LoadReport("concurrency", concurrency)
+        counter = itertools.count()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="load") as executor:
+            if rps:
+                interval = 1.0 / rps
+                for n in counter:
+                    due = start + n * interval
+                    if due - start >= duration:
+                        break
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    executor.submit(self._issue, report, n, due)
+            else:
+                deadline = start + duration
+
+                def worker():
+                    while time.perf_counter() < deadline:
+                        self._issue(report, next(counter), time.perf_counter())
+
+                for _ in range(concurrency):
+                    executor.submit(worker)
+        report.elapsed = time.perf_counter() - start
+        _completed_reports.append(report)
+        return report
+
+    def _issue(self, report, n, due):
+        """Runs operation n and records latency from its intended start time."""
+        endpoint = self.endpoints[n % len(self.endpoints)]
+        sent = time.perf_counter()
+        response = self.OPERATIONS[endpoint](self.api, n)
+        finished = time.perf_counter()
+        if getattr(response, "short_circuited", False):
+            report.record_rejected(endpoint)
+            return
+        report.record(endpoint, finished - due, finished - sent, response.status_code)
+
+
+def positive(kind):
+    """Returns an argparse type that parses kind (int or float) and rejects zero and negative values."""
+    def parse(text):
+        try:
+            value = kind(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid {kind.__name__} value: '{text}'")
+        if value <= 0:
+            raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+        return value
+    return parse
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply load through APIAutomation")
+    parser.add_argument("--base-url", default=None, help="API root (default: API_BASE_URL or jsonplaceholder)")
+    parser.add_argument("--endpoints", default="get_posts", help=f"Comma separated: {','.join(LoadRunner.OPERATIONS)}")
+    parser.add_argument("--duration", type=positive(float), default=10)
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rps", type=positive(float), help="Target request rate (open-loop)")
+    mode.add_argument("--concurrency", type=positive(int), help="Number of back-to-back workers (closed-loop)")
+    parser.add_argument("--max-workers", type=positive(int), default=64)
+    parser.add_argument("--html", help="Write the summary table to this HTML file")
+    args = parser.parse_args()
+
+    runner = LoadRunner(APIAutomation(base_url=args.base_url, coalesce_gets=False), args.endpoints.split(","))
+    result = runner.run(args.duration, rps=args.rps, concurrency=args.concurrency, max_workers=args.max_workers)
+    print(result.summary())
+    if args.html:
+        with open(args.html, "w", encoding="utf-8") as file:
+            file.write(f"<html><body>{result.to_html()}</body></html>")
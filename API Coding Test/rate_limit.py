@@ -0,0 +1,170 @@
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from request_metrics import endpoint_of
+
+
+def parse_retry_after(value):
+    """Returns the delay in seconds from a Retry-After header (seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    TokenBucket allows `rate` acquisitions per second with bursts of up to `capacity`.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum tokens held, i.e. the burst size.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Blocks until tokens are available (and any pause has ended), then takes them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                else:
+                    wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Stops handing out tokens for the given number of seconds and drains the burst."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class RateLimiter:
+    """
+    RateLimiter applies client-side token buckets per host and per endpoint.
+
+    A 429 or 503 response carrying Retry-After pauses the host's bucket (or a bucket created
+    for the host if none is configured) for the advertised delay, so every caller backs off
+    together instead of each one burning retries.
+
+    Attributes:
+        host_rate (float): Requests per second allowed per host, or None for unlimited.
+        endpoint_rates (dict): Endpoint template (e.g. "/posts/{id}") -> requests per second.
+    """
+    BACKOFF_STATUSES = (429, 503)
+
+    def __init__(self, host_rate=None, endpoint_rates=None, burst=None):
+        self.host_rate = host_rate
+        self.endpoint_rates = dict(endpoint_rates or {})
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        """Blocks until the request to url is allowed by its host and endpoint buckets."""
+        for bucket in self._buckets_for(url):
+            bucket.acquire()
+
+    def observe(self, url, response):
+        """Pauses the host bucket when the response asks the client to back off."""
+        if response.status_code not in self.BACKOFF_STATUSES:
+            return
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay:
+            self._bucket(("host", urlsplit(url).netloc), self.host_rate or 1e9).pause(delay)
+
+    def _buckets_for(self, url):
+        parts = urlsplit(url)
+        buckets = []
+        with self._lock:
+            host_bucket = self._buckets.get(("host", parts.netloc))
+        if self.host_rate or host_bucket:
+            buckets.append(self._bucket(("host", parts.netloc), self.host_rate or 1e9))
+        endpoint = endpoint_of(url)
+        if endpoint in self.endpoint_rates:
+            buckets.append(self._bucket(("endpoint", parts.netloc, endpoint), self.endpoint_rates[endpoint]))
+        return buckets
+
+    def _bucket(self, key, rate):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, self.burst)
+            return bucket
+
+
+class AdaptiveConcurrency:
+    """
+    AdaptiveConcurrency is an AIMD limit on requests in flight.
+
+    Each healthy response (not 429/5xx, latency under `latency_target`) grows the limit by
+    1/limit, i.e. about one slot per round of requests. An error or slow response cuts it
+    by `decrease`, at most once per `cooldown` seconds so one burst of failures counts once.
+
+    Attributes:
+        limit (float): Current concurrency limit.
+        min_limit (int): Lower bound for the limit.
+        max_limit (int): Upper bound for the limit.
+        latency_target (float): Seconds above which a response counts as congested.
+    """
+
+    def __init__(self, initial=4, min_limit=1, max_limit=64, latency_target=1.0, decrease=0.5, cooldown=0.5):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Holds one in-flight slot, blocking while the limit is reached."""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.in_flight -= 1
+                self._condition.notify()
+
+    def record(self, latency, status_code):
+        """Adjusts the limit from one response."""
+        healthy = status_code != 429 and status_code < 500 and latency <= self.latency_target
+        with self._condition:
+            if healthy:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self._condition.notify_all()
+            else:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.min_limit, self.limit * self.decrease)
+                    self._last_decrease = now
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Connection events for the request currently running on each thread
+_current = threading.local()
+
+
+def begin_request():
+    """Starts collecting connection events for a request on the calling thread."""
+    _current.connections = []
+
+
+def _connection_events():
+    return getattr(_current, "connections", None)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """HTTPConnection that reports how long opening the socket took (DNS lookup + TCP connect)."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_seconds = time.perf_counter() - start
+        return sock
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        events = _connection_events()
+        if events is not None:
+            tcp_seconds = getattr(self, "_tcp_seconds", time.perf_counter() - start)
+            events.append({"connect": tcp_seconds, "tls": 0.0})
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """HTTPSConnection that reports socket setup and TLS handshake time separately."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_seconds = time.perf_counter() - start
+        return sock
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        total = time.perf_counter() - start
+        events = _connection_events()
+        if events is not None:
+            tcp_seconds = getattr(self, "_tcp_seconds", total)
+            events.append({"connect": tcp_seconds, "tls": max(total - tcp_seconds, 0.0)})
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+TIMED_POOL_CLASSES = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+def endpoint_of(url):
+    """Collapses IDs in a REST path into a template, e.g. /posts/1/comments -> /posts/{id}/comments."""
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    return "/" + "/".join("{id}" if index % 2 else segment for index, segment in enumerate(segments))
+
+
+class RequestMetrics:
+    """
+    Timing and transfer details for one `_make_request` call.
+
+    Attributes:
+        method (str): HTTP method.
+        url (str): Request URL.
+        endpoint (str): URL path with IDs collapsed, used for aggregation.
+        status_code (int): Final status code.
+        connect_seconds (float): DNS lookup + TCP connect time for new connections (0 when reused).
+        tls_seconds (float): TLS handshake time for new connections.
+        ttfb_seconds (float): Time from sending the request until response headers were parsed.
+        total_seconds (float): Wall time of the whole call, including retries and body download.
+        response_bytes (int): Size of the response body.
+        retries (int): Retries performed by the urllib3 Retry strategy.
+        connection_reused (bool): True if served on a pooled connection, False if a new one
+            was opened, None if no connection was used (cache, cassette or failed request).
+        from_cache (bool): True if served by the response cache.
+        short_circuited (bool): True if the circuit breaker rejected the request without sending it.
+        circuit_state (str): Breaker state for the host after the request (closed/open/half_open).
+        coalesced (bool): True if the caller shared another caller's in-flight GET; network fields are zero.
+    """
+
+    def __init__(self, method, url, response, total_seconds, circuit_state=None, coalesced=False):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint_of(url)
+        self.status_code = response.status_code
+        self.total_seconds = total_seconds
+        self.from_cache = getattr(response, "from_cache", False)
+        self.short_circuited = getattr(response, "short_circuited", False)
+        self.circuit_state = circuit_state
+        self.ttfb_seconds = response.elapsed.total_seconds() if response.elapsed else 0.0
+        self.response_bytes = len(response.content or b"") if not response.raw or response._content_consumed else 0
+        raw_retries = getattr(response.raw, "retries", None)
+        self.retries = len(raw_retries.history) if raw_retries is not None else 0
+
+        self.coalesced = coalesced
+
+        events = [] if coalesced else _connection_events() or []
+        self.connect_seconds = sum(event["connect"] for event in events)
+        self.tls_seconds = sum(event["tls"] for event in events)
+        if response.raw is None or self.from_cache or coalesced:
+            self.connection_reused = None
+        else:
+            self.connection_reused = not events
+        if coalesced:
+            self.ttfb_seconds = 0.0
+            self.response_bytes = 0
+            self.retries = 0
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+class RunMetrics:
+    """
+    RunMetrics aggregates RequestMetrics across a run, per endpoint.
+
+    It is itself a request hook, so it can be registered with `APIAutomation.add_hook`
+    and shared between several clients. Every APIAutomation owns one as `metrics`.
+    """
+    FIELDS = ("total_seconds", "ttfb_seconds", "connect_seconds", "tls_seconds", "response_bytes", "retries")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = defaultdict(lambda: {"requests": 0, "errors": 0, "pool_hits": 0, "pool_misses": 0,
+                                              "cache_hits": 0, "short_circuits": 0, "coalesced": 0,
+                                              **{field: 0 for field in self.FIELDS}})
+        self.circuit_states = {}
+
+    def __call__(self, metrics, response=None):
+        with self._lock:
+            totals = self.endpoints[f"{metrics.method} {metrics.endpoint}"]
+            totals["requests"] += 1
+            totals["errors"] += metrics.status_code >= 400
+            totals["cache_hits"] += metrics.from_cache
+            totals["short_circuits"] += metrics.short_circuited
+            totals["coalesced"] += metrics.coalesced
+            if metrics.circuit_state is not None:
+                self.circuit_states[urlsplit(metrics.url).netloc] = metrics.circuit_state
+            if metrics.connection_reused is True:
+                totals["pool_hits"] += 1
+            elif metrics.connection_reused is False:
+                totals["pool_misses"] += 1
+            for field in self.FIELDS:
+                totals[field] += getattr(metrics, field)
+
+    @property
+    def requests(self):
+        return sum(totals["requests"] for totals in self.endpoints.values())
+
+    def summary(self):
+        """Returns a plain-text table per endpoint: per-request averages, connect/TLS per new connection."""
+        lines = [f"{'endpoint':<32}{'requests':>9}{'errors':>7}{'avg ms':>9}{'ttfb ms':>9}{'conn ms':>9}"
+                 f"{'tls ms':>9}{'KiB':>9}{'retries':>8}{'reuse':>7}{'cached':>7}{'shared':>7}{'tripped':>8}"]
+        with self._lock:
+            for name in sorted(self.endpoints):
+                t = self.endpoints[name]
+                n = t["requests"]
+                pooled = t["pool_hits"] + t["pool_misses"]
+                reuse = f"{t['pool_hits'] / pooled:.0%}" if pooled else "-"
+                opened = t["pool_misses"] or 1  # connect/TLS averages are per new connection
+                lines.append(
+                    f"{name:<32}{n:>9}{t['errors']:>7}{t['total_seconds'] / n * 1000:>9.2f}"
+                    f"{t['ttfb_seconds'] / n * 1000:>9.2f}{t['connect_seconds'] / opened * 1000:>9.2f}"
+                    f"{t['tls_seconds'] / opened * 1000:>9.2f}{t['response_bytes'] / 1024:>9.1f}{t['retries']:>8}"
+                    f"{reuse:>7}{t['cache_hits']:>7}{t['coalesced']:>7}{t['short_circuits']:>8}"
+                )
+            for host, state in sorted(self.circuit_states.items()):
+                if state != "closed":
+                    lines.append(f"circuit for {host}: {state}")
+        return "\n".join(lines)
@@ -0,0 +1,206 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class ResponseCache:
+    """
+    ResponseCache stores successful GET responses for APIAutomation.
+
+    Entries live in an in-memory LRU and, optionally, in an sqlite file so they survive
+    between runs. Each entry expires after a per-endpoint TTL; expired entries that carry
+    an ETag or Last-Modified header are revalidated with a conditional request instead of
+    being fetched again. Writes to a resource invalidate it, its sub-resources and its
+    parent collection, and a response fetched while an invalidation happened is not stored,
+    so a GET racing a write cannot put the old value back.
+
+    Attributes:
+        max_entries (int): Maximum number of entries held in memory.
+        default_ttl (float): Seconds an entry stays fresh when no TTL pattern matches.
+        ttls (dict): Regex pattern on the URL path -> TTL in seconds, first match wins.
+        path (str): Optional sqlite file for the on-disk store.
+        hits (int): Responses served from the cache without a network call.
+        revalidations (int): Stale entries confirmed unchanged by a 304 response.
+        misses (int): Lookups that required a full request.
+    """
+
+    def __init__(self, max_entries=256, default_ttl=60, ttls=None, path=None):
+        """Initializes the cache and opens the on-disk store when a path is given."""
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or {}).items()]
+        self.path = path
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._generation = 0  # bumped by every invalidation
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, status INTEGER, headers TEXT, "
+                "content BLOB, stored_at REAL, expires_at REAL)"
+            )
+            self._db.commit()
+
+    def fetch(self, url, send, key=None):
+        """
+        Returns a cached response for url, revalidating or refetching it when needed.
+
+        Args:
+            url (str): Request URL including its query string.
+            send: Callable taking extra request headers and returning a requests.Response.
+            key (str, optional): Cache key; defaults to url. Must start with url so invalidation
+                by path still finds it (see cache_key()).
+
+        Returns:
+            requests.Response: Cached or freshly fetched response.
+        """
+        key = key or url
+        entry = self._get(key)
+        generation = self._generation
+        now = time.time()
+        if entry and entry["expires_at"] > now:
+            self.hits += 1
+            return self._to_response(url, entry)
+
+        headers = {}
+        if entry:
+            cached_headers = CaseInsensitiveDict(entry["headers"])
+            if "ETag" in cached_headers:
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if "Last-Modified" in cached_headers:
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+        response = send(headers)
+        if entry and headers and response.status_code == 304:
+            self.revalidations += 1
+            entry["expires_at"] = now + self.ttl_for(url)
+            self._put(key, entry, generation)
+            return self._to_response(url, entry)
+
+        self.misses += 1
+        if response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", ""):
+            self._put(key, {
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "content": response.content,
+                "stored_at": now,
+                "expires_at": now + self.ttl_for(url),
+            }, generation)
+        return response
+
+    @staticmethod
+    def cache_key(url, params=None, headers=None):
+        """
+        Builds the cache key for a GET: the URL with its params, plus the request headers as a fragment.
+
+        Requests that differ only in params or headers get separate entries; the fragment keeps
+        the key's path equal to the resource path for invalidate().
+        """
+        if params:
+            url = requests.Request("GET", url, params=params).prepare().url
+        if headers:
+            url += "#" + json.dumps(sorted((str(name).lower(), str(value)) for name, value in headers.items()))
+        return url
+
+    def ttl_for(self, url):
+        """Returns the TTL in seconds for the URL's endpoint."""
+        path = urlsplit(url).path
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def invalidate(self, url):
+        """Drops entries for the resource at url, its sub-resources and its parent collection."""
+        path = urlsplit(url).path.rstrip("/")
+        parent = path.rsplit("/", 1)[0]
+
+        def affected(key):
+            key_path = urlsplit(key).path.rstrip("/")
+            return key_path == path or key_path.startswith(path + "/") or key_path == parent
+
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if affected(key)]:
+                del self._entries[key]
+            if self._db:
+                stale = [row[0] for row in self._db.execute("SELECT url FROM responses") if affected(row[0])]
+                self._db.executemany("DELETE FROM responses WHERE url = ?", [(key,) for key in stale])
+                self._db.commit()
+
+    def clear(self):
+        """Removes every entry from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._db:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self):
+        """Closes the on-disk store."""
+        with self._lock:
+            if self._db:
+                self._db.close()
+                self._db = None
+
+    def _get(self, url):
+        """Looks up an entry in memory, falling back to disk, and marks it most recently used."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+            if self._db:
+                row = self._db.execute(
+                    "SELECT status, headers, content, stored_at, expires_at FROM responses WHERE url = ?", (url,)
+                ).fetchone()
+                if row:
+                    entry = {"status": row[0], "headers": json.loads(row[1]), "content": row[2],
+                             "stored_at": row[3], "expires_at": row[4]}
+                    self._remember(url, entry)
+                    return entry
+            return None
+
+    def _put(self, url, entry, generation=None):
+        """Stores an entry in memory and on disk, unless an invalidation happened since `generation`."""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remember(url, entry)
+            if self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, entry["status"], json.dumps(entry["headers"]), entry["content"],
+                     entry["stored_at"], entry["expires_at"]),
+                )
+                self._db.commit()
+
+    def _remember(self, url, entry):
+        """Inserts into the in-memory LRU, evicting the least recently used entries."""
+        self._entries[url] = entry
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _to_response(url, entry):
+        """Builds a requests.Response from a cache entry."""
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"]
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.request = requests.Request("GET", url).prepare()
+        response.from_cache = True
+        return response
@@ -0,0 +1,67 @@
+import threading
+
+
+class _Call:
+    """One in-flight call and the outcome shared with its waiters."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    SingleFlight collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is in flight
+    block until it finishes and receive the same result (or exception). Once the call
+    completes the key is forgotten, so later calls run again; this is deduplication of
+    simultaneous work, not caching.
+
+    Attributes:
+        executions (int): Calls that actually ran.
+        coalesced (int): Calls that were served by another caller's execution.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key, func):
+        """
+        Runs func once for all concurrent callers with the same key.
+
+        Returns:
+            tuple: (result, leader) where leader is True for the caller that executed func.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, False
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, True
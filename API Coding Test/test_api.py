@@ -0,0 +1,638 @@
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import requests
+import responses
+from APIAutomation import APIAutomation
+from async_api_automation import AsyncAPIAutomation
+from response_cache import ResponseCache
+from cassette import Cassette, CassetteMissError
+from fake_server import FakeJSONPlaceholder
+from load_runner import LatencyHistogram, LoadRunner, positive
+from rate_limit import AdaptiveConcurrency, RateLimiter, TokenBucket
+from circuit_breaker import CircuitBreaker
+from urllib3.util.retry import Retry
+from bulk_writer import BulkWriter, iter_jsonl
+import json_stream
+from json_stream import iter_json_array
+
+BASE_URL = "https://jsonplaceholder.typicode.com"
+
+
+@responses.activate
+def test_async_gather_many_preserves_order():
+    for post_id in range(1, 21):
+        responses.add(responses.GET, f"{BASE_URL}/posts/{post_id}", json={"id": post_id}, status=200)
+
+    async def sweep():
+        async with AsyncAPIAutomation(max_concurrency=5) as client:
+            return await client.gather_many(client.get_posts, range(1, 21))
+
+    results = asyncio.run(sweep())
+
+    assert [response.json()["id"] for response in results] == list(range(1, 21))
+    assert len(responses.calls) == 20
+
+
+@responses.activate
+def test_async_create_post():
+    responses.add(responses.POST, f"{BASE_URL}/posts", json={"id": 101, "title": "T", "body": "B", "userId": 1}, status=201)
+
+    async def create():
+        async with AsyncAPIAutomation(max_concurrency=2) as client:
+            return await client.gather_many(client.create_post, [("T", "B", 1), ("T", "B", 1)])
+
+    results = asyncio.run(create())
+
+    assert [response.status_code for response in results] == [201, 201]
+
+
+def test_async_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        AsyncAPIAutomation(max_concurrency=0)
+
+
+@responses.activate
+@pytest.mark.parametrize("ordered", [True, False])
+def test_get_posts_many(ordered):
+    for post_id in range(1, 31):
+        responses.add(responses.GET, f"{BASE_URL}/posts/{post_id}", json={"id": post_id}, status=200)
+    api = APIAutomation()
+
+    results = list(api.get_posts_many(range(1, 31), max_workers=4, ordered=ordered))
+
+    assert len(results) == 30
+    assert all(response.json()["id"] == post_id for post_id, response in results)
+    if ordered:
+        assert [post_id for post_id, _ in results] == list(range(1, 31))
+
+
+@responses.activate
+def test_get_comments_many():
+    for post_id in (1, 2):
+        responses.add(responses.GET, f"{BASE_URL}/posts/{post_id}/comments", json=[{"postId": post_id}], status=200)
+    api = APIAutomation()
+
+    results = dict(api.get_comments_many([1, 2], max_workers=2))
+
+    assert results[1].json() == [{"postId": 1}]
+    assert results[2].json() == [{"postId": 2}]
+
+
+def test_shared_session_registry():
+    first = APIAutomation(pool_maxsize=32)
+    second = APIAutomation(pool_maxsize=32)
+    private = APIAutomation(pool_maxsize=32, shared=False)
+
+    assert first.session is second.session
+    assert private.session is not first.session
+    adapter = first.session.get_adapter("http://localhost")
+    assert adapter is first.session.get_adapter("https://jsonplaceholder.typicode.com")
+    assert adapter._pool_maxsize == 32
+
+
+def test_pool_resize_leaves_shared_sessions_alone():
+    shared = APIAutomation(pool_maxsize=7)
+    neighbour = APIAutomation(pool_maxsize=7)
+    shared._ensure_pool_size(40)
+
+    assert neighbour.session.get_adapter(BASE_URL)._pool_maxsize == 7
+    assert shared.session is APIAutomation(pool_maxsize=40).session
+
+    private = APIAutomation(pool_maxsize=7, shared=False)
+    old = private.session.get_adapter(BASE_URL)
+    old.poolmanager.connection_from_url(BASE_URL)
+    private._ensure_pool_size(40)
+
+    assert private.session.get_adapter(BASE_URL)._pool_maxsize == 40
+    assert len(old.poolmanager.pools) == 0  # replaced adapter was closed
+
+
+@responses.activate
+def test_cache_serves_repeat_gets_and_invalidates_on_write():
+    responses.add(responses.GET, f"{BASE_URL}/posts/1", json={"id": 1, "title": "Old"}, status=200)
+    responses.add(responses.PUT, f"{BASE_URL}/posts/1", json={"id": 1, "title": "New"}, status=200)
+    api = APIAutomation(cache=ResponseCache())
+
+    assert api.get_posts(1).json()["title"] == "Old"
+    cached = api.get_posts(1)
+    assert cached.from_cache and cached.json()["title"] == "Old"
+    assert len(responses.calls) == 1
+
+    api.update_post(1, "New", "Body", 1)
+    api.get_posts(1)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_cache_keys_include_params_and_headers():
+    responses.add(responses.GET, f"{BASE_URL}/posts", json=[], status=200)
+    api = APIAutomation(cache=ResponseCache())
+
+    api._make_request("GET", f"{BASE_URL}/posts", params={"userId": 1})
+    api._make_request("GET", f"{BASE_URL}/posts", params={"userId": 2})
+    api._make_request("GET", f"{BASE_URL}/posts", params={"userId": 2}, headers={"Accept-Language": "fr"})
+    assert len(responses.calls) == 3
+    assert api._make_request("GET", f"{BASE_URL}/posts", params={"userId": 2}).from_cache
+
+    api.create_post("t", "b", 1)  # invalidates the collection for every params/headers variant
+    api._make_request("GET", f"{BASE_URL}/posts", params={"userId": 2}, headers={"Accept-Language": "fr"})
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_cache_hits_bypass_rate_limiter_and_concurrency_limit():
+    responses.add(responses.GET, f"{BASE_URL}/posts/1", json={"id": 1}, status=200)
+    concurrency = AdaptiveConcurrency(initial=4)
+    api = APIAutomation(shared=False, cache=ResponseCache(), rate_limiter=RateLimiter(host_rate=1, burst=1),
+                        concurrency=concurrency)
+
+    api.get_posts(1)
+    limit = concurrency.limit
+    start = time.perf_counter()
+    for _ in range(3):
+        assert api.get_posts(1).from_cache
+    assert time.perf_counter() - start < 0.5  # no rate-limit token was waited for
+    assert concurrency.limit == limit  # no latency samples from the cache
+    assert len(responses.calls) == 1
+
+
+def test_cache_does_not_store_a_get_that_raced_an_invalidation():
+    cache = ResponseCache()
+    url = f"{BASE_URL}/posts/1"
+
+    def send_during_write(headers):
+        cache.invalidate(url)  # a write to the resource completes while this GET is in flight
+        response = requests.Response()
+        response.status_code, response._content = 200, b'{"title": "Old"}'
+        return response
+
+    cache.fetch(url, send_during_write)
+    assert cache._get(url) is None
+
+
+@responses.activate
+def test_cache_revalidates_with_etag():
+    responses.add(responses.GET, f"{BASE_URL}/posts/1", json={"id": 1}, status=200, headers={"ETag": 'W/"abc"'})
+    responses.add(responses.GET, f"{BASE_URL}/posts/1", status=304)
+    cache = ResponseCache(ttls={r"/posts/\d+$": 0})
+    api = APIAutomation(cache=cache)
+
+    api.get_posts(1)
+    response = api.get_posts(1)
+
+    assert responses.calls[1].request.headers["If-None-Match"] == 'W/"abc"'
+    assert response.status_code == 200 and response.json() == {"id": 1}
+    assert cache.revalidations == 1
+
+
+@responses.activate
+def test_cache_lru_eviction_and_disk_store(tmp_path):
+    for post_id in (1, 2):
+        responses.add(responses.GET, f"{BASE_URL}/posts/{post_id}", json={"id": post_id}, status=200)
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResponseCache(max_entries=1, path=path)
+    api = APIAutomation(cache=cache)
+
+    api.get_posts(1)
+    api.get_posts(2)
+    assert list(cache._entries) == [f"{BASE_URL}/posts/2"]
+    cache.close()
+
+    reopened = APIAutomation(cache=ResponseCache(path=path))
+    assert reopened.get_posts(1).from_cache
+    assert len(responses.calls) == 2
+
+
+def test_cassette_record_then_replay(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    with responses.RequestsMock() as mock:
+        mock.add(responses.GET, f"{BASE_URL}/posts/1", json={"id": 1, "title": "Recorded"}, status=200)
+        mock.add(responses.POST, f"{BASE_URL}/posts", json={"id": 101, "title": "T"}, status=201)
+        recorder = APIAutomation(shared=False)
+        cassette = Cassette(path, mode="record")
+        cassette.install(recorder.session)
+        recorder.get_posts(1)
+        recorder.create_post("T", "B", 1)
+        cassette.save()
+
+    player = APIAutomation(shared=False)
+    Cassette(path, mode="replay").install(player.session)
+
+    assert player.get_posts(1).json()["title"] == "Recorded"
+    assert player.create_post("T", "B", 1).status_code == 201
+    with pytest.raises(CassetteMissError):
+        player.create_post("Other", "B", 1)
+
+
+@pytest.fixture(scope="module")
+def fake_api():
+    with FakeJSONPlaceholder() as server:
+        yield APIAutomation(shared=False, base_url=server.base_url)
+
+
+@pytest.mark.parametrize("post_id, status", [(1, 200), (100, 200), (101, 404), ("abc", 404)])
+def test_fake_server_get_posts(fake_api, post_id, status):
+    response = fake_api.get_posts(post_id)
+
+    assert response.status_code == status
+    assert response.json() == ({} if status == 404 else fake_api.get_posts(post_id).json())
+
+
+def test_fake_server_write_semantics(fake_api):
+    created = fake_api.create_post("Title", "Body", 1)
+    assert created.status_code == 201
+    assert created.json() == {"title": "Title", "body": "Body", "userId": 1, "id": 101}
+
+    assert fake_api.update_post(1, "T", "B", 1).json() == {"title": "T", "body": "B", "userId": 1, "id": 1}
+    assert fake_api.patch_post(1, title="P").json()["title"] == "P"
+    assert fake_api.delete_post(9999).status_code == 200
+    assert len(fake_api.get_post_comments(1).json()) == 5
+    assert fake_api.get_post_comments(9999).json() == []
+
+
+def test_fake_server_rejects_bad_input_with_400(fake_api):
+    start = time.perf_counter()
+    assert fake_api._make_request("GET", f"{fake_api.BASE_URL}/posts?_start=abc").status_code == 400
+    assert fake_api._make_request("GET", f"{fake_api.BASE_URL}/posts?_limit=-1").status_code == 400
+    assert fake_api._make_request("POST", f"{fake_api.BASE_URL}/posts", json=[1, 2]).status_code == 400
+    assert time.perf_counter() - start < 1  # answered, not dropped and retried
+
+
+def test_fake_server_answers_500_on_handler_error(monkeypatch):
+    with FakeJSONPlaceholder() as server:
+        monkeypatch.setattr(server, "route", lambda *args: 1 / 0)
+        response = requests.get(f"{server.base_url}/posts/1")
+    assert response.status_code == 500
+
+
+def test_fake_server_start_reports_bind_errors():
+    with FakeJSONPlaceholder() as server:
+        with pytest.raises(OSError):
+            FakeJSONPlaceholder(port=server.port).start(timeout=5)
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(500, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(990, rel=0.01)
+    assert histogram.percentile(100) == 1000
+
+
+@pytest.fixture
+def load_server():
+    with FakeJSONPlaceholder() as server:
+        calls = []
+        route = server.route
+        server.route = lambda *args: calls.append(args) or route(*args)
+        server.calls = calls
+        yield server
+
+
+@pytest.mark.parametrize("mode", [{"rps": 200}, {"concurrency": 4}])
+def test_load_runner_against_fake_server(load_server, mode):
+    api = APIAutomation(shared=False, base_url=load_server.base_url, coalesce_gets=False)
+    runner = LoadRunner(api, endpoints=["get_posts", "create_post"])
+
+    report = runner.run(duration=0.5, **mode)
+
+    assert report.total_requests > 0
+    assert len(load_server.calls) == report.total_requests  # every counted request reached the server
+    assert {row["endpoint"] for row in report.rows()} == {"get_posts", "create_post"}
+    assert sum(report.errors.values()) == 0
+    if "rps" in mode:
+        assert report.total_requests == pytest.approx(100, abs=2)
+    assert "<table>" in report.to_html()
+
+
+@pytest.mark.parametrize("mode", [{"rps": 0}, {"rps": -5}, {"concurrency": 0}])
+def test_load_runner_rejects_non_positive_load(mode):
+    with pytest.raises(ValueError, match="must be positive"):
+        LoadRunner().run(duration=0.5, **mode)
+
+    with pytest.raises(argparse.ArgumentTypeError, match="greater than 0"):
+        positive(float)(str(next(iter(mode.values()))))
+    assert positive(int)("3") == 3
+
+
+def test_load_runner_refuses_coalescing_clients_and_reports_rejected_calls(load_server):
+    with pytest.raises(ValueError, match="coalesce_gets=False"):
+        LoadRunner(APIAutomation(shared=False, base_url=load_server.base_url))
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure(load_server.base_url)
+    api = APIAutomation(shared=False, base_url=load_server.base_url, coalesce_gets=False, circuit_breaker=breaker)
+
+    report = LoadRunner(api).run(duration=0.2, concurrency=2)
+
+    assert report.total_requests == 0 and load_server.calls == []
+    assert report.rejected["get_posts"] > 0
+    assert report.rows()[0]["rejected"] == report.rejected["get_posts"]
+    assert "rejected by the circuit breaker" in report.summary()
+
+
+def test_request_metrics_hooks(fake_api):
+    seen = []
+    api = APIAutomation(shared=False, base_url=fake_api.BASE_URL)
+    api.add_hook(lambda metrics, response: seen.append(metrics))
+
+    api.get_posts(1)
+    api.get_posts(2)
+    api.get_post_comments(1)
+
+    assert [metrics.endpoint for metrics in seen] == ["/posts/{id}", "/posts/{id}", "/posts/{id}/comments"]
+    assert [metrics.connection_reused for metrics in seen] == [False, True, True]
+    assert seen[0].connect_seconds > 0 and seen[1].connect_seconds == 0
+    assert all(metrics.response_bytes > 0 and metrics.retries == 0 for metrics in seen)
+    assert api.metrics.endpoints["GET /posts/{id}"]["requests"] == 2
+    assert api.metrics.endpoints["GET /posts/{id}"]["pool_hits"] == 1
+    assert "GET /posts/{id}/comments" in api.metrics.summary()
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    start = time.perf_counter()
+    for _ in range(11):
+        bucket.acquire()
+
+    assert time.perf_counter() - start == pytest.approx(0.2, abs=0.05)
+
+
+@responses.activate
+def test_rate_limiter_honors_retry_after():
+    # POST is not retried by urllib3, so the 429 reaches the limiter
+    responses.add(responses.POST, f"{BASE_URL}/posts", status=429, headers={"Retry-After": "0.3"})
+    responses.add(responses.POST, f"{BASE_URL}/posts", json={"id": 101}, status=201)
+    api = APIAutomation(shared=False, rate_limiter=RateLimiter(endpoint_rates={"/posts": 1000}))
+
+    assert api.create_post("T", "B", 1).status_code == 429
+    start = time.perf_counter()
+    assert api.create_post("T", "B", 1).status_code == 201
+    assert time.perf_counter() - start >= 0.25
+
+
+def test_adaptive_concurrency_aimd():
+    controller = AdaptiveConcurrency(initial=4, max_limit=8, latency_target=0.5, cooldown=0)
+
+    for _ in range(40):
+        controller.record(0.01, 200)
+    assert controller.limit == 8
+
+    controller.record(0.01, 503)
+    assert controller.limit == 4
+    controller.record(2.0, 200)
+    assert controller.limit == 2
+
+
+def test_circuit_breaker_fails_fast_on_dead_host():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    api = APIAutomation(shared=False, base_url="http://127.0.0.1:9", circuit_breaker=breaker)
+    api.session.get_adapter("http://").max_retries = Retry(total=0)
+
+    assert api.get_posts(1).status_code == 500
+    assert api.get_posts(1).status_code == 500
+    assert breaker.state(api.BASE_URL) == "open"
+
+    start = time.perf_counter()
+    response = api.get_posts(1)
+
+    assert response.status_code == 500 and response.short_circuited
+    assert time.perf_counter() - start < 0.05
+    assert api.metrics.endpoints["GET /posts/{id}"]["short_circuits"] == 1
+
+
+def test_circuit_breaker_half_open_probe():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    url = f"{BASE_URL}/posts/1"
+
+    breaker.record_failure(url)
+    assert not breaker.allow(url)
+    time.sleep(0.06)
+    assert breaker.allow(url) and not breaker.allow(url)  # a single probe while half open
+    breaker.record_success(url)
+    assert breaker.state(url) == "closed"
+
+
+def test_circuit_breaker_releases_probe_on_unexpected_error(tmp_path):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    api = APIAutomation(shared=False, circuit_breaker=breaker)
+    (tmp_path / "empty.json").write_text('{"interactions": {}}')
+    Cassette(str(tmp_path / "empty.json"), mode="replay").install(api.session)
+    breaker.record_failure(f"{BASE_URL}/posts/1")
+
+    for _ in range(2):  # the second call would be short-circuited if the first kept the probe slot
+        with pytest.raises(CassetteMissError):
+            api.get_posts(1)
+    assert breaker.state(f"{BASE_URL}/posts/1") == "half_open"
+
+
+def test_short_circuited_calls_do_not_spend_rate_limit_tokens():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    limiter = RateLimiter(host_rate=1, burst=1)
+    api = APIAutomation(shared=False, circuit_breaker=breaker, rate_limiter=limiter)
+    breaker.record_failure(f"{BASE_URL}/posts/1")
+
+    start = time.perf_counter()
+    for _ in range(3):
+        assert api.get_posts(1).short_circuited
+    assert time.perf_counter() - start < 0.5
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_json_array_across_chunk_boundaries(chunk_size):
+    document = json.dumps([{"id": 1, "body": "a, [b] é"}, 12345, "x", [1, 2], None, {"nested": {"k": []}}]).encode()
+    chunks = [document[i:i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+    assert list(iter_json_array(chunks)) == json.loads(document)
+
+
+def test_iter_json_array_rejects_truncated_document():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"id": 1}, {"id"']))
+
+
+@pytest.mark.parametrize("document, error", [
+    (b"[1 2]", "Missing ','"), (b'[{"id": 1} {"id": 2}]', "Missing ','"), (b'["a"\n"b"]', "Missing ','"),
+    (b"[,1]", "Unexpected ','"), (b"[1,,2]", "Unexpected ','"), (b"[1,]", "Trailing ','"),
+])
+def test_iter_json_array_rejects_bad_separators(document, error):
+    for chunk_size in (1, len(document)):
+        chunks = [document[i:i + chunk_size] for i in range(0, len(document), chunk_size)]
+        with pytest.raises(ValueError, match=error):
+            list(iter_json_array(chunks))
+
+
+def test_iter_post_comments_streams(fake_api):
+    comments = list(fake_api.iter_post_comments(1, chunk_size=16))
+
+    assert comments == fake_api.get_post_comments(1).json()
+    assert list(fake_api.iter_post_comments(9999)) == []
+
+
+def test_json_backend_is_pluggable():
+    response = requests.Response()
+    response._content = b'{"id": 1}'
+    try:
+        for backend in ("json", json_stream.JSON_BACKEND):
+            json_stream.use_backend(backend)
+            assert json_stream.decode(response) == {"id": 1}
+    finally:
+        json_stream.use_backend(None)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_posts_pages_through_collection(fake_api, prefetch):
+    posts = list(fake_api.iter_posts(page_size=7, prefetch=prefetch))
+
+    assert [post["id"] for post in posts] == list(range(1, 101))
+
+
+def test_iter_comments_prefetches_in_order(fake_api):
+    comments = list(fake_api.iter_comments([3, 1, 9999, 2], prefetch=2))
+
+    assert [comment["postId"] for comment in comments] == [3] * 5 + [1] * 5 + [2] * 5
+
+
+@responses.activate
+def test_concurrent_identical_gets_are_coalesced():
+    calls = []
+
+    def slow_post(request):
+        calls.append(request.url)
+        time.sleep(0.2)
+        return 200, {}, json.dumps({"id": 1})
+
+    responses.add_callback(responses.GET, f"{BASE_URL}/posts/1", callback=slow_post)
+    api = APIAutomation(shared=False)
+    barrier = threading.Barrier(8)
+
+    def fetch(_):
+        barrier.wait()
+        return api.get_posts(1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(fetch, range(8)))
+
+    assert len(calls) == 1
+    assert all(response.json() == {"id": 1} for response in results)
+    assert api.single_flight.coalesced == 7
+    assert api.metrics.endpoints["GET /posts/{id}"]["coalesced"] == 7
+
+    api.get_posts(1)
+    assert len(calls) == 2  # completed calls are not cached
+
+
+def test_bulk_writer_creates_posts_from_jsonl(fake_api, tmp_path):
+    path = tmp_path / "seed.jsonl"
+    path.write_text("\n".join(json.dumps({"title": f"t{n}", "body": "b", "userId": n % 10}) for n in range(200))
+                    + '\n{"title": "missing body"}\n')
+    writer = BulkWriter(fake_api, workers=8, queue_size=16)
+
+    results, failures = writer.write_all(iter_jsonl(path))
+
+    assert len(results) == 201
+    assert failures == 1
+    assert results[-1].error == "Payload missing field 'body'"
+    assert all(result.status_code == 201 for result in results[:200])
+    assert len({result.idempotency_key for result in results}) == 201
+
+
+@responses.activate
+def test_bulk_writer_retries_with_same_idempotency_key():
+    responses.add(responses.POST, f"{BASE_URL}/posts", status=503)
+    responses.add(responses.POST, f"{BASE_URL}/posts", json={"id": 101}, status=201)
+    writer = BulkWriter(APIAutomation(shared=False), workers=1, retry_backoff=0)
+
+    results, failures = writer.write_all([{"title": "t", "body": "b", "userId": 1}])
+
+    assert failures == 0
+    assert results[0].attempts == 2
+    keys = {call.request.headers["Idempotency-Key"] for call in responses.calls}
+    assert keys == {results[0].idempotency_key}
+
+
+@responses.activate
+def test_bulk_writer_reports_bad_items_without_hanging():
+    responses.add(responses.POST, f"{BASE_URL}/posts", body="created", status=201)
+    writer = BulkWriter(APIAutomation(shared=False), workers=2, retry_backoff=0)
+    payload = {"title": "t", "body": "b", "userId": 1}
+
+    results, failures = writer.write_all([["not", "an", "object"], payload, dict(payload)])
+
+    assert failures == 3
+    assert results[0].error == "Payload is not a JSON object: list"
+    assert results[1].error.startswith("JSONDecodeError")
+    assert results[1].idempotency_key != results[2].idempotency_key  # identical payloads are distinct items
+
+
+def test_bulk_writer_reports_unparsable_lines_and_keeps_going(fake_api, tmp_path):
+    path = tmp_path / "seed.jsonl"
+    lines = [json.dumps({"title": f"t{n}", "body": "b", "userId": 1}) for n in range(50)]
+    lines.insert(10, '{"title": "cut off"')
+    path.write_text("\n".join(lines) + "\n")
+
+    results, failures = BulkWriter(fake_api, workers=4, queue_size=4).write_all(iter_jsonl(path))
+
+    assert len(results) == 51 and failures == 1
+    assert results[10].error.startswith("Invalid JSON on line 11:")
+    assert sum(result.status_code == 201 for result in results) == 50
+
+
+def test_bulk_writer_reports_items_in_flight_before_an_input_error(fake_api):
+    def payloads():
+        for n in range(20):
+            yield {"title": f"t{n}", "body": "b", "userId": 1}
+        raise OSError("disk went away")
+
+    reported = []
+    with pytest.raises(OSError, match="disk went away"):
+        for result in BulkWriter(fake_api, workers=4, queue_size=4).write(payloads()):
+            reported.append(result)
+
+    assert sorted(result.index for result in reported) == list(range(20))
+
+
+@responses.activate
+def test_bulk_writer_does_not_stack_retries_on_transport_retries():
+    responses.add(responses.PUT, f"{BASE_URL}/posts/1", status=503)
+    writer = BulkWriter(APIAutomation(shared=False), operation="update", workers=1, retry_backoff=0)
+
+    results, failures = writer.write_all([{"id": 1, "title": "t", "body": "b", "userId": 1}])
+
+    assert failures == 1
+    assert results[0].attempts == 1
+    assert len(responses.calls) == 4  # the adapter's Retry(total=3) only
+
+
+@responses.activate
+def test_gets_with_different_arguments_are_not_coalesced():
+    def slow_echo(request):
+        time.sleep(0.2)
+        return 200, {}, json.dumps({"url": request.url})
+
+    responses.add_callback(responses.GET, f"{BASE_URL}/posts", callback=slow_echo)
+    api = APIAutomation(shared=False)
+    variants = [{"params": {"userId": 1}}, {"params": {"userId": 2}}, {"params": {"userId": 1}, "timeout": 5},
+                {"params": {"userId": 1}, "auth": requests.auth.HTTPBasicAuth("user", "secret")},
+                {"params": {"userId": 1}, "stream": True}]
+    barrier = threading.Barrier(len(variants))
+
+    def fetch(kwargs):
+        barrier.wait()
+        return api._make_request("GET", f"{BASE_URL}/posts", **kwargs)
+
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        results = list(executor.map(fetch, variants))
+
+    assert len(responses.calls) == len(variants)
+    assert api.single_flight.coalesced == 0
+    assert results[1].json()["url"].endswith("userId=2")
@@ -0,0 +1,129 @@
+import os
+import sys
+import uuid
+import pytest
+from utils.logger_util import Logger
+from utils.step_timer import instrument, record_test, load_records, hotspots, format_hotspots
+from utils.test_durations import SHARD_GROUP, base_nodeid, load_durations, update_durations, estimate, plan_shards
+
+_observed_durations = {}  # nodeid -> seconds spent in setup, call and teardown during this run
+_skipped = set()
+
+
+def _xdist_controller(config):
+    """True on the controller process of a pytest-xdist run with workers."""
+    return (not hasattr(config, "workerinput") and config.pluginmanager.hasplugin("xdist")
+            and bool(config.getoption("numprocesses", default=None)))
+
+
+def pytest_configure(config):
+    """Sends worker logs to the controller when the suite runs under pytest-xdist."""
+    # Set before xdist starts workers, so every process tags its step timings with the same run
+    os.environ.setdefault("STEP_TIMING_RUN_ID", uuid.uuid4().hex[:12])
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None and "log_aggregator" in workerinput:
+        os.environ["LOG_AGGREGATOR"] = workerinput["log_aggregator"]
+    elif _xdist_controller(config):
+        config._log_aggregator = Logger.start_aggregator()
+
+
+def pytest_sessionstart(session):
+    """Starts launching pooled browsers while tests are being collected."""
+    if int(os.environ.get("BROWSER_POOL_SIZE", 0)) and not _xdist_controller(session.config):
+        from utils.browser_pool import BrowserPool
+        BrowserPool.shared()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Passes the controller's log aggregator address to each xdist worker."""
+    aggregator = getattr(node.config, "_log_aggregator", None)
+    if aggregator is not None:
+        node.workerinput["log_aggregator"] = aggregator.address
+
+
+def pytest_itemcollected(item):
+    """Tags browser scenarios, so only their durations feed the shard plan (not tests/unit)."""
+    if hasattr(getattr(item, "cls", None), "click"):  # SeleniumBase BaseCase subclass
+        item.user_properties.append(("scenario", True))
+
+
+@pytest.hookimpl(tryfirst=True)  # before xdist turns the groups into node id suffixes
+def pytest_collection_modifyitems(config, items):
+    """
+    Shards the tests across xdist workers by their recorded durations (with --dist loadgroup).
+
+    Every worker collects the same items and reads the same durations file, so each one
+    computes the same longest-first plan; loadgroup then runs each shard on its own worker.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None or not config.getoption("loadgroup", default=False):  # xdist sets it on workers
+        return
+    unassigned = [item for item in items if item.get_closest_marker("xdist_group") is None]
+    expected = estimate(load_durations(), [item.nodeid for item in unassigned])
+    plan = plan_shards(expected, int(workerinput["workercount"]))
+    shard_of = {nodeid: index for index, (nodeids, _) in enumerate(plan) for nodeid in nodeids}
+    for item in unassigned:
+        item.add_marker(pytest.mark.xdist_group(f"{SHARD_GROUP}{shard_of[item.nodeid]}"))
+
+
+def pytest_runtest_logreport(report):
+    """Adds up how long each browser scenario took, as seen by the controller (or the only process)."""
+    if not dict(report.user_properties).get("scenario"):
+        return
+    nodeid = base_nodeid(report.nodeid)
+    _observed_durations[nodeid] = _observed_durations.get(nodeid, 0.0) + report.duration
+    if report.skipped:
+        _skipped.add(nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Times every SeleniumBase call and page-object step of the test and records its timing tree."""
+    test = getattr(item, "_testcase", None) or getattr(item, "instance", None)
+    if test is None or not hasattr(test, "click"):
+        yield
+        return
+    timer = instrument(test)
+    yield
+    record_test(item.nodeid, timer, run_id=os.environ["STEP_TIMING_RUN_ID"])
+    logger = Logger().get_logger()
+    logger.info("Step timings for %s:\n%s", item.nodeid, "\n".join(timer.render()))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Saves test durations for the next run's shard plan and this process's locator statistics."""
+    if not hasattr(session.config, "workerinput"):
+        update_durations({nodeid: seconds for nodeid, seconds in _observed_durations.items()
+                          if nodeid not in _skipped})
+    registry = sys.modules.get("utils.locator_registry")
+    if registry is not None:
+        registry.LOCATORS.dump(run_id=os.environ["STEP_TIMING_RUN_ID"])
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Prints the slowest page-object steps and locators of this run."""
+    run_id = os.environ.get("STEP_TIMING_RUN_ID")
+    rows = hotspots(load_records(run_id=run_id))
+    if rows:
+        terminalreporter.section("Step hotspots")
+        for line in format_hotspots(rows, top=15):
+            terminalreporter.write_line(line)
+    if "utils.locator_registry" in sys.modules or _xdist_controller(terminalreporter.config):
+        from utils.locator_registry import load_stats, format_slowest
+        stats = load_stats(run_id=run_id)
+        if stats:
+            terminalreporter.section("Slowest locators")
+            for line in format_slowest(stats):
+                terminalreporter.write_line(line)
+
+
+def pytest_unconfigure(config):
+    """Quits pooled browsers, collects the remaining worker logs, then flushes the background log writer."""
+    browser_pool = sys.modules.get("utils.browser_pool")
+    if browser_pool is not None and browser_pool.BrowserPool._shared is not None:
+        browser_pool.BrowserPool._shared.shutdown()
+    aggregator = getattr(config, "_log_aggregator", None)
+    if aggregator is not None:
+        aggregator.stop()
+    Logger.shutdown()
@@ -3,6 +3,9 @@
 import os
 from seleniumbase import BaseCase
 from utils.logger_util import Logger
+from utils.step_timer import timed_step
+from pages.locators import locator
+from utils.smart_wait import SmartWait, GENERATION_TIMEOUT
 
 class AutoGeneratorPage:
     """
@@ -11,6 +14,21 @@ class AutoGeneratorPage:
     This class provides methods to interact with the Auto Generator, including selecting suggestions,
     generating slides, adding slides to favorites, and downloading slides.
     """
+    # Locators (compiled once in pages/locators.py; CSS preferred over XPath)
+    suggestion_box = locator("auto_generator.suggestion_box")
+    third_suggestion = locator("auto_generator.third_suggestion")
+    generate_button = locator("auto_generator.generate_button")
+    generation_completion = locator("auto_generator.generation_completion")
+    favorite_button = locator("auto_generator.favorite_button")
+    download_button = locator("auto_generator.download_button")
+    modal_container = locator("auto_generator.modal_container")
+    modal_input = locator("auto_generator.modal_input")
+    modal_add_button = locator("auto_generator.modal_add_button")
+    download_confirm_button = locator("auto_generator.download_confirm_button")
+    download_option = locator("auto_generator.download_option")
+    verify_download_message = locator("auto_generator.verify_download_message")
+    download_modal_input = locator("auto_generator.modal_input")
+
     def __init__(self, test: BaseCase, file_name):
         """
         Initializes the AutoGeneratorPage with SeleniumBase test instance.
@@ -22,26 +40,9 @@ class AutoGeneratorPage:
         self.test = test
         self.file_name = file_name
         self.logger = Logger().get_logger()  # Use the singleton logger
+        self.waits = SmartWait(test)  # Event-driven waits instead of fixed sleeps
 
-        # Locators
-        self.suggestion_box = "textarea[data-pendo-id='generate-propmt']"
-        self.third_suggestion = "#generate-suggested-2"
-        self.generate_button = "button[data-pendo-id='generate-btn']"
-        self.generation_completion = "div.change-layout-container"
-        self.favorite_button = "button#favorite"
-        self.download_button = "button#download"
-
-        # Add to Favorites Modal Elements
-        self.modal_container = ".generateActionModalContainer"
-        self.modal_input = "(//div[@class='v-text-field__slot'])[2]/input"
-        self.modal_add_button = "button.primaryBtn"
-
-        # Download Modal Elements
-        self.download_modal_input = "(//div[@class='v-text-field__slot'])[2]/input"
-        self.download_confirm_button = "//button[@data-pendo-id='download-cta']"
-        self.download_option = "button#download-btn-from-list"
-        self.verify_download_message = "//span[normalize-space()='Download Completed']"
-
+    @timed_step
     def assert_auto_generator_page_opened(self):
         """
         Asserts that the Auto Generator Page is loaded successfully.
@@ -62,6 +63,7 @@ class AutoGeneratorPage:
             self.test.save_screenshot("logs/auto_generator_load_failure.png")
             raise
 
+    @timed_step
     def select_third_suggestion(self):
         """
         Selects the 3rd suggested item from the dropdown.
@@ -77,8 +79,7 @@ class AutoGeneratorPage:
         try:
             self.logger.info("Selecting 3rd suggestion from dropdown")
             self.test.click(self.suggestion_box)
-            self.test.sleep(1)  # Allow time for dropdown
-            self.test.wait_for_element_visible(self.third_suggestion, timeout=5)
+            self.waits.visible(self.third_suggestion, timeout=5)  # Continues as soon as the dropdown renders
             self.test.click(self.third_suggestion)
             self.logger.info("3rd suggestion selected successfully")
         except Exception as e:
@@ -86,6 +87,7 @@ class AutoGeneratorPage:
             self.test.save_screenshot("logs/select_suggestion_failure.png")
             raise
 
+    @timed_step
     def generate_slide(self):
         """
         Generates a slide by clicking the "Generate" button and waiting for completion.
@@ -100,7 +102,7 @@ class AutoGeneratorPage:
         try:
             self.logger.info("Generating slide...")
             self.test.click(self.generate_button)
-            self.test.wait_for_element_visible(self.generation_completion, timeout=999)
+            self.waits.visible(self.generation_completion, timeout=GENERATION_TIMEOUT)
             assert self.test.is_element_visible(self.generation_completion), "Slide generation failed!"
             self.logger.info("Slide generated successfully")
         except Exception as e:
@@ -108,6 +110,7 @@ class AutoGeneratorPage:
             self.test.save_screenshot("logs/generate_slide_failure.png")
             raise
 
+    @timed_step
     def add_to_favorites(self):
         """
         Adds a generated slide to favorites, handling the modal popup.
@@ -139,6 +142,7 @@ class AutoGeneratorPage:
             self.test.save_screenshot("logs/add_favorite_failure.png")
             raise
 
+    @timed_step
     def download_slide(self):
         """
         Initiates the slide download, handling the modal popup.
@@ -175,6 +179,7 @@ class AutoGeneratorPage:
             self.test.save_screenshot("logs/download_failure.png")
             raise
 
+    @timed_step
     def verify_download(self):
         """
         Verifies that the downloaded file exists in the default downloads folder.
@@ -186,4 +191,4 @@ class AutoGeneratorPage:
             Exception: If the downloaded file is not found.
         """
         self.test.assert_downloaded_file(self.file_name+".pptx")
-        self.logger.info(f"Download verified: {self.file_name+".pptx"}")
+        self.logger.info(f"Download verified: {self.file_name}.pptx")
@@ -2,6 +2,8 @@
 import logging
 from seleniumbase import BaseCase
 from utils.logger_util import Logger
+from utils.step_timer import timed_step
+from pages.locators import locator
 
 class DashboardPage:
     """
@@ -10,6 +12,15 @@ class DashboardPage:
     This class provides navigation methods to different sections of the dashboard,
     including Templates, Slide Library, and Auto Generator.
     """
+    # Locators (compiled once in pages/locators.py; CSS preferred over XPath)
+    profile_icon = locator("dashboard.profile_icon")  # Profile icon for accessing templates
+    templates_tab = locator("dashboard.templates_tab")
+    slide_library_tab = locator("dashboard.slide_library_tab")
+    auto_generator_tab = locator("dashboard.auto_generator_tab")
+    templates_section = locator("dashboard.templates_section")
+    slide_library_section = locator("dashboard.slide_library_section")
+    auto_generator_section = locator("dashboard.auto_generator_section")
+
     def __init__(self, test: BaseCase):
         """
         Initializes the DashboardPage with SeleniumBase test instance.
@@ -21,18 +32,7 @@ class DashboardPage:
 
         self.logger = Logger().get_logger()  # Use the singleton logger
 
-
-        # Locators
-        self.profile_icon = "div.profile-user-avatar"  # Profile icon for accessing templates
-        self.templates_tab = "a#templates-tab"
-        self.slide_library_tab = "div#v-step-1"
-        self.auto_generator_tab = "div#v-step-3"
-        
-        # Unique elements that confirm page has loaded
-        self.templates_section = "div.pt-header__title"
-        self.slide_library_section = "input#slide-library-search"
-        self.auto_generator_section = "button[data-pendo-id='generate-btn']"
-
+    @timed_step
     def go_to_templates(self):
         """
         Navigates to the Templates section.
@@ -61,6 +61,7 @@ class DashboardPage:
             raise
 
 
+    @timed_step
     def go_to_slide_library(self):
         """
         Navigates to the Slide Library section.
@@ -88,6 +89,7 @@ class DashboardPage:
             self.test.save_screenshot("logs/slide_library_navigation_failure.png")
             raise
 
+    @timed_step
     def go_to_auto_generator(self):
         """
         Navigates to the Auto Generator section.
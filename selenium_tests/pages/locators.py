@@ -0,0 +1,69 @@
+#locators.py
+"""
+Every page-object locator, registered once per process.
+
+Candidates are listed fastest first: a CSS selector wherever CSS can express the same match,
+followed by the original XPath as a fallback. Positional and text XPaths that CSS cannot
+express stay XPath-only.
+"""
+from utils.locator_registry import LOCATORS, locator
+
+TEMPLATE_CARD_CLASS = "pt-list__item pt-card pt-list__item v-card v-sheet theme--light"
+
+# Login
+LOCATORS.register("login.email_field", "input#username")
+LOCATORS.register("login.continue_button", "button#continue")
+LOCATORS.register("login.password_field", "input#password")
+LOCATORS.register("login.login_button", "button#submit")
+LOCATORS.register("login.dashboard_element", "span[data-v-194b5dfe]")  # Element visible after login
+LOCATORS.register("login.logout_button", "button.log-out-button")
+
+# Dashboard
+LOCATORS.register("dashboard.profile_icon", "div.profile-user-avatar")
+LOCATORS.register("dashboard.templates_tab", "a#templates-tab")
+LOCATORS.register("dashboard.slide_library_tab", "div#v-step-1")
+LOCATORS.register("dashboard.auto_generator_tab", "div#v-step-3")
+LOCATORS.register("dashboard.templates_section", "div.pt-header__title")
+LOCATORS.register("dashboard.slide_library_section", "input#slide-library-search")
+LOCATORS.register("dashboard.auto_generator_section", "button[data-pendo-id='generate-btn']")
+
+# Templates
+LOCATORS.register("templates.header", "div.pt-header__title")
+LOCATORS.register("templates.card",
+                  f"div[class='{TEMPLATE_CARD_CLASS}']",
+                  f"//div[@class='{TEMPLATE_CARD_CLASS}']")
+LOCATORS.register("templates.active_template_name",
+                  f"(//div[@class='{TEMPLATE_CARD_CLASS}'])[1]/div[2]/descendant::*[3]")
+LOCATORS.register("templates.card_name", "./div[2]/descendant::*[3]")  # Relative to a template card
+# Relative to a template card: matches the card itself when it is the one active_template_name reads from
+LOCATORS.register("templates.is_active_card",
+                  f"./self::div[@class='{TEMPLATE_CARD_CLASS}'][not(preceding::div[@class='{TEMPLATE_CARD_CLASS}'])]")
+
+# Slide Library
+LOCATORS.register("slide_library.search_bar", "input#slide-library-search")
+LOCATORS.register("slide_library.all_slides",
+                  "div[class*='slide-wrapper']",
+                  "(//div[contains(@class, 'slide-wrapper')])")
+LOCATORS.register("slide_library.unfavorited_heart",
+                  "(//div[contains(@class, 'slide-wrapper')])[{index}]/descendant::*[2]/div[3]/div[1]/descendant::*[7]")
+LOCATORS.register("slide_library.favorited_heart",
+                  "button[class*='mdi-heart'][class*='primary--text']",
+                  "(//button[contains(@class, 'mdi-heart') and contains(@class, 'primary--text')])")
+
+# Auto Generator
+LOCATORS.register("auto_generator.suggestion_box", "textarea[data-pendo-id='generate-propmt']")
+LOCATORS.register("auto_generator.third_suggestion", "#generate-suggested-2")
+LOCATORS.register("auto_generator.generate_button", "button[data-pendo-id='generate-btn']")
+LOCATORS.register("auto_generator.generation_completion", "div.change-layout-container")
+LOCATORS.register("auto_generator.favorite_button", "button#favorite")
+LOCATORS.register("auto_generator.download_button", "button#download")
+LOCATORS.register("auto_generator.modal_container", ".generateActionModalContainer")
+LOCATORS.register("auto_generator.modal_input", "(//div[@class='v-text-field__slot'])[2]/input")
+LOCATORS.register("auto_generator.modal_add_button", "button.primaryBtn")
+LOCATORS.register("auto_generator.download_confirm_button",
+                  "button[data-pendo-id='download-cta']",
+                  "//button[@data-pendo-id='download-cta']")
+LOCATORS.register("auto_generator.download_option", "button#download-btn-from-list")
+LOCATORS.register("auto_generator.verify_download_message", "//span[normalize-space()='Download Completed']")
+
+__all__ = ["LOCATORS", "locator"]
@@ -3,6 +3,10 @@
 import logging
 from seleniumbase import BaseCase
 from utils.logger_util import Logger
+from utils.step_timer import timed_step
+from pages.locators import locator
+from utils.smart_wait import SmartWait
+from utils.session_cache import SessionCache, SESSION_RESTORE_TIMEOUT
 from config import USERNAME, PASSWORD, URL
 
 class LoginPage:
@@ -11,6 +15,15 @@ class LoginPage:
     
     This class handles user login, logout, and login validation using SeleniumBase framework.
     """
+    # Locators (compiled once in pages/locators.py; CSS preferred over XPath)
+    email_field = locator("login.email_field")  # Email input field
+    continue_button = locator("login.continue_button")  # Continue button
+    password_field = locator("login.password_field")  # Password input field
+    login_button = locator("login.login_button")  # Login button
+    dashboard_element = locator("login.dashboard_element")  # Element visible after login
+    profile_icon = locator("dashboard.profile_icon")  # Profile icon for logout
+    logout_button = locator("login.logout_button")  # Logout button
+
     def __init__(self, test: BaseCase, username=USERNAME, password=PASSWORD):
         """
         Initializes the LoginPage with SeleniumBase test instance.
@@ -26,18 +39,53 @@ class LoginPage:
         self.password = password
         
         self.logger = Logger().get_logger()  # Use the singleton logger
+        self.waits = SmartWait(test)  # Event-driven waits instead of fixed sleeps
+        self.session_cache = SessionCache()  # Saved login state, reused across tests
 
-        # Locators
-        self.email_field = "input#username"  # Email input field
-        self.continue_button = "button#continue"  # Continue button
-        self.password_field = "input#password"  # Password input field
-        self.login_button = "button#submit"  # Login button
-        self.dashboard_element = "span[data-v-194b5dfe]"  # Element visible after login
-        self.profile_icon = "div.profile-user-avatar"  # Profile icon for logout
-        self.logout_button = "button.log-out-button"  # Logout button
+    @timed_step
+    def login(self):
+        """
+        Logs in, restoring a cached session when possible.
 
+        Steps:
+        1. Restore saved cookies/localStorage and verify the dashboard is visible.
+        2. If there is no usable saved session, log in through the UI and save the new session.
 
-    def login(self):
+        Raises:
+            Exception: If login fails, an error is logged and a screenshot is taken.
+        """
+        if self.restore_session():
+            return
+        self.login_via_ui()
+        self.session_cache.save(self.test, self.username)
+
+    @timed_step
+    def restore_session(self):
+        """
+        Restores the cached session for this user into the browser.
+
+        Returns:
+            bool: True if the dashboard is visible after the restore, False if the UI login is needed.
+        """
+        state = self.session_cache.load(self.username)
+        if state is None:
+            return False
+        try:
+            self.logger.info("Restoring saved session for: %s", self.username)
+            self.session_cache.restore(self.test, state)
+            self.test.wait_for_element_visible(self.dashboard_element, timeout=SESSION_RESTORE_TIMEOUT)
+        except Exception as e:
+            self.logger.info("Saved session is stale, logging in through the UI: %s", e)
+            self.session_cache.record_restore(state, False)
+            self.test.delete_all_cookies()
+            self.test.execute_script("localStorage.clear();")
+            return False
+        self.session_cache.record_restore(state, True)
+        self.logger.info("Login successful (session restored)!")
+        return True
+
+    @timed_step
+    def login_via_ui(self):
         """
         Handles the login process with necessary validations.
 
@@ -60,10 +108,10 @@ class LoginPage:
             # Step 1: Enter Email & Click Continue
             self.logger.info("Entering username: %s", self.username)
             self.test.type(self.email_field, self.username)
-            self.test.wait(1)  # Ensure the input event triggers
 
-            # Check if the Continue button is enabled
+            # Continue is enabled by the input event; proceed as soon as it is
             self.logger.info("Clicking 'Continue' button")
+            self.waits.enabled(self.continue_button, timeout=5)
             assert self.test.is_element_enabled(self.continue_button), "Continue button is not enabled!"
             self.test.click(self.continue_button)
 
@@ -75,6 +123,7 @@ class LoginPage:
             self.test.type(self.password_field, self.password)
 
             # Check if the Log in button is enabled
+            self.waits.enabled(self.login_button, timeout=5)
             assert self.test.is_element_enabled(self.login_button), "Login button is not enabled!"
             self.logger.info("Clicking 'Login' button")
             self.test.click(self.login_button)
@@ -88,6 +137,7 @@ class LoginPage:
             self.test.save_screenshot("logs/login_failure.png")  # Captures a screenshot for debugging
             raise
 
+    @timed_step
     def is_login_successful(self):
         """
         Verifies login success by checking if the dashboard is visible.
@@ -99,6 +149,7 @@ class LoginPage:
         self.logger.info("Login success check: %s", success)
         return success
 
+    @timed_step
     def logout(self):
         """
         Logs out from the application and verifies successful logout.
@@ -121,6 +172,7 @@ class LoginPage:
             # Verify user is logged out
             self.test.wait_for_element_visible(self.email_field, timeout=10)  
             self.test.assert_element(self.email_field, by="css selector", timeout=10)
+            self.session_cache.mark_logged_out(self.username)
             self.logger.info("Logout successful!")
         except Exception as e:
             self.logger.error("Logout failed! Error: %s", e)
@@ -2,6 +2,9 @@
 
 from seleniumbase import BaseCase
 from utils.logger_util import Logger
+from utils.step_timer import timed_step
+from pages.locators import locator
+from utils.smart_wait import SmartWait
 
 class SlideLibraryPage:
     """
@@ -10,6 +13,12 @@ class SlideLibraryPage:
     This class provides methods to interact with the Slide Library, such as verifying page load,
     adding slides to favorites, and asserting that slides have been favorited successfully.
     """
+    # Locators (compiled once in pages/locators.py; CSS preferred over XPath)
+    search_bar = locator("slide_library.search_bar")
+    all_slides_locator = locator("slide_library.all_slides")
+    unfavorited_heart_locator = locator("slide_library.unfavorited_heart")
+    favorited_heart_locator = locator("slide_library.favorited_heart")
+
     def __init__(self, test: BaseCase):
         """
         Initializes the SlideLibraryPage with SeleniumBase test instance.
@@ -20,13 +29,9 @@ class SlideLibraryPage:
         self.test = test
 
         self.logger = Logger().get_logger()  # Use the singleton logger
+        self.waits = SmartWait(test)  # Event-driven waits instead of fixed sleeps
 
-        # Locators
-        self.search_bar = "input#slide-library-search"
-        self.all_slides_locator = "(//div[contains(@class, 'slide-wrapper')])"
-        self.unfavorited_heart_locator = "(//div[contains(@class, 'slide-wrapper')])[{index}]/descendant::*[2]/div[3]/div[1]/descendant::*[7]"
-        self.favorited_heart_locator = "(//button[contains(@class, 'mdi-heart') and contains(@class, 'primary--text')])"
-
+    @timed_step
     def verify_slide_library_loaded(self):
         """
         Verifies if the Slide Library page has successfully loaded.
@@ -49,6 +54,7 @@ class SlideLibraryPage:
             self.test.save_screenshot("logs/slide_library_load_failure.png")
             raise
 
+    @timed_step
     def add_slide_to_favorites(self, slide_index):
         """
         Adds a slide to favorites by clicking the heart icon.
@@ -73,8 +79,9 @@ class SlideLibraryPage:
             assert len(slides) >= slide_index, f"Slide index {slide_index} out of range!"
 
             heart_button = self.unfavorited_heart_locator.format(index=slide_index)
+            self.waits.arm()  # Track the favorite request the click is about to send
             self.test.click(heart_button)
-            self.test.sleep(2)  # Allow time for the UI update
+            self.waits.idle(quiet=0.3, timeout=10)  # Favorite request finished and the UI settled
 
             self.logger.info("Successfully clicked on Favorite button for slide %d", slide_index)
 
@@ -83,6 +90,7 @@ class SlideLibraryPage:
             self.test.save_screenshot("logs/add_favorite_failure.png")
             raise
 
+    @timed_step
     def assert_slide_favorited(self, slide_index=2):
         """
         Asserts that a slide has been successfully favorited.
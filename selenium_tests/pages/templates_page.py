@@ -2,18 +2,24 @@
 
 from seleniumbase import BaseCase
 from utils.logger_util import Logger
+from utils.step_timer import timed_step
+from pages.locators import locator
+from utils.dom_batch import extract
 
 class TemplatesPage:
+    # Locators (compiled once in pages/locators.py; CSS preferred over XPath)
+    templates_header = locator("templates.header")  # Templates section title
+    template_list = locator("templates.card")  # Template elements
+    active_template_name = locator("templates.active_template_name")
+    template_name = locator("templates.card_name")  # Name element, relative to a template card
+    is_active_card = locator("templates.is_active_card")  # Matches the card root of the active template
+
     def __init__(self, test: BaseCase):
         """Initialize the TemplatesPage with SeleniumBase test instance"""
         self.test = test
         self.logger = Logger().get_logger()  # Use the singleton logger
 
-        # Locators
-        self.templates_header = "div.pt-header__title"  # Templates section title
-        self.template_list = "//div[@class='pt-list__item pt-card pt-list__item v-card v-sheet theme--light']"  # Template elements
-        self.active_template_name = "(//div[@class='pt-list__item pt-card pt-list__item v-card v-sheet theme--light'])[1]/div[2]/descendant::*[3]"
-
+    @timed_step
     def verify_templates_page_loaded(self):
         """Checks if Templates section is visible with assertions and logging"""
         try:
@@ -27,44 +33,62 @@ class TemplatesPage:
             raise
 
 
-    def get_templates_list(self):
-        """Fetches the first five templates, sorts them alphabetically, and logs them"""
+    @timed_step
+    def get_templates_list(self, limit=5):
+        """Fetches the first `limit` templates in one round-trip, sorts them alphabetically, logs and returns them"""
         try:
-            self.logger.info("Fetching list of first five templates")
+            self.logger.info("Fetching list of first %d templates", limit)
 
-            templates = self.test.find_elements(self.template_list)
+            templates = self.get_template_cards(limit)
             assert templates, "No templates found on the page"
 
-            template_names = []
-
-            for i in range(min(5, len(templates))):  
-                ele_xpath = f"(//div[@class='pt-list__item pt-card pt-list__item v-card v-sheet theme--light'])[{i+1}]/div[2]/descendant::*[3]"
-                ele_text = self.test.get_text(ele_xpath).strip()
-                template_names.append(ele_text)
-
-            template_names.sort()
+            template_names = sorted(template["name"] for template in templates)
 
-            self.logger.info("First five templates in alphabetical order: %s", template_names)
-            print("\nFirst five templates in alphabetical order:")
+            self.logger.info("First %d templates in alphabetical order: %s", len(template_names), template_names)
+            print(f"\nFirst {len(template_names)} templates in alphabetical order:")
             for template in template_names:
                 print(f"- {template}")
+            return template_names
 
         except Exception as e:
             self.logger.error("Error fetching templates list: %s", e)
             self.test.save_screenshot("logs/templates_list_failure.png")
             raise
 
+    @timed_step
     def get_active_template(self):
         """Identifies and prints the currently active template with logging"""
         try:
             self.logger.info("Fetching the currently active template")
-            assert self.test.is_element_visible(self.active_template_name), "Active template not found"
+            # Only the first card can be the active one, so there is no need to read the rest
+            active = [card for card in self.get_template_cards(limit=1) if card["active"]]
+            assert active, "Active template not found"
 
-            active_template = self.test.get_text(self.active_template_name).strip()
+            active_template = active[0]["name"]
             self.logger.info("Current active template: %s", active_template)
             print(f"\nCurrent active template: {active_template}")
 
         except Exception as e:
             self.logger.error("Error identifying active template: %s", e)
             self.test.save_screenshot("logs/active_template_failure.png")
-            raise
\ No newline at end of file
+            raise
+
+    @timed_step
+    def get_template_cards(self, limit=None):
+        """
+        Collects name, rank and active flag of the template cards with a single execute_script call.
+
+        Args:
+            limit (int, optional): Number of cards to read from the top. Defaults to all.
+
+        Returns:
+            list: Dicts with "rank", "name" and "active". "active" is True only for the card root
+            that active_template_name reads from; no card is active if none matches.
+        """
+        cards, total = extract(self.test, self.template_list, {
+            "name": (self.template_name, "text"),
+            "active": (self.is_active_card, "exists"),
+        }, limit=limit)
+        self.logger.info("Read %d of %d template cards, active: %s", len(cards), total,
+                         next((card["name"] for card in cards if card["active"]), "none"))
+        return cards
@@ -1,11 +1,11 @@
 import logging
-from seleniumbase import BaseCase
+from utils.browser_pool import PooledBaseCase
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.auto_generator_page import AutoGeneratorPage
 from utils.logger_util import Logger  # Reusable logger
 
-class TestAutoGenerator(BaseCase):
+class TestAutoGenerator(PooledBaseCase):
     """
     Test Suite for verifying the Auto Generator workflow.
     """
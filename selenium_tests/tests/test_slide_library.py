@@ -1,11 +1,11 @@
 import logging
-from seleniumbase import BaseCase
+from utils.browser_pool import PooledBaseCase
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.slide_library_page import SlideLibraryPage
 from utils.logger_util import Logger  # Reusable logger
 
-class TestSlideLibrary(BaseCase):
+class TestSlideLibrary(PooledBaseCase):
     """
     Test Suite for verifying the Slide Library functionality.
     """
@@ -1,10 +1,10 @@
-from seleniumbase import BaseCase
+from utils.browser_pool import PooledBaseCase
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.templates_page import TemplatesPage
 from utils.logger_util import Logger  
 
-class TestTemplates(BaseCase):
+class TestTemplates(PooledBaseCase):
     """
     Test Suite for verifying the Templates functionality.
     """
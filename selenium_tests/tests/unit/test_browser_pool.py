@@ -0,0 +1,137 @@
+import itertools
+import types
+from utils import browser_pool
+from utils.browser_pool import BrowserPool, PooledBaseCase
+
+
+class StubDriver:
+    """Records the calls BrowserPool makes; `alive=False` makes every call fail like a crashed browser."""
+    ids = itertools.count()
+
+    def __init__(self):
+        self.id = next(self.ids)
+        self.alive = True
+        self.window_handles = ["main"]
+        self.calls = []
+        self.quit_called = False
+        self.switch_to = self
+        self.timeouts = types.SimpleNamespace(implicit_wait=0)
+
+    def _check(self, call):
+        if not self.alive:
+            raise RuntimeError("browser is gone")
+        self.calls.append(call)
+
+    def window(self, handle):
+        self._check(f"switch:{handle}")
+
+    def close(self):
+        self._check("close")
+        self.window_handles.pop()
+
+    def execute_script(self, script):
+        self._check("script")
+        return "complete"
+
+    def delete_all_cookies(self):
+        self._check("delete_all_cookies")
+
+    def get(self, url):
+        self._check(f"get:{url}")
+
+    def quit(self):
+        self.quit_called = True
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+
+def make_pool(size=1, max_uses=3):
+    launched = []
+
+    def factory():
+        launched.append(StubDriver())
+        return launched[-1]
+
+    return BrowserPool(size, max_uses=max_uses, factory=factory, base_url="https://example.com"), launched
+
+
+def test_released_driver_is_reset_and_handed_out_again():
+    pool, launched = make_pool()
+    pool.warm()
+
+    driver = pool.acquire()
+    driver.window_handles.append("popup")
+    pool.release(driver)
+
+    assert pool.acquire() is driver
+    assert len(launched) == 1 and not driver.quit_called
+    assert driver.window_handles == ["main"]
+    assert {"close", "delete_all_cookies", "get:https://example.com"} <= set(driver.calls)
+
+
+def test_driver_is_recycled_after_max_uses():
+    pool, launched = make_pool(max_uses=2)
+    pool.warm()
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)  # second use: quit and replaced in the background
+
+    replacement = pool.acquire()
+    assert first.quit_called
+    assert replacement is launched[1] and replacement is not first
+
+
+def test_unhealthy_driver_is_replaced_on_acquire():
+    pool, launched = make_pool()
+    pool.warm()
+    driver = pool.acquire()
+    pool.release(driver)
+    driver.alive = False
+
+    replacement = pool.acquire()
+
+    assert replacement is not driver and driver.quit_called
+    assert len(launched) == 2
+
+
+def test_failed_reset_recycles_and_shutdown_quits_everything():
+    pool, launched = make_pool(size=2)
+    pool.warm()
+    first, second = pool.acquire(), pool.acquire()
+    first.alive = False
+
+    pool.release(first)
+    pool.release(second)
+    held = {pool.acquire(), pool.acquire()}  # the second one waits for the driver launched in place of the broken one
+    pool.shutdown()
+
+    assert len(launched) == 3 and held == {second, launched[2]}
+    assert all(driver.quit_called for driver in launched)
+    pool.release(second)  # a driver returned after shutdown is ignored
+    assert pool._idle == []
+
+
+class _PooledTest(PooledBaseCase):
+    __test__ = False  # only run through setUp/tearDown below
+    def test_noop(self):
+        pass
+
+
+def test_pooled_base_case_returns_its_driver_to_the_pool(monkeypatch):
+    pool, launched = make_pool()
+    pool.warm()
+    monkeypatch.setattr(browser_pool, "BROWSER_POOL_SIZE", 1)
+    monkeypatch.setattr(BrowserPool, "_shared", pool)
+    case = _PooledTest("test_noop")
+
+    case.setUp()
+    driver = case.driver
+    assert driver is launched[0] and driver in case._drivers_list
+    case.tearDown()
+
+    assert not driver.quit_called
+    assert [entry.driver for entry in pool._idle] == [driver]
+    assert pool.acquire() is driver and len(launched) == 1
@@ -0,0 +1,77 @@
+import types
+from utils.locator_registry import LocatorRegistry, MAX_PROBES, locator
+
+
+class StubDriver:
+    """Answers find_elements for the selectors currently on the page and counts round-trips."""
+
+    def __init__(self, *present):
+        self.present = set(present)
+        self.calls = []
+
+    def find_elements(self, by, selector):
+        self.calls.append(selector)
+        return ["element"] if selector in self.present else []
+
+
+def make_test(*present):
+    return types.SimpleNamespace(driver=StubDriver(*present))
+
+
+def test_resolve_uses_original_selector_until_a_candidate_is_confirmed():
+    registry = LocatorRegistry()
+    card = registry.register("page.card", "div.card", "//div[@class='card']")
+    test = make_test("div.card", "//div[@class='card']")
+
+    assert registry.resolve("page.card") == "//div[@class='card']"
+    assert test.driver.calls == []  # resolving never touches the browser
+
+    registry.observe(test, "click", "click", ("//div[@class='card']",), 0.1, None)
+
+    assert card.winner == 0
+    assert registry.resolve(card) == "div.card"
+    assert test.driver.calls == ["div.card"]
+
+
+def test_failed_call_with_the_chosen_candidate_drops_it():
+    registry = LocatorRegistry()
+    card = registry.register("page.card", "div.card", "//div[@class='card']")
+    test = make_test("div.card")
+    registry.observe(test, "wait_for_element_visible", "wait", ("//div[@class='card']",), 0.1, None)
+    assert registry.resolve(card) == "div.card"
+
+    registry.observe(test, "click", "click", ("div.card",), 0.1, "NoSuchElementException")
+
+    assert card.winner is None
+    assert registry.resolve(card) == "//div[@class='card']"
+    assert registry.stats()["page.card"]["resets"] == 1
+
+
+def test_queries_do_not_probe_and_absent_elements_settle_on_fallback():
+    registry = LocatorRegistry()
+    button = registry.register("page.button", "button.go", "//button[@class='go']")
+    test = make_test()
+
+    registry.observe(test, "is_element_visible", "query", ("//button[@class='go']",), 0.1, None)
+    assert test.driver.calls == []
+
+    for _ in range(MAX_PROBES):
+        registry.observe(test, "click", "click", ("//button[@class='go']",), 0.1, None)
+    assert button.winner == 1
+    assert len(test.driver.calls) == 2 * MAX_PROBES
+
+
+def test_template_locators_share_the_confirmed_candidate():
+    registry = LocatorRegistry()
+    registry.register("page.item", "li:nth-child({index})", "(//li)[{index}]")
+    test = make_test("li:nth-child(2)")
+
+    class Page:
+        item = locator("page.item", registry)
+
+    page = Page()
+    selector = page.item.format(index=2)
+    registry.observe(test, "click", "click", (selector,), 0.1, None)
+
+    assert page.item.format(index=3) == "li:nth-child(3)"
+    assert "page.item" in registry.stats()
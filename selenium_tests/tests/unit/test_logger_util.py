@@ -0,0 +1,70 @@
+import gzip
+import logging
+import os
+import queue
+from utils.logger_util import BatchingFileHandler, JsonLinesFormatter, read_json_logs
+
+
+def make_record(n):
+    return logging.LogRecord("test", logging.INFO, __file__, n, "record %d", (n,), None)
+
+
+def make_handler(path, pending=None, **kwargs):
+    handler = BatchingFileHandler(str(path), pending if pending is not None else queue.Queue(), **kwargs)
+    handler.setFormatter(JsonLinesFormatter())
+    return handler
+
+
+def test_flushes_in_batches_while_records_are_pending(tmp_path):
+    path = tmp_path / "run.jsonl"
+    pending = queue.Queue()
+    pending.put("more to come")
+    handler = make_handler(path, pending, flush_every=3)
+
+    for n in range(2):
+        handler.emit(make_record(n))
+    assert path.read_text(encoding="utf-8") == ""
+
+    handler.emit(make_record(2))
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    handler.close()
+
+
+def test_rotates_by_size_and_gzips_segments(tmp_path):
+    path = tmp_path / "run.jsonl"
+    handler = make_handler(path, max_bytes=200, compress=True)
+
+    for n in range(10):
+        handler.emit(make_record(n))
+    handler.close()  # waits for the background compression
+
+    segments = sorted(name for name in os.listdir(tmp_path) if name != "run.jsonl")
+    assert segments and all(name.endswith(".gz") for name in segments)
+    with gzip.open(tmp_path / segments[0], "rt", encoding="utf-8") as file:
+        assert file.readline()
+    assert [record["message"] for record in read_json_logs(str(path))] == [f"record {n}" for n in range(10)]
+
+
+def test_rotates_by_age_without_compression(tmp_path, monkeypatch):
+    path = tmp_path / "run.jsonl"
+    handler = make_handler(path, rotate_seconds=60, compress=False)
+    handler.emit(make_record(0))
+
+    monkeypatch.setattr(handler, "_opened_at", handler._opened_at - 61)
+    handler.emit(make_record(1))
+    handler.close()
+
+    segments = [name for name in os.listdir(tmp_path) if name != "run.jsonl"]
+    assert len(segments) == 1 and not segments[0].endswith(".gz")
+    assert [record["message"] for record in read_json_logs(str(path))] == ["record 0", "record 1"]
+
+
+def test_read_json_logs_prefers_a_segment_still_being_compressed(tmp_path):
+    path = tmp_path / "run.jsonl"
+    segment = tmp_path / "run.jsonl.20240101_000000_000000"
+    segment.write_text('{"message": "old"}\n', encoding="utf-8")
+    with gzip.open(f"{segment}.gz", "wt", encoding="utf-8") as file:
+        file.write('{"message": "old"}\n')  # partial gzip output next to the original
+    path.write_text('{"message": "new"}\n\n', encoding="utf-8")
+
+    assert [record["message"] for record in read_json_logs(str(path))] == ["old", "new"]
@@ -0,0 +1,103 @@
+import importlib
+import time
+from utils import session_cache
+from utils.session_cache import SessionCache
+
+
+def make_state(username="user@example.com", ttl=3600):
+    now = time.time()
+    return {"username": username, "url": "https://example.com/home", "saved_at": now, "expires_at": now + ttl,
+            "cookies": [], "local_storage": {}, "logged_out": False}
+
+
+def test_load_returns_saved_state_until_it_expires(tmp_path, monkeypatch):
+    cache = SessionCache(str(tmp_path), ttl=60, enabled=True)
+    state = make_state()
+    cache._write(state["username"], state)
+
+    assert cache.load(state["username"]) == state
+    assert cache.load("other@example.com") is None
+
+    monkeypatch.setattr(time, "time", lambda: state["expires_at"])
+    assert cache.load(state["username"]) is None
+
+
+def test_load_ignores_missing_corrupt_and_disabled_entries(tmp_path):
+    cache = SessionCache(str(tmp_path), enabled=True)
+    assert cache.load("user@example.com") is None
+
+    with open(cache.path("user@example.com"), "w", encoding="utf-8") as file:
+        file.write("{not json")
+    assert cache.load("user@example.com") is None
+
+    state = make_state()
+    cache._write(state["username"], state)
+    assert SessionCache(str(tmp_path), enabled=False).load(state["username"]) is None
+
+
+def test_failed_restore_drops_the_state(tmp_path):
+    cache = SessionCache(str(tmp_path), enabled=True)
+    state = make_state()
+    cache._write(state["username"], state)
+
+    cache.record_restore(cache.load(state["username"]), succeeded=False)
+
+    assert cache.load(state["username"]) is None
+
+
+def test_revoked_logout_is_learned_once_for_every_worker(tmp_path, monkeypatch):
+    cache = SessionCache(str(tmp_path), enabled=True)
+    username = "user@example.com"
+    for worker in ("gw0", "gw1"):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+        cache._write(username, make_state(username))
+        cache.mark_logged_out(username)
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+    assert cache.survives_logout(username, "https://example.com/home") is None
+    cache.record_restore(cache.load(username), succeeded=False)
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    assert cache.survives_logout(username, "https://example.com/home") is False
+    assert cache.load(username) is None  # skipped without a restore attempt
+
+
+def test_state_that_survives_logout_stays_usable(tmp_path):
+    cache = SessionCache(str(tmp_path), enabled=True)
+    username = "user@example.com"
+    cache._write(username, make_state(username))
+    cache.mark_logged_out(username)
+
+    cache.record_restore(cache.load(username), succeeded=True)
+    cache.mark_logged_out(username)
+
+    assert cache.survives_logout(username, "https://example.com/home") is True
+    assert cache.load(username)["logged_out"] is True
+
+
+def test_logout_verdict_is_rechecked_after_its_ttl_or_on_another_host(tmp_path, monkeypatch):
+    cache = SessionCache(str(tmp_path), enabled=True, logout_check_ttl=60)
+    username = "user@example.com"
+    cache._write(username, make_state(username))
+    cache.mark_logged_out(username)
+    cache.record_restore(cache.load(username), succeeded=False)
+    cache._write(username, {**make_state(username), "logged_out": True})
+
+    assert cache.load(username) is None
+    assert cache.survives_logout(username, "https://staging.example.com/home") is None
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.survives_logout(username, "https://example.com/home") is None
+    assert cache.load(username)["logged_out"] is True  # probed again
+
+
+def test_cache_is_off_unless_enabled(monkeypatch):
+    monkeypatch.delenv("SESSION_CACHE", raising=False)
+    try:
+        assert importlib.reload(session_cache).SessionCache().enabled is False
+        monkeypatch.setenv("SESSION_CACHE", "1")
+        assert importlib.reload(session_cache).SessionCache().enabled is True
+    finally:
+        monkeypatch.undo()
+        importlib.reload(session_cache)
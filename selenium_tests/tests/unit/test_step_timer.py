@@ -0,0 +1,66 @@
+import types
+import pytest
+from utils.step_timer import StepTimer, category_totals, hotspots, instrument
+
+
+def leaf(name, category, duration):
+    return {"name": name, "category": category, "duration": duration}
+
+
+def step(name, duration, *children):
+    return {"name": name, "category": "step", "duration": duration, "children": list(children)}
+
+
+def record(*steps):
+    return {"run_id": "r1", "test_id": "t", "tree": {"name": "test", "category": "test",
+                                                      "duration": sum(s["duration"] for s in steps) + 0.5,
+                                                      "children": list(steps)}}
+
+
+def test_category_totals_splits_self_time_by_category():
+    tree = record(step("LoginPage.login", 3.0, leaf("sleep", "sleep", 2.0), leaf("click", "click", 0.5)))["tree"]
+
+    totals = category_totals(tree)
+
+    assert totals == pytest.approx({"sleep": 2.0, "other": 1.0, "click": 0.5})
+    assert list(totals) == ["sleep", "other", "click"]
+    assert sum(totals.values()) == pytest.approx(tree["duration"])
+
+
+def test_hotspots_aggregates_steps_across_records_without_double_counting_nested_steps():
+    inner = step("TemplatesPage.get_template_cards", 1.0, leaf("execute_script", "query", 0.75))
+    outer = step("TemplatesPage.get_templates_list", 1.5, inner, leaf("wait_for_element_visible", "wait", 0.25))
+    records = [record(outer), record(step("TemplatesPage.get_templates_list", 0.5,
+                                          leaf("wait_for_element_visible", "wait", 0.5)))]
+
+    rows = hotspots(records)
+
+    assert [row["step"] for row in rows] == ["TemplatesPage.get_templates_list", "TemplatesPage.get_template_cards"]
+    listing = rows[0]
+    assert (listing["calls"], listing["total"], listing["max"], listing["mean"]) == (2, 2.0, 1.5, 1.0)
+    assert listing["categories"] == pytest.approx({"nested": 1.0, "wait": 0.75, "other": 0.25})
+    assert "query" not in listing["categories"]  # attributed to the nested step only
+    assert rows[1]["categories"] == pytest.approx({"query": 0.75, "other": 0.25})
+
+
+def test_instrument_times_seleniumbase_calls_as_leaves():
+    test = types.SimpleNamespace(_testMethodName="test_x", click=lambda selector: selector)
+
+    timer = instrument(test)
+    with timer.step("Page.act"):
+        assert test.click("#go") == "#go"
+
+    tree = timer.finish().to_dict()
+    assert instrument(test) is timer
+    assert tree["children"][0]["name"] == "Page.act"
+    assert tree["children"][0]["children"][0]["name"] == "click"
+    assert tree["children"][0]["children"][0]["category"] == "click"
+
+
+def test_failed_step_keeps_the_error_name():
+    timer = StepTimer("test_y")
+    with pytest.raises(ValueError):
+        with timer.step("Page.broken"):
+            raise ValueError("boom")
+
+    assert timer.finish().to_dict()["children"][0]["error"] == "ValueError"
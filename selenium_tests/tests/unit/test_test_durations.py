@@ -0,0 +1,46 @@
+import json
+from utils.test_durations import base_nodeid, estimate, load_durations, plan_shards, update_durations
+
+
+def test_plan_shards_puts_longest_tests_on_the_least_loaded_shard():
+    expected = {"a": 10.0, "b": 7.0, "c": 6.0, "d": 5.0, "e": 4.0}
+
+    plan = plan_shards(expected, 2)
+
+    assert plan == [(["a", "d"], 15.0), (["b", "c", "e"], 17.0)]
+    assert sorted(nodeid for nodeids, _ in plan for nodeid in nodeids) == sorted(expected)
+
+
+def test_plan_shards_gives_a_dominant_test_its_own_shard():
+    plan = plan_shards({"slow": 100.0, "x": 1.0, "y": 1.0, "z": 1.0}, 3)
+
+    assert max(load for _, load in plan) == 100.0
+    assert plan[0] == (["slow"], 100.0)
+
+
+def test_plan_shards_handles_more_workers_than_tests_and_zero_workers():
+    assert plan_shards({"a": 1.0}, 3) == [(["a"], 1.0), ([], 0.0), ([], 0.0)]
+    assert plan_shards({"a": 1.0, "b": 2.0}, 0) == [(["b", "a"], 3.0)]
+
+
+def test_estimate_uses_the_median_for_unknown_tests():
+    assert estimate({"a": 10.0, "b": 20.0, "c": 60.0}, ["a", "new"]) == {"a": 10.0, "new": 20.0}
+    assert estimate({}, ["new"]) == {"new": 60.0}
+
+
+def test_update_durations_smooths_new_measurements(tmp_path):
+    path = str(tmp_path / "logs" / "durations.json")
+
+    update_durations({"t::a": 10.0}, path)
+    update_durations({"t::a": 20.0, "t::b": 4.0}, path, smoothing=0.5)
+    update_durations({}, path)
+
+    assert load_durations(path) == {"t::a": 15.0, "t::b": 4.0}
+    with open(path, "r", encoding="utf-8") as file:
+        assert list(json.load(file)) == ["t::a", "t::b"]
+    assert [entry.name for entry in (tmp_path / "logs").iterdir()] == ["durations.json"]
+
+
+def test_base_nodeid_strips_the_shard_group():
+    assert base_nodeid("tests/test_x.py::TestX::test_a@shard2") == "tests/test_x.py::TestX::test_a"
+    assert base_nodeid("tests/test_x.py::test_b@other") == "tests/test_x.py::test_b@other"
@@ -0,0 +1,194 @@
+import os
+import atexit
+import threading
+from seleniumbase import BaseCase, Driver
+from utils.logger_util import Logger
+
+# Browser pool settings, overridable per run through environment variables
+BROWSER_POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", 0))  # warm drivers per worker, 0 = disabled
+BROWSER_POOL_MAX_USES = int(os.environ.get("BROWSER_POOL_MAX_USES", 20))  # tests per driver before it is recycled
+BROWSER_POOL_HEADLESS = os.environ.get("BROWSER_POOL_HEADLESS", "1") != "0"
+
+
+class _PooledDriver:
+    """A pooled WebDriver and the number of tests it has served."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    BrowserPool keeps up to `size` WebDriver instances warm for the tests of one process (xdist worker).
+
+    - Drivers are launched in background threads, so a replacement starts while tests run.
+    - acquire() health-checks a driver before handing it out and replaces dead ones.
+    - release() resets the browser (cookies, storage, extra windows, back to `base_url`)
+      instead of quitting it, and recycles it after `max_uses` tests to cap memory growth.
+    """
+    _shared = None  # Process-wide pool used by PooledBaseCase
+
+    def __init__(self, size, max_uses=BROWSER_POOL_MAX_USES, factory=None, base_url=None):
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory or (lambda: Driver(browser="chrome", headless=BROWSER_POOL_HEADLESS))
+        self.base_url = base_url
+        self.logger = Logger().get_logger()
+        self._idle = []
+        self._in_use = {}
+        self._launching = 0
+        self._live = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @classmethod
+    def shared(cls):
+        """Returns the process-wide pool, creating and warming it on first use."""
+        if cls._shared is None:
+            from config import URL
+            cls._shared = cls(BROWSER_POOL_SIZE, base_url=URL)
+            cls._shared.warm()
+            atexit.register(cls._shared.shutdown)
+        return cls._shared
+
+    def warm(self):
+        """Launches drivers in the background until the pool holds `size` of them."""
+        with self._condition:
+            missing = 0 if self._closed else self.size - self._live
+            self._live += max(missing, 0)
+            self._launching += max(missing, 0)
+        for _ in range(missing):
+            threading.Thread(target=self._launch, name="browser-pool-launch", daemon=True).start()
+
+    def acquire(self):
+        """Returns a healthy driver, waiting for a warm one when a launch is in progress."""
+        while True:
+            with self._condition:
+                while not self._idle and self._launching:
+                    self._condition.wait()
+                entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    self._live += 1
+            if entry is None:
+                entry = self._create()
+            if self._healthy(entry.driver):
+                entry.uses += 1
+                with self._condition:
+                    self._in_use[id(entry.driver)] = entry
+                return entry.driver
+            self.logger.info("Browser pool: replacing unhealthy driver")
+            self._discard(entry)
+
+    def release(self, driver):
+        """Returns a driver to the pool after a test, resetting or recycling it."""
+        with self._condition:
+            entry = self._in_use.pop(id(driver), None)
+        if entry is None:
+            return
+        if self._closed or entry.uses >= self.max_uses or not self._reset(driver):
+            self._discard(entry)
+            self.warm()
+            return
+        with self._condition:
+            self._idle.append(entry)
+            self._condition.notify()
+
+    def shutdown(self):
+        """Quits every driver owned by the pool."""
+        with self._condition:
+            self._closed = True
+            entries = self._idle + list(self._in_use.values())
+            self._idle, self._in_use = [], {}
+        for entry in entries:
+            self._discard(entry)
+
+    def _launch(self):
+        try:
+            entry = _PooledDriver(self.factory())
+        except Exception as e:
+            self.logger.error("Browser pool: failed to launch driver: %s", e)
+            entry = None
+        with self._condition:
+            self._launching -= 1
+            if entry is None:
+                self._live -= 1
+            else:
+                self._idle.append(entry)
+            self._condition.notify_all()
+        if entry is not None and self._closed:
+            self.shutdown()
+
+    def _create(self):
+        try:
+            return _PooledDriver(self.factory())
+        except Exception:
+            with self._condition:
+                self._live -= 1
+            raise
+
+    @staticmethod
+    def _healthy(driver):
+        try:
+            handles = driver.window_handles
+            driver.switch_to.window(handles[0])
+            return driver.execute_script("return document.readyState") is not None
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        """Clears browser state so the next test starts clean. Returns False if the driver is unusable."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})  # every domain, not just the current one
+            else:
+                driver.delete_all_cookies()
+            driver.get(self.base_url or "about:blank")
+            return True
+        except Exception as e:
+            self.logger.info("Browser pool: reset failed, recycling driver: %s", e)
+            return False
+
+    def _discard(self, entry):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+        with self._condition:
+            self._live -= 1
+            self._condition.notify_all()
+
+
+class PooledBaseCase(BaseCase):
+    """
+    BaseCase that borrows its browser from the worker's BrowserPool when BROWSER_POOL_SIZE > 0.
+
+    BaseCase.setUp registers the pooled driver in SeleniumBase's driver list, which tearDown
+    quits. The driver is taken off that list right before tearDown, so it is reset and returned
+    to the pool instead. With the pool disabled this behaves exactly like BaseCase.
+    """
+
+    def get_new_driver(self, *args, **kwargs):
+        if not BROWSER_POOL_SIZE or getattr(self, "_pooled_driver", None) is not None:
+            return super().get_new_driver(*args, **kwargs)
+        driver = self._pooled_driver = BrowserPool.shared().acquire()
+        self.driver = self._default_driver = driver
+        return driver
+
+    def tearDown(self):
+        driver, self._pooled_driver = getattr(self, "_pooled_driver", None), None
+        if driver is not None:
+            if driver in self._drivers_list:
+                self._drivers_list.remove(driver)
+            self._drivers_browser_map.pop(driver, None)
+        try:
+            super().tearDown()
+        finally:
+            if driver is not None:
+                BrowserPool.shared().release(driver)
@@ -0,0 +1,59 @@
+# Collects fields from the first `limit` matches of a locator in one round-trip.
+# Locators starting with "/", "(" or "./" are XPath (relative ones are evaluated against each match),
+# anything else is CSS. Field kinds: "text", "attribute:<name>", "exists".
+_EXTRACT_JS = """
+var selector = arguments[0], limit = arguments[1], fields = arguments[2];
+function isXPath(locator) { return /^(\\/|\\(|\\.\\/)/.test(locator); }
+function first(context, locator) {
+  if (!locator) return context;
+  if (isXPath(locator)) {
+    return document.evaluate(locator, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return (context.matches && context.matches(locator)) ? context : context.querySelector(locator);
+}
+var nodes = [], total;
+if (isXPath(selector)) {
+  var snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  total = snapshot.snapshotLength;
+  for (var i = 0; i < Math.min(total, limit); i++) nodes.push(snapshot.snapshotItem(i));
+} else {
+  var list = document.querySelectorAll(selector);
+  total = list.length;
+  for (var j = 0; j < Math.min(total, limit); j++) nodes.push(list[j]);
+}
+var items = nodes.map(function (node, index) {
+  var item = {rank: index + 1};
+  Object.keys(fields).forEach(function (name) {
+    var locator = fields[name][0], kind = fields[name][1], target = first(node, locator);
+    if (kind === 'exists') item[name] = !!target;
+    else if (!target) item[name] = null;
+    else if (kind.indexOf('attribute:') === 0) item[name] = target.getAttribute(kind.slice(10));
+    else item[name] = (target.innerText || target.textContent || '').trim();
+  });
+  return item;
+});
+return {total: total, items: items};
+"""
+
+
+def extract(test, selector, fields, limit=None):
+    """
+    Extracts fields from the elements matching a locator with a single execute_script call.
+
+    Only the first `limit` matches are read, so the cost does not grow with the page
+    when just the top entries are needed.
+
+    Args:
+        test (BaseCase): Instance of SeleniumBase test case.
+        selector (str): CSS or XPath locator of the repeated elements (e.g. cards).
+        fields (dict): Field name -> (relative locator, kind), kind being "text",
+            "attribute:<name>" or "exists". An empty locator means the element itself.
+        limit (int, optional): Number of matches to read. Defaults to all.
+
+    Returns:
+        tuple: (items, total) where items are dicts with "rank" (1-based position) and
+        the requested fields, and total is the number of matches on the page.
+    """
+    result = test.execute_script(_EXTRACT_JS, selector, limit if limit is not None else 2 ** 31 - 1,
+                                 {name: list(spec) for name, spec in fields.items()})
+    return result["items"], result["total"]
@@ -0,0 +1,241 @@
+import os
+import json
+import time
+import threading
+from utils import step_timer
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+# Where per-process locator statistics are appended at the end of a session
+LOCATOR_TIMINGS_FILE = os.environ.get("LOCATOR_TIMINGS_FILE", os.path.join("logs", "locator_timings.jsonl"))
+MAX_PROBES = 3  # probes without a match (e.g. the element left the page after a click) before keeping the fallback
+
+# SeleniumBase calls that only succeed while the element is on the page, so candidates can be probed right after
+PRESENCE_CALLS = {"click", "js_click", "double_click", "type", "update_text", "send_keys", "get_text",
+                  "get_attribute", "wait_for_element_visible", "wait_for_element_present", "wait_for_element",
+                  "wait_for_text", "assert_element", "assert_text"}
+
+
+def is_xpath(selector):
+    """True for XPath locators ("/...", "(...", "./..."), False for CSS."""
+    return selector.startswith(("/", "(", "./"))
+
+
+class Locator:
+    """
+    A named locator compiled once per process, with candidates in order of preference.
+
+    CSS candidates come first because browsers match them natively and much faster than
+    deep XPath; the original XPath is kept as a fallback and is used until a faster
+    candidate has been confirmed on a live page.
+
+    Attributes:
+        name (str): Registry key, e.g. "templates.card".
+        candidates (tuple): Selectors, fastest first.
+    """
+
+    def __init__(self, name, *candidates):
+        if not candidates:
+            raise ValueError(f"Locator '{name}' needs at least one selector")
+        self.name = name
+        self.candidates = candidates
+        self.winner = None  # index of the candidate confirmed on a live page
+        self.probes = 0  # probes made since the last confirmation
+        self.parent = None  # template this locator was bound from; shares its choice of candidate
+        self._bound = {}
+
+    @property
+    def parametrized(self):
+        return "{" in self.candidates[0]
+
+    def bind(self, **params):
+        """Returns the locator with template parameters filled in, compiled once per parameter set."""
+        key = tuple(sorted(params.items()))
+        bound = self._bound.get(key)
+        if bound is None:
+            suffix = ",".join(f"{name}={value}" for name, value in key)
+            bound = self._bound[key] = Locator(f"{self.name}[{suffix}]",
+                                               *(candidate.format(**params) for candidate in self.candidates))
+            bound.parent = self
+        return bound
+
+    @property
+    def fallback(self):
+        """Selector used while no candidate has been confirmed: the last one, i.e. the original locator."""
+        return self.candidates[-1]
+
+
+class _BoundTemplate:
+    """Template locator returned by the descriptor; `.format(**params)` returns the filled-in selector."""
+
+    def __init__(self, registry, locator):
+        self.registry = registry
+        self.locator = locator
+
+    def format(self, **params):
+        return self.registry.resolve(self.locator.bind(**params))
+
+
+class LocatorRegistry:
+    """
+    Central registry of page locators.
+
+    - register() compiles each locator once at import time instead of rebuilding strings per call.
+    - resolve() never touches the browser: it returns the confirmed candidate, or the original
+      selector until one is confirmed.
+    - After a SeleniumBase call that needed the element on the page succeeds with a locator's
+      selector (seen through the step timer), the faster candidates are probed once with
+      find_elements and the first match is used from then on. If a call with a confirmed
+      candidate fails, the choice is dropped and the original selector is used again.
+    - Time spent in SeleniumBase calls with each locator's selector, and in probes, is recorded
+      for the slow-selector report.
+    """
+
+    def __init__(self):
+        self._locators = {}
+        self._by_selector = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, *candidates):
+        locator = self._locators[name] = Locator(name, *candidates)
+        for candidate in candidates:
+            self._by_selector.setdefault(candidate, locator)
+        return locator
+
+    def __getitem__(self, name):
+        return self._locators[name]
+
+    def resolve(self, locator):
+        """
+        Returns the selector to use for a locator, without any WebDriver round-trip.
+
+        :param locator: Locator or registry name
+        :return: Selector string
+        """
+        locator = self._locators[locator] if isinstance(locator, str) else locator
+        owner = locator.parent or locator
+        selector = locator.fallback if owner.winner is None else locator.candidates[owner.winner]
+        if owner.parametrized:
+            self._by_selector.setdefault(selector, locator)  # map the filled-in selector back for observe()
+        return selector
+
+    def observe(self, test, call, category, args, seconds, error):
+        """Step-timer hook: records calls made with a registered selector, and confirms or drops candidates."""
+        if not args or not isinstance(args[0], str):
+            return
+        locator = self._by_selector.get(args[0])
+        if locator is None:
+            return
+        owner = locator.parent or locator
+        self._record(owner.name, category, seconds)
+        if len(locator.candidates) == 1 or call not in PRESENCE_CALLS:
+            return
+        if error is not None:
+            if owner.winner is not None and args[0] == locator.candidates[owner.winner]:
+                owner.winner = None  # the chosen candidate stopped matching; back to the original selector
+                owner.probes = 0
+                self._record(owner.name, "reset", 0.0)
+        elif owner.winner is None:
+            self._probe(test, locator, owner)
+
+    def _probe(self, test, locator, owner):
+        """Tries the candidates in order while the element is known to be on the page."""
+        for index, candidate in enumerate(locator.candidates):
+            start = time.perf_counter()
+            try:
+                found = test.driver.find_elements(By.XPATH if is_xpath(candidate) else By.CSS_SELECTOR, candidate)
+            except WebDriverException:
+                found = []
+            self._record(owner.name, "probe", time.perf_counter() - start, fallback=index > 0)
+            if found:
+                owner.winner = index
+                owner.probes = 0
+                return
+        owner.probes += 1
+        if owner.probes >= MAX_PROBES:
+            owner.winner = len(locator.candidates) - 1  # element never stays on the page; keep the original
+
+    def stats(self):
+        with self._lock:
+            return {name: dict(row) for name, row in self._stats.items()}
+
+    def dump(self, path=LOCATOR_TIMINGS_FILE, run_id=None):
+        """Appends this process's statistics to the timings file."""
+        stats = self.stats()
+        if not stats:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(json.dumps({"run_id": run_id, "pid": os.getpid(), "stats": stats}) + "\n")
+
+    def _record(self, name, kind, seconds, fallback=False):
+        with self._lock:
+            row = self._stats.setdefault(name, {"lookups": 0, "total": 0.0, "max": 0.0, "probes": 0,
+                                                "fallbacks": 0, "resets": 0})
+            if kind == "reset":
+                row["resets"] += 1
+                return
+            if kind == "probe":
+                row["probes"] += 1
+                row["fallbacks"] += int(fallback)
+            row["lookups"] += 1
+            row["total"] += seconds
+            row["max"] = max(row["max"], seconds)
+
+
+def load_stats(path=LOCATOR_TIMINGS_FILE, run_id=None):
+    """Merges the statistics written by every process (or those of one run)."""
+    merged = {}
+    if not os.path.exists(path):
+        return merged
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if run_id is not None and record.get("run_id") != run_id:
+                continue
+            for name, row in record["stats"].items():
+                target = merged.setdefault(name, {key: 0 for key in row})
+                for key, value in row.items():
+                    target[key] = max(target[key], value) if key == "max" else target[key] + value
+    return merged
+
+
+def format_slowest(stats, top=15):
+    """Formats locator statistics as a table, slowest total resolution time first."""
+    lines = [f"{'locator':<40} {'lookups':>8} {'total s':>9} {'mean ms':>8} {'max ms':>8} {'fallbacks':>9}"]
+    rows = sorted(stats.items(), key=lambda item: -item[1]["total"])
+    for name, row in rows[:top]:
+        mean = row["total"] / row["lookups"] * 1000 if row["lookups"] else 0.0
+        lines.append(f"{name:<40} {row['lookups']:>8} {row['total']:>9.2f} {mean:>8.1f} "
+                     f"{row['max'] * 1000:>8.1f} {row['fallbacks']:>9}")
+    return lines
+
+
+class locator:
+    """
+    Page-object attribute bound to a registry entry.
+
+    Reading it returns the selector to use on the page (a plain string for SeleniumBase calls),
+    or, for template locators, an object whose .format(**params) returns the filled-in selector.
+    Reading never sends a WebDriver command.
+    """
+
+    def __init__(self, name, registry=None):
+        self.name = name
+        self.registry = registry
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        registry = self.registry or LOCATORS
+        entry = registry[self.name]
+        if entry.parametrized:
+            return _BoundTemplate(registry, entry)
+        return registry.resolve(entry)
+
+
+LOCATORS = LocatorRegistry()
+step_timer.CALL_OBSERVERS.append(LOCATORS.observe)
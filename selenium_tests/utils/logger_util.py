@@ -1,54 +1,373 @@
 import os
+import copy
+import glob
+import gzip
+import json
+import time
+import atexit
+import queue
+import heapq
+import pickle
+import shutil
+import struct
 import logging
+import threading
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, SocketHandler
 from datetime import datetime
 
+# Log settings, overridable per run through environment variables
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text")  # "text" or "json" (JSON lines)
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", 0))  # rotate after this many bytes, 0 = never
+LOG_ROTATE_SECONDS = int(os.environ.get("LOG_ROTATE_SECONDS", 0))  # rotate after this many seconds, 0 = never
+LOG_COMPRESS = os.environ.get("LOG_COMPRESS", "1") != "0"  # gzip rotated segments
+
+
+def _gzip_segment(path):
+    """Compresses a rotated segment to path.gz and removes the original."""
+    with open(path, "rb") as source, gzip.open(path + ".gz", "wb") as target:
+        shutil.copyfileobj(source, target)
+    os.remove(path)
+
+
+def read_json_logs(log_file):
+    """
+    Yields the records of a JSON-lines log in write order, including its rotated (and gzipped) segments.
+
+    :param log_file: Path of the live log file, e.g. Logger._log_file
+    :return: Iterator of dicts
+    """
+    segments = sorted(glob.glob(glob.escape(log_file) + ".*"))  # timestamp suffixes sort chronologically
+    for path in segments + [log_file]:
+        if not os.path.exists(path) or (path.endswith(".gz") and os.path.exists(path[:-3])):
+            continue  # a segment still being compressed is read from the original
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class TestContextFilter(logging.Filter):
+    """
+    Stamps each record with the current pytest test id and xdist worker while still on the calling thread.
+
+    The background writer runs later, so the id has to be captured before the record is queued.
+    Records forwarded from workers already carry both and are left untouched.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, "test_id"):
+            current = os.environ.get("PYTEST_CURRENT_TEST", "")
+            record.test_id = current.rsplit(" ", 1)[0] if current else None
+        if not hasattr(record, "worker"):
+            record.worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        return True
+
+
+class _ContextQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the traceback out of the message.
+
+    The stock prepare() merges the formatted traceback into `msg` and clears `exc_text`, which
+    loses the JSON "exception" field; here the message and traceback stay separate.
+    """
+
+    def prepare(self, record):
+        prepared = copy.copy(record)
+        prepared.message = record.getMessage()
+        prepared.msg = prepared.message
+        prepared.args = None
+        if record.exc_info and not record.exc_text:
+            prepared.exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared.exc_info = None  # tracebacks do not survive the queue or pickling
+        return prepared
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+
+    Fields: ts, level, message, test_id, page (page-object module), step (method name),
+    duration (seconds, when the caller passes extra={"duration": ...}) and exception (traceback,
+    when logged with exc_info). `page` and `step` can also be overridden through `extra`.
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "worker": getattr(record, "worker", None),
+            "test_id": getattr(record, "test_id", None),
+            "page": getattr(record, "page", record.module),
+            "step": getattr(record, "step", record.funcName),
+            "duration": getattr(record, "duration", None),
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class BatchingFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets writes accumulate in the stream buffer and flushes in batches.
+
+    - Flushes once the pending queue is drained or after `flush_every` records, whichever comes first.
+    - Meant to run on the QueueListener thread, so disk I/O never happens on the browser-driving thread.
+    - Rotates the file once it exceeds `max_bytes` or is older than `rotate_seconds`. Rotated
+      segments are renamed to `<file>.<timestamp>` and gzipped on a separate thread.
+    """
+
+    def __init__(self, filename, pending, flush_every=100, mode="a", encoding="utf-8",
+                 max_bytes=0, rotate_seconds=0, compress=True):
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self.pending = pending
+        self.flush_every = flush_every
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.compress = compress
+        self._unflushed = 0
+        self._bytes = 0
+        self._opened_at = time.monotonic()
+        self._compressor = None
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            if self._should_rotate():
+                self._rotate()
+            line = self.format(record) + self.terminator
+            self.stream.write(line)
+            self._bytes += len(line.encode(self.encoding or "utf-8"))
+            self._unflushed += 1
+            if self._unflushed >= self.flush_every or self.pending.empty():
+                self.flush()
+                self._unflushed = 0
+        except Exception:
+            self.handleError(record)
+
+    def _should_rotate(self):
+        if self.max_bytes and self._bytes >= self.max_bytes:
+            return True
+        return bool(self.rotate_seconds) and time.monotonic() - self._opened_at >= self.rotate_seconds
+
+    def _rotate(self):
+        """Closes the current file, moves it aside and starts a fresh one."""
+        self.stream.close()
+        segment = f"{self.baseFilename}.{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        os.replace(self.baseFilename, segment)
+        if self.compress:
+            if self._compressor is None:
+                self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-gzip")
+            self._compressor.submit(_gzip_segment, segment)
+        self.stream = self._open()
+        self._bytes = 0
+        self._unflushed = 0
+        self._opened_at = time.monotonic()
+
+    def close(self):
+        super().close()
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)  # finish compressing rotated segments
+            self._compressor = None
+
+
+class _LogRecordStreamHandler(socketserver.StreamRequestHandler):
+    """Reads length-prefixed pickled records sent by logging.handlers.SocketHandler."""
+
+    def handle(self):
+        if self.client_address[0] != "127.0.0.1":
+            return  # records are unpickled, so only local workers may send them
+        while True:
+            header = self.rfile.read(4)
+            if len(header) < 4:
+                return  # worker closed the connection
+            length = struct.unpack(">L", header)[0]
+            record = logging.makeLogRecord(pickle.loads(self.rfile.read(length)))
+            self.server.add(record)
+
+
+class LogAggregator(socketserver.ThreadingTCPServer):
+    """
+    Collects log records from pytest-xdist workers into the controller's log.
+
+    - Workers ship records over a localhost socket (SocketHandler on their writer thread).
+    - Records are held for `reorder_window` seconds and released in timestamp order,
+      so the single log file stays ordered even though workers send concurrently.
+    - Released records go through `logger`, i.e. the controller's normal queue and file.
+
+    Records arrive pickled (the SocketHandler wire format) and unpickling runs arbitrary code,
+    so the server only listens on 127.0.0.1 and ignores other peers: anything that can connect
+    already runs as a local process. Remote xdist workers (--tx ssh=...) are not supported.
+    """
+    allow_reuse_address = True
+    daemon_threads = False  # server_close() waits for workers to finish sending
+
+    def __init__(self, logger, port=0, reorder_window=0.5):
+        super().__init__(("127.0.0.1", port), _LogRecordStreamHandler)
+        self.logger = logger
+        self.reorder_window = reorder_window
+        self._pending = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._service_threads = []
+
+    @property
+    def address(self):
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self):
+        self._service_threads = [threading.Thread(target=self.serve_forever, name="log-aggregator", daemon=True),
+                         threading.Thread(target=self._release_loop, name="log-reorder", daemon=True)]
+        for thread in self._service_threads:
+            thread.start()
+        return self
+
+    def add(self, record):
+        with self._lock:
+            self._sequence += 1
+            heapq.heappush(self._pending, (record.created, self._sequence, record))
+
+    def stop(self):
+        """Waits for connected workers to disconnect, then writes out every held record."""
+        self.shutdown()
+        self.server_close()
+        self._stopped.set()
+        for thread in self._service_threads:
+            thread.join()
+        self._release(force=True)
+
+    def _release_loop(self):
+        while not self._stopped.wait(self.reorder_window / 2):
+            self._release()
+
+    def _release(self, force=False):
+        cutoff = time.time() - self.reorder_window
+        with self._lock:
+            ready = []
+            while self._pending and (force or self._pending[0][0] <= cutoff):
+                ready.append(heapq.heappop(self._pending)[2])
+        for record in ready:
+            self.logger.handle(record)
+
+
 class Logger:
     """
     Singleton Logger class to manage logging for test execution.
-    
+
     - Creates a single log file per execution under the 'logs' directory.
     - Uses a timestamp in the filename for uniqueness.
     - Ensures all logs are written to the same file.
+    - Logging is non-blocking: callers only enqueue records, and a background
+      QueueListener thread formats and writes them in batches.
+    - Call Logger.shutdown() (done automatically at session end and interpreter exit)
+      to flush everything still queued.
+    - LOG_FORMAT=json writes JSON lines (`execution_<timestamp>.jsonl`) with test id, page object,
+      step and duration fields; LOG_MAX_BYTES / LOG_ROTATE_SECONDS enable rotation.
+    - Under pytest-xdist, workers get LOG_AGGREGATOR=host:port and forward records to the
+      controller's LogAggregator instead of opening their own file; every line is tagged
+      with its worker id.
     """
     _instance = None  # Singleton instance
     _log_file = None  # Store log file path
+    _listener = None  # Background writer draining the queue
+    _aggregating = False  # Controller collecting worker logs; tags text lines with the worker id
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Logger, cls).__new__(cls)
 
-            # Ensure logs directory exists
-            log_dir = "logs"
-            os.makedirs(log_dir, exist_ok=True)
+            # Callers only enqueue; the listener thread does formatting and file or socket I/O
+            log_queue = queue.SimpleQueue()
+            aggregator = os.environ.get("LOG_AGGREGATOR")
+            if aggregator:
+                host, port = aggregator.rsplit(":", 1)
+                handler = SocketHandler(host, int(port))
+                print(f"Logger initialized, forwarding logs to controller at {aggregator}")
+            else:
+                handler = cls._file_handler(log_queue)
+            handler.setLevel(logging.INFO)
 
-            # Create a single log file for the entire execution
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            cls._log_file = os.path.join(log_dir, f"execution_{timestamp}.log")
+            cls._listener = QueueListener(log_queue, handler, respect_handler_level=True)
+            cls._listener.start()
+            atexit.register(cls.shutdown)
 
-            print(f"Logger initialized, log file should be at: {cls._log_file}")
-
-            # Configure logging properly with a file handler
             cls._instance.logger = logging.getLogger("TestExecutionLogger")
             cls._instance.logger.setLevel(logging.INFO)
+            queue_handler = _ContextQueueHandler(log_queue)
+            queue_handler.addFilter(TestContextFilter())
+            cls._instance.logger.addHandler(queue_handler)
 
-            file_handler = logging.FileHandler(cls._log_file, mode="w")
-            file_handler.setLevel(logging.INFO)
+            cls._instance.logger.info("Logging setup complete.")
 
-            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-            file_handler.setFormatter(formatter)
+        return cls._instance
 
-            cls._instance.logger.addHandler(file_handler)
+    @classmethod
+    def _file_handler(cls, log_queue):
+        """Creates the single log file for the execution and its batching handler."""
+        # Ensure logs directory exists
+        log_dir = "logs"
+        os.makedirs(log_dir, exist_ok=True)
 
-            # Ensure log messages are flushed immediately
-            cls._instance.logger.info("Logging setup complete.")
-            file_handler.flush()
+        # Create a single log file for the entire execution
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = "jsonl" if LOG_FORMAT == "json" else "log"
+        cls._log_file = os.path.join(log_dir, f"execution_{timestamp}.{extension}")
 
-        return cls._instance
+        print(f"Logger initialized, log file should be at: {cls._log_file}")
+
+        file_handler = BatchingFileHandler(cls._log_file, log_queue, mode="w", max_bytes=LOG_MAX_BYTES,
+                                           rotate_seconds=LOG_ROTATE_SECONDS, compress=LOG_COMPRESS)
+        if LOG_FORMAT == "json":
+            formatter = JsonLinesFormatter()
+        elif cls._aggregating:
+            formatter = logging.Formatter("%(asctime)s - %(worker)s - %(levelname)s - %(message)s")
+        else:
+            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        file_handler.setFormatter(formatter)
+        return file_handler
+
+    @classmethod
+    def start_aggregator(cls):
+        """
+        Starts a LogAggregator for xdist workers on the controller.
+
+        :return: Running LogAggregator; pass its address to workers as LOG_AGGREGATOR
+        """
+        cls._aggregating = True
+        return LogAggregator(cls().get_logger()).start()
 
     def get_logger(self):
         """
         Returns the logger instance for writing logs.
-        
+
         :return: Logger object
         """
         return self.logger
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Drains the queue and flushes the log file. Safe to call more than once.
+
+        The background writer stops, and records logged afterwards (e.g. from teardown) are
+        written directly by the same handlers instead of going to a queue nobody drains.
+        The handlers are closed by logging at interpreter exit.
+        """
+        listener, cls._listener = cls._listener, None
+        if listener is None:
+            return
+        listener.stop()  # processes every record still queued before returning
+        logger = cls._instance.logger
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler):
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            handler.flush()
+            handler.addFilter(TestContextFilter())
+            logger.addHandler(handler)
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import hashlib
+from urllib.parse import urlsplit
+
+# Session cache settings, overridable per run through environment variables
+SESSION_CACHE_ENABLED = os.environ.get("SESSION_CACHE", "0") == "1"  # opt-in: the suite's scenarios log out
+SESSION_CACHE_DIR = os.environ.get("SESSION_CACHE_DIR", ".session_cache")
+SESSION_CACHE_TTL = int(os.environ.get("SESSION_CACHE_TTL", 3600))  # seconds a saved login is trusted
+SESSION_RESTORE_TIMEOUT = int(os.environ.get("SESSION_RESTORE_TIMEOUT", 5))  # seconds to confirm a restore
+SESSION_LOGOUT_CHECK_TTL = int(os.environ.get("SESSION_LOGOUT_CHECK_TTL", 86400))  # seconds a logout verdict is trusted
+
+_SAMESITE_VALUES = ("Strict", "Lax", "None")
+
+
+class SessionCache:
+    """
+    Persists an authenticated browser session (cookies and localStorage) so later tests can skip the UI login.
+
+    - One file per user and pytest-xdist worker under SESSION_CACHE_DIR, so each worker logs in once.
+    - A saved state expires after SESSION_CACHE_TTL seconds or when its first cookie expires.
+    - Whether a state still works after the UI logout is learned on the first restore attempt
+      and remembered per user and app host for every worker, so a server that revokes sessions
+      on logout costs one failed restore per cache directory, not one per test or worker.
+      The verdict is re-checked after SESSION_LOGOUT_CHECK_TTL seconds.
+    """
+
+    def __init__(self, directory=SESSION_CACHE_DIR, ttl=SESSION_CACHE_TTL, enabled=SESSION_CACHE_ENABLED,
+                 logout_check_ttl=SESSION_LOGOUT_CHECK_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        self.enabled = enabled
+        self.logout_check_ttl = logout_check_ttl
+
+    def path(self, username):
+        """Cache file for a user on the current worker."""
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        return os.path.join(self.directory, f"{self._user_key(username)}_{worker}.json")
+
+    def survives_logout(self, username, url):
+        """
+        What the app at url did to a saved session after a UI logout.
+
+        :return: True or False, or None if not seen on that host within logout_check_ttl seconds
+        """
+        try:
+            with open(self._logout_path(username), "r", encoding="utf-8") as file:
+                verdict = json.load(file)
+            if verdict["host"] != urlsplit(url).netloc or time.time() - verdict["checked_at"] >= self.logout_check_ttl:
+                return None
+            return verdict["survives_logout"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def load(self, username):
+        """
+        Returns the saved state for a user if it can still be used.
+
+        :return: State dict, or None if missing, expired or known not to survive logout
+        """
+        if not self.enabled:
+            return None
+        state = self._read(username)
+        if state is None or state.get("username") != username:
+            return None
+        if time.time() >= state["expires_at"]:
+            return None
+        if state.get("logged_out") and self.survives_logout(username, state["url"]) is False:
+            return None
+        return state
+
+    def save(self, test, username):
+        """Captures cookies and localStorage of the logged-in browser."""
+        if not self.enabled:
+            return
+        cookies = test.driver.get_cookies()
+        local_storage = test.execute_script(
+            "var items = {}; for (var i = 0; i < localStorage.length; i++) {"
+            " var key = localStorage.key(i); items[key] = localStorage.getItem(key); } return items;")
+        expiries = [cookie["expiry"] for cookie in cookies if cookie.get("expiry")]
+        self._write(username, {
+            "username": username,
+            "url": test.get_current_url(),
+            "saved_at": time.time(),
+            "expires_at": min([time.time() + self.ttl] + expiries),
+            "cookies": cookies,
+            "local_storage": local_storage or {},
+            "logged_out": False,
+        })
+
+    def restore(self, test, state):
+        """Loads a saved state into the browser and reopens the page it was captured on."""
+        test.open(state["url"])  # cookies can only be set for the current domain
+        test.delete_all_cookies()
+        for cookie in state["cookies"]:
+            cookie = dict(cookie)
+            if cookie.get("sameSite") not in _SAMESITE_VALUES:
+                cookie.pop("sameSite", None)
+            test.driver.add_cookie(cookie)
+        test.execute_script(
+            "var items = arguments[0]; for (var key in items) { localStorage.setItem(key, items[key]); }",
+            state["local_storage"])
+        test.open(state["url"])
+
+    def record_restore(self, state, succeeded):
+        """Remembers the outcome of restoring a state; failed states are dropped."""
+        if state.get("logged_out"):
+            self._write_file(self._logout_path(state["username"]), {
+                "survives_logout": succeeded,
+                "host": urlsplit(state["url"]).netloc,
+                "checked_at": time.time(),
+            })
+        if not succeeded:
+            state["expires_at"] = 0
+        self._write(state["username"], state)
+
+    def mark_logged_out(self, username):
+        """Flags the saved state as captured before a UI logout."""
+        state = self._read(username)
+        if state is not None and not state.get("logged_out"):
+            state["logged_out"] = True
+            self._write(username, state)
+
+    def _read(self, username):
+        try:
+            with open(self.path(username), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _user_key(username):
+        return hashlib.sha256(username.encode("utf-8")).hexdigest()[:16]
+
+    def _logout_path(self, username):
+        return os.path.join(self.directory, f"{self._user_key(username)}_logout.json")
+
+    def _write(self, username, state):
+        """Writes atomically with owner-only permissions; the file holds live session tokens."""
+        self._write_file(self.path(username), state)
+
+    def _write_file(self, path, state):
+        os.makedirs(self.directory, exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temporary, path)
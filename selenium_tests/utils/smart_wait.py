@@ -0,0 +1,148 @@
+import os
+import time
+from contextlib import nullcontext
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+# Upper bound for waiting on slide generation; the wait itself returns as soon as the result renders
+GENERATION_TIMEOUT = int(os.environ.get("GENERATION_TIMEOUT", 600))
+
+# Tracks DOM mutations and in-flight fetch/XHR requests on the current document (installed once per page)
+_INSTALL_JS = """
+if (!window.__smartWait) {
+  var state = window.__smartWait = {pending: 0, lastChange: performance.now()};
+  var touch = function () { state.lastChange = performance.now(); };
+  new MutationObserver(touch).observe(document.documentElement,
+    {subtree: true, childList: true, attributes: true, characterData: true});
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      state.pending++; touch();
+      return originalFetch.apply(this, arguments).finally(function () { state.pending--; touch(); });
+    };
+  }
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    state.pending++; touch();
+    this.addEventListener('loadend', function () { state.pending--; touch(); });
+    return originalSend.apply(this, arguments);
+  };
+}
+"""
+
+# Resolves as soon as the condition holds: re-checked on every DOM mutation, plus a backing-off
+# timer for changes that do not mutate the DOM (CSS transitions, quiet periods). Gives up after `slice` ms.
+_WAIT_JS = """
+var mode = arguments[0], selector = arguments[1], quiet = arguments[2], slice = arguments[3];
+var done = arguments[arguments.length - 1];
+function find() {
+  if (selector.charAt(0) === '/' || selector.charAt(0) === '(') {
+    return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return document.querySelector(selector);
+}
+function visible(el) {
+  if (!el) return false;
+  var style = getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none' &&
+    !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+function check() {
+  if (mode === 'visible') return visible(find());
+  if (mode === 'absent') return !visible(find());
+  if (mode === 'enabled') {
+    var el = find();
+    return visible(el) && !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+  }
+  var state = window.__smartWait;
+  return state.pending === 0 && performance.now() - state.lastChange >= quiet;
+}
+var start = performance.now(), delay = 16, observer, timer, finished = false;
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearTimeout(timer);
+  done(result);
+}
+function poll() {
+  if (check()) return finish(true);
+  if (performance.now() - start >= slice) return finish(false);
+  delay = Math.min(delay * 1.5, 250);
+  timer = setTimeout(poll, delay);
+}
+if (check()) return finish(true);
+observer = new MutationObserver(function () { if (check()) finish(true); });
+observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+timer = setTimeout(poll, delay);
+"""
+
+
+class SmartWait:
+    """
+    Event-driven waits for page objects, replacing fixed sleeps.
+
+    Each wait runs inside the browser as one asynchronous script that is re-evaluated on every
+    DOM mutation, so the step continues the moment its condition holds instead of after a
+    polling interval. Long waits are split into slices so no single WebDriver call runs for
+    minutes; a navigation during a slice simply starts a new one on the new document.
+
+    Selectors are CSS, or XPath when they start with "/" or "(".
+
+    `idle()` can only see requests made after the tracker is installed, so call `arm()` before the
+    action that triggers them (e.g. right before a click), then `idle()` after it.
+    """
+
+    def __init__(self, test, slice_seconds=20):
+        """
+        Args:
+            test (BaseCase): Instance of SeleniumBase test case.
+            slice_seconds (float): Longest single in-browser wait.
+        """
+        self.test = test
+        self.slice_seconds = slice_seconds
+
+    def arm(self):
+        """Installs the DOM/fetch/XHR tracker on the current page before an action that sends requests."""
+        self.test.driver.execute_script(_INSTALL_JS)
+
+    def visible(self, selector, timeout=10):
+        """Waits until the element exists and is visible."""
+        return self._wait("visible", selector, timeout)
+
+    def enabled(self, selector, timeout=10):
+        """Waits until the element is visible and not disabled."""
+        return self._wait("enabled", selector, timeout)
+
+    def absent(self, selector, timeout=10):
+        """Waits until the element is gone or hidden."""
+        return self._wait("absent", selector, timeout)
+
+    def idle(self, quiet=0.3, timeout=10):
+        """Waits until no fetch/XHR is in flight and the DOM has not changed for `quiet` seconds."""
+        return self._wait("idle", "", timeout, quiet)
+
+    def _wait(self, mode, selector, timeout, quiet=0.0):
+        driver = self.test.driver
+        deadline = time.monotonic() + timeout
+        timer = getattr(self.test, "_step_timer", None)
+        previous_timeout = driver.timeouts.script
+        with timer.step(f"smart_wait.{mode}", "wait") if timer is not None else nullcontext():
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutException(f"'{selector or 'page'}' not {mode} after {timeout}s")
+                    window = min(remaining, self.slice_seconds)
+                    try:
+                        driver.set_script_timeout(window + 5)
+                        driver.execute_script(_INSTALL_JS)
+                        if driver.execute_async_script(_WAIT_JS, mode, selector, quiet * 1000, window * 1000):
+                            return True
+                    except TimeoutException:
+                        pass  # slice ran out inside the browser; try again until the deadline
+                    except JavascriptException as e:
+                        if "unloaded" not in str(e):
+                            raise  # a broken selector or script, not a slow page
+                        time.sleep(min(0.1, max(remaining, 0)))  # document replaced mid-wait; retry on the new one
+            finally:
+                driver.set_script_timeout(previous_timeout)
@@ -0,0 +1,265 @@
+import os
+import sys
+import json
+import time
+import argparse
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+
+# Where per-test timing trees are appended, one JSON object per test
+STEP_TIMINGS_FILE = os.environ.get("STEP_TIMINGS_FILE", os.path.join("logs", "step_timings.jsonl"))
+
+# SeleniumBase calls that are timed, grouped by what the time was spent on
+CATEGORIES = {
+    "sleep": ("sleep", "wait"),
+    "wait": ("wait_for_element_visible", "wait_for_element_present", "wait_for_element", "wait_for_text",
+             "wait_for_element_absent", "wait_for_element_not_visible", "wait_for_ready_state_complete",
+             "assert_element", "assert_text", "assert_downloaded_file"),
+    "click": ("click", "js_click", "double_click"),
+    "input": ("type", "update_text", "send_keys"),
+    "navigate": ("open", "refresh", "go_back"),
+    "query": ("find_elements", "find_element", "get_text", "get_attribute", "is_element_visible",
+              "is_element_present", "is_element_enabled", "execute_script"),
+    "screenshot": ("save_screenshot",),
+}
+
+# Callbacks (test, call, category, args, seconds, error) run after every instrumented SeleniumBase call;
+# error is the exception class name, or None if the call succeeded
+CALL_OBSERVERS = []
+
+
+class StepNode:
+    """
+    One timed step: a test, a page-object method or a single SeleniumBase call.
+
+    Attributes:
+        name (str): Step name, e.g. "LoginPage.login" or "click".
+        category (str): "test", "step" or one of CATEGORIES.
+        duration (float): Wall time in seconds.
+        children (list): Nested StepNode objects.
+    """
+
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+        self.duration = 0.0
+        self.children = []
+        self.error = None
+
+    @property
+    def self_time(self):
+        """Time spent in this step outside its timed children."""
+        return max(self.duration - sum(child.duration for child in self.children), 0.0)
+
+    def to_dict(self):
+        node = {"name": self.name, "category": self.category, "duration": round(self.duration, 6)}
+        if self.error:
+            node["error"] = self.error
+        if self.children:
+            node["children"] = [child.to_dict() for child in self.children]
+        return node
+
+
+class StepTimer:
+    """
+    StepTimer builds the timing tree for one test.
+
+    Page-object methods decorated with @timed_step open "step" nodes; instrumented SeleniumBase
+    calls made inside them become leaves, so each step's time splits into sleeps, element
+    waits, clicks and so on.
+    """
+
+    def __init__(self, name):
+        self.root = StepNode(name, "test")
+        self._stack = [self.root]
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def step(self, name, category="step"):
+        """Times the enclosed block as a child of the current step."""
+        node = StepNode(name, category)
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        start = time.perf_counter()
+        try:
+            yield node
+        except Exception as e:
+            node.error = type(e).__name__
+            raise
+        finally:
+            node.duration = time.perf_counter() - start
+            self._stack.pop()
+
+    def finish(self):
+        """Closes the root node and returns it."""
+        self.root.duration = time.perf_counter() - self._started
+        return self.root
+
+    def render(self):
+        """Returns the timing tree as indented text lines with per-category totals."""
+        lines = []
+
+        def walk(node, depth):
+            label = f"{node.name} [{node.category}]" if node.category not in ("test", "step") else node.name
+            lines.append(f"{'  ' * depth}{label:<{max(60 - 2 * depth, 1)}} {node.duration * 1000:>10.1f} ms"
+                         + (f"  ({node.error})" if node.error else ""))
+            for child in node.children:
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        totals = category_totals(self.root.to_dict())
+        lines.append("  ".join(f"{category}={seconds * 1000:.0f}ms" for category, seconds in totals.items()))
+        return lines
+
+
+def instrument(test):
+    """
+    Wraps the SeleniumBase calls listed in CATEGORIES on a test instance so they are timed.
+
+    :param test: BaseCase instance
+    :return: The test's StepTimer
+    """
+    timer = getattr(test, "_step_timer", None)
+    if timer is not None:
+        return timer
+    timer = test._step_timer = StepTimer(getattr(test, "_testMethodName", type(test).__name__))
+    for category, names in CATEGORIES.items():
+        for name in names:
+            method = getattr(test, name, None)
+            if callable(method):
+                setattr(test, name, _timed_call(test, timer, name, category, method))
+    return timer
+
+
+def _timed_call(test, timer, name, category, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        node = None
+        try:
+            with timer.step(name, category) as node:
+                return method(*args, **kwargs)
+        finally:
+            for observer in CALL_OBSERVERS:
+                observer(test, name, category, args, node.duration, node.error)
+    return wrapper
+
+
+def timed_step(func):
+    """
+    Decorator for page-object methods: times the call as a step of the current test.
+
+    The page object must expose the running test as `self.test`. The duration is also
+    logged with page/step/duration fields for the JSON log format.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        timer = instrument(self.test)
+        page = type(self).__name__
+        node = None
+        try:
+            with timer.step(f"{page}.{func.__name__}") as node:
+                return func(self, *args, **kwargs)
+        finally:
+            logger = getattr(self, "logger", None)
+            if logger is not None and node is not None:
+                module = type(self).__module__.rsplit(".", 1)[-1]  # same "page" value as the page's own records
+                logger.info("Step %s.%s took %.3fs", page, func.__name__, node.duration,
+                            extra={"page": module, "step": func.__name__, "duration": round(node.duration, 6)})
+    return wrapper
+
+
+def category_totals(tree):
+    """Returns {category: seconds} of self time in a to_dict() tree; un-instrumented step time counts as "other"."""
+    totals = {}
+
+    def walk(node):
+        children = node.get("children", [])
+        self_time = max(node["duration"] - sum(child["duration"] for child in children), 0.0)
+        category = "other" if node["category"] in ("test", "step") else node["category"]
+        totals[category] = totals.get(category, 0.0) + self_time
+        for child in children:
+            walk(child)
+
+    walk(tree)
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def record_test(test_id, timer, path=STEP_TIMINGS_FILE, run_id=None):
+    """Appends one test's timing tree to the timings file (a single write, so xdist workers can share it)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    entry = {"run_id": run_id, "test_id": test_id, "ts": datetime.now().isoformat(timespec="seconds"),
+             "tree": timer.finish().to_dict()}
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def load_records(path=STEP_TIMINGS_FILE, run_id=None):
+    """Reads recorded timing trees, optionally only those of one run."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file if line.strip()]
+    return [record for record in records if run_id is None or record.get("run_id") == run_id]
+
+
+def hotspots(records):
+    """
+    Aggregates page-object steps across recorded tests.
+
+    :return: Rows sorted by total time, each {"step", "calls", "total", "mean", "max", "categories"}
+    """
+    stats = {}
+
+    def walk(node):
+        if node["category"] == "step":
+            row = stats.setdefault(node["name"], {"step": node["name"], "calls": 0, "total": 0.0, "max": 0.0,
+                                                  "categories": {}})
+            row["calls"] += 1
+            row["total"] += node["duration"]
+            row["max"] = max(row["max"], node["duration"])
+            for category, seconds in category_totals(_without_substeps(node)).items():
+                row["categories"][category] = row["categories"].get(category, 0.0) + seconds
+        for child in node.get("children", []):
+            walk(child)
+
+    for record in records:
+        walk(record["tree"])
+    rows = sorted(stats.values(), key=lambda row: -row["total"])
+    for row in rows:
+        row["mean"] = row["total"] / row["calls"]
+    return rows
+
+
+def _without_substeps(node):
+    """A step's tree with nested page-object steps collapsed, so their time is not attributed twice."""
+    children = [child if child["category"] != "step" else {"name": child["name"], "category": "nested",
+                                                            "duration": child["duration"]}
+                for child in node.get("children", [])]
+    return {**node, "children": children}
+
+
+def format_hotspots(rows, top=20):
+    """Formats hotspot rows as a text table."""
+    lines = [f"{'step':<45} {'calls':>6} {'total s':>9} {'mean s':>8} {'max s':>8}  breakdown"]
+    for row in rows[:top]:
+        breakdown = " ".join(f"{category}={seconds:.2f}" for category, seconds
+                             in sorted(row["categories"].items(), key=lambda item: -item[1]) if seconds >= 0.005)
+        lines.append(f"{row['step']:<45} {row['calls']:>6} {row['total']:>9.2f} {row['mean']:>8.2f} "
+                     f"{row['max']:>8.2f}  {breakdown}")
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate step timings across recorded test runs")
+    parser.add_argument("path", nargs="?", default=STEP_TIMINGS_FILE)
+    parser.add_argument("--top", type=int, default=20, help="Number of steps to show")
+    parser.add_argument("--run-id", default=None, help="Only include one run")
+    args = parser.parse_args()
+
+    records = load_records(args.path, args.run_id)
+    if not records:
+        sys.exit(f"No step timings in {args.path}")
+    print(f"{len(records)} tests, {len({record.get('run_id') for record in records})} runs")
+    print("\n".join(format_hotspots(hotspots(records), args.top)))
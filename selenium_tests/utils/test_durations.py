@@ -0,0 +1,103 @@
+import os
+import re
+import json
+import argparse
+import statistics
+
+# Where smoothed per-test durations from previous runs are kept
+TEST_DURATIONS_FILE = os.environ.get("TEST_DURATIONS_FILE", os.path.join("logs", "test_durations.json"))
+DEFAULT_TEST_DURATION = 60.0  # seconds assumed for a test when no run has been recorded yet
+SMOOTHING = 0.5  # weight of the latest run in the stored duration
+
+SHARD_GROUP = "shard"  # xdist_group name prefix; loadgroup appends "@shard<N>" to node ids
+_GROUP_SUFFIX = re.compile(rf"@{SHARD_GROUP}\d+$")
+
+
+def base_nodeid(nodeid):
+    """Node id without the xdist_group suffix, so durations survive a change of shard."""
+    return _GROUP_SUFFIX.sub("", nodeid)
+
+
+def load_durations(path=TEST_DURATIONS_FILE):
+    """Returns {nodeid: seconds} recorded by previous runs."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def update_durations(observed, path=TEST_DURATIONS_FILE, smoothing=SMOOTHING):
+    """
+    Merges the durations of this run into the stored ones.
+
+    Each stored value is an exponential moving average, so one slow run shifts the
+    schedule without dominating it.
+
+    Args:
+        observed (dict): {nodeid: seconds} measured in this run.
+        path (str): Durations file.
+        smoothing (float): Weight of the new measurement.
+    """
+    if not observed:
+        return
+    durations = load_durations(path)
+    for nodeid, seconds in observed.items():
+        previous = durations.get(nodeid)
+        durations[nodeid] = round(seconds if previous is None else
+                                  smoothing * seconds + (1 - smoothing) * previous, 3)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(dict(sorted(durations.items())), file, indent=2)
+    os.replace(temp_path, path)
+
+
+def estimate(durations, nodeids):
+    """Expected seconds per test: the recorded value, else the median of known tests, else the default."""
+    default = statistics.median(durations.values()) if durations else DEFAULT_TEST_DURATION
+    return {nodeid: durations.get(nodeid, default) for nodeid in nodeids}
+
+
+def plan_shards(expected, shards):
+    """
+    Splits tests into shards with longest-processing-time-first scheduling.
+
+    Tests are taken longest first and each goes to the shard with the least work so far,
+    which keeps the slowest shard within 4/3 of the optimum and, whenever one test dominates,
+    equal to that test alone.
+
+    Args:
+        expected (dict): {nodeid: expected seconds}.
+        shards (int): Number of workers.
+
+    Returns:
+        list: One (nodeids, expected seconds) tuple per shard.
+    """
+    plan = [([], 0.0) for _ in range(max(shards, 1))]
+    for nodeid, seconds in sorted(expected.items(), key=lambda item: (-item[1], item[0])):
+        index = min(range(len(plan)), key=lambda i: (plan[i][1], i))
+        nodeids, load = plan[index]
+        nodeids.append(nodeid)
+        plan[index] = (nodeids, load + seconds)
+    return plan
+
+
+def format_plan(plan):
+    """Formats a shard plan with its expected wall time against a sequential run."""
+    total = sum(load for _, load in plan)
+    wall = max((load for _, load in plan), default=0.0)
+    lines = [f"{len(plan)} shards: expected wall time {wall:.1f}s (sequential {total:.1f}s)"]
+    for index, (nodeids, load) in enumerate(plan):
+        lines.append(f"{SHARD_GROUP}{index}  {load:8.1f}s  {', '.join(nodeids) or '-'}")
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show how recorded tests would be sharded across workers")
+    parser.add_argument("nodeids", nargs="*", help="Tests to plan (defaults to every recorded test)")
+    parser.add_argument("-n", "--workers", type=int, default=3, help="Number of xdist workers")
+    parser.add_argument("--path", default=TEST_DURATIONS_FILE)
+    args = parser.parse_args()
+
+    durations = load_durations(args.path)
+    print("\n".join(format_plan(plan_shards(estimate(durations, args.nodeids or durations), args.workers))))